@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from tribler.core.database.restapi.database_endpoint import DatabaseEndpoint
     from tribler.core.database.store import MetadataStore
     from tribler.core.libtorrent.restapi.downloads_endpoint import DownloadsEndpoint
+    from tribler.core.libtorrent.restapi.torrentinfo_endpoint import TorrentInfoEndpoint
     from tribler.core.restapi.rest_endpoint import RESTEndpoint
     from tribler.core.restapi.statistics_endpoint import StatisticsEndpoint
     from tribler.core.rss.restapi.endpoint import RSSEndpoint
@@ -170,17 +171,28 @@ class DatabaseComponent(ComponentLauncher):
             mds_path,
             cast("PrivateKey", session.ipv8.keys["anonymous id"].key),
             notifier=session.notifier,
-            disable_sync=False
+            disable_sync=False,
+            wal_mode=session.config.get("database/wal_mode"),
+            read_pool_size=session.config.get("database/read_pool_size"),
+            wal_checkpoint_interval=session.config.get("database/wal_checkpoint_interval"),
+            profile_queries=session.config.get("database/profile_queries"),
+            signature_workers=session.config.get("database/signature_workers")
         )
         session.notifier.add(Notification.torrent_metadata_added,
                              cast("Callable[[dict], None]", session.mds.TorrentMetadata.add_ffa_from_dict))
 
     def finalize(self, ipv8: IPv8, session: Session, community: Component) -> None:
         """
-        When we are done launching, register our REST API.
+        When we are done launching, register our REST API and merge the FTS index in the background.
         """
+        from tribler.core.database.store import FTS_MERGE_INTERVAL
+
         cast("StatisticsEndpoint", session.rest_manager.get_endpoint("/api/statistics")).session = session
 
+        mds = cast("MetadataStore", session.mds)
+        community.register_task("Merge FTS index segments", mds.run_threaded, mds.merge_fts_segments,
+                                interval=FTS_MERGE_INTERVAL, delay=FTS_MERGE_INTERVAL)
+
         db_endpoint = cast("DatabaseEndpoint", session.rest_manager.get_endpoint("/api/metadata"))
         db_endpoint.download_manager = session.download_manager
         db_endpoint.mds = session.mds
@@ -228,6 +240,8 @@ class TorrentCheckerComponent(ComponentLauncher):
 
         community.register_task("Start torrent checker", torrent_checker.initialize)
         cast("DatabaseEndpoint", session.rest_manager.get_endpoint("/api/metadata")).torrent_checker = torrent_checker
+        torrent_info_endpoint = cast("TorrentInfoEndpoint", session.rest_manager.get_endpoint("/api/torrentinfo"))
+        torrent_info_endpoint.http_clients = torrent_checker.http_clients
 
 
 @set_in_session("dht_discovery_community")
@@ -246,6 +260,7 @@ class DHTDiscoveryComponent(BaseLauncher["DHTDiscoveryCommunity"]):
         cast("DHTEndpoint", ipv8_root_ep.endpoints["/dht"]).dht = community
 
 
+@after("TorrentCheckerComponent")
 @precondition('session.config.get("rss/enabled")')
 class RSSComponent(ComponentLauncher):
     """
@@ -258,7 +273,8 @@ class RSSComponent(ComponentLauncher):
         """
         from tribler.core.rss.rss import RSSWatcherManager
 
-        manager = RSSWatcherManager(community, session.notifier, session.config.get("rss/urls"))
+        http_clients = session.torrent_checker.http_clients if session.torrent_checker else None
+        manager = RSSWatcherManager(community, session.notifier, session.config.get("rss/urls"), http_clients)
         manager.start()
 
         endpoint = cast("RSSEndpoint", session.rest_manager.get_endpoint("/api/rss"))
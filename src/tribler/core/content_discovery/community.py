@@ -26,6 +26,7 @@ from tribler.core.content_discovery.payload import (
     VersionRequest,
     VersionResponse,
 )
+from tribler.core.content_discovery.search import SearchSession
 from tribler.core.database.orm_bindings.torrent_metadata import LZ4_EMPTY_ARCHIVE, entries_to_chunk
 from tribler.core.database.store import MetadataStore, ObjState, ProcessingResult
 from tribler.core.notifier import Notification, Notifier
@@ -52,6 +53,7 @@ class ContentDiscoverySettings(CommunitySettings):
     random_torrent_interval: float = 5  # seconds
     random_torrent_count: int = 10
     max_query_peers: int = 20
+    search_notify_interval: float = 0.5  # Minimum number of seconds between result notifications of a search
     maximum_payload_size: int = 1300
     max_response_size: int = 100  # Max number of entries returned by SQL query
 
@@ -188,6 +190,8 @@ class ContentDiscoveryCommunity(Community):
             added = self.composition.metadata_store.process_torrent_health(health)
             if added:
                 infohashes_to_resolve.add(health.infohash)
+            if self.composition.torrent_checker:
+                self.composition.torrent_checker.plan_torrent_health(health)
         return infohashes_to_resolve
 
     @lazy_wrapper(HealthRequestPayload)
@@ -254,24 +258,45 @@ class ContentDiscoveryCommunity(Community):
         Send a remote query request to multiple random peers to search for some terms.
         """
         request_uuid = uuid.uuid4()
+        search = SearchSession(kwargs.get("txt_filter"), request_uuid, self.composition.search_notify_interval)
 
-        def notify_gui(request: SelectRequest, processing_results: list[ProcessingResult]) -> None:
+        def aggregate_results(request: SelectRequest, processing_results: list[ProcessingResult]) -> None:
             results = [r.data for r in processing_results if r.obj_state == ObjState.NEW_OBJECT]
-
-            if self.composition.notifier:
-                self.composition.notifier.notify(Notification.remote_query_results,
-                                                 query=kwargs.get("txt_filter"),
-                                                 results=results,
-                                                 uuid=str(request_uuid),
-                                                 peer=hexlify(request.peer.mid).decode())
+            if search.add(hexlify(request.peer.mid).decode(), results):
+                self.schedule_search_notification(search)
 
         peers_to_query = self.get_random_peers(self.composition.max_query_peers)
 
         for p in peers_to_query:
-            self.send_remote_select(p, **kwargs, processing_callback=notify_gui)
+            self.send_remote_select(p, **kwargs, processing_callback=aggregate_results)
 
         return request_uuid, peers_to_query
 
+    def schedule_search_notification(self, search: SearchSession) -> None:
+        """
+        Notify the pending results of the given search now, or as soon as the notification interval allows it.
+        """
+        task_name = f"Notify results of search {search.uuid}"
+        if self.is_pending_task_active(task_name):
+            return
+        delay = search.get_notification_delay()
+        if delay > 0:
+            self.register_task(task_name, self.notify_search_results, search, delay=delay)
+        else:
+            self.notify_search_results(search)
+
+    def notify_search_results(self, search: SearchSession) -> None:
+        """
+        Notify the pending results of the given search in a single update.
+        """
+        results, peers = search.pop_pending()
+        if results and self.composition.notifier:
+            self.composition.notifier.notify(Notification.remote_query_results,
+                                             query=search.query,
+                                             results=results,
+                                             uuid=str(search.uuid),
+                                             peer=",".join(peers))
+
     @lazy_wrapper(VersionRequest)
     async def on_version_request(self, peer: Peer, _: VersionRequest) -> None:
         """
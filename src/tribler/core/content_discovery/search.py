@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from tribler.core.database.ranks import item_rank
+
+if TYPE_CHECKING:
+    import uuid
+
+
+class SearchSession:
+    """
+    Aggregate the results of a single remote search over all queried peers.
+
+    Results are deduplicated by infohash and ranked when they come in. New results are collected until they are
+    notified in a single update, which should happen at most once per notification interval.
+    """
+
+    def __init__(self, query: str | None, request_uuid: uuid.UUID, notify_interval: float) -> None:
+        """
+        Create a new (empty) search session.
+        """
+        self.query = query
+        self.uuid = request_uuid
+        self.notify_interval = notify_interval
+
+        self.ranks: dict[str, float] = {}  # The rank of every result we received, by infohash
+        self.pending: dict[str, dict[str, Any]] = {}  # The results that were not notified yet, by infohash
+        self.pending_peers: dict[str, None] = {}  # The (ordered) peers that sent the pending results
+        self.last_notification = 0.0
+
+    def add(self, peer: str, results: list[dict[str, Any]]) -> bool:
+        """
+        Add the results that were received from the given peer.
+
+        :returns: whether any of the results were not received before.
+        """
+        added = False
+        for result in results:
+            infohash = result["infohash"]
+            if infohash in self.ranks:
+                continue
+            self.ranks[infohash] = item_rank(self.query, result) if self.query else 0.0
+            self.pending[infohash] = result
+            added = True
+        if added:
+            self.pending_peers[peer] = None
+        return added
+
+    def get_notification_delay(self) -> float:
+        """
+        Get the number of seconds until the pending results may be notified.
+        """
+        return max(0.0, self.last_notification + self.notify_interval - time.monotonic())
+
+    def pop_pending(self) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Get the pending results, best ranked first, and the peers that sent them. These are no longer pending after.
+        """
+        results = sorted(self.pending.values(), key=lambda result: self.ranks[result["infohash"]], reverse=True)
+        peers = list(self.pending_peers)
+        self.pending.clear()
+        self.pending_peers.clear()
+        self.last_notification = time.monotonic()
+        return results, peers
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from time import time
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+SEARCH_CACHE_SIZE = 256  # The maximum number of cached queries
+SEARCH_CACHE_TTL = 30  # seconds before a cached result is considered outdated
+
+
+class SearchCacheStatsDict(TypedDict):
+    """
+    Statistics of a search result cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
+class SearchResultCache:
+    """
+    A thread-safe LRU cache of search results, with a time-to-live for every entry.
+
+    Only the row ids of the results are stored: the rows themselves are fetched again by the caller, so that cached
+    results never leak ORM objects between database sessions.
+    """
+
+    def __init__(self, max_size: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL) -> None:
+        """
+        Create a new (empty) cache.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[Hashable, tuple[float, list[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented on every invalidation. Results computed before an invalidation are not stored.
+        self.generation = 0
+
+    @staticmethod
+    def make_key(**kwargs) -> Hashable | None:
+        """
+        Create a key from the given query parameters, independent of their order and (unset) default values.
+
+        :returns: the key or None if the parameters cannot be used as a key.
+        """
+        normalized = []
+        for name, value in sorted(kwargs.items()):
+            if value is None:
+                continue
+            if isinstance(value, set | frozenset):
+                value = ("set", *sorted(value))  # noqa: PLW2901
+            elif isinstance(value, list | tuple):
+                value = ("list", *value)  # noqa: PLW2901
+            try:
+                hash(value)
+            except TypeError:
+                return None
+            normalized.append((name, value))
+        return tuple(normalized)
+
+    def get(self, key: Hashable) -> list[int] | None:
+        """
+        Get the cached row ids for the given key, if they exist and are not outdated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self.ttl < time():
+                if entry is not None:
+                    self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, rowids: list[int], generation: int) -> None:
+        """
+        Store the row ids for the given key, if no invalidation happened since the given generation.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time(), rowids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """
+        Remove all cached results.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def get_statistics(self) -> SearchCacheStatsDict:
+        """
+        Get the hit and miss counters and the current number of cached queries.
+        """
+        with self._lock:
+            return SearchCacheStatsDict(hits=self.hits, misses=self.misses, size=len(self._entries))
+
+    def __len__(self) -> int:
+        """
+        The number of cached queries.
+        """
+        return len(self._entries)
+
+
+def is_cacheable_query(query_kwargs: dict[str, Any]) -> bool:
+    """
+    Only text searches and popular torrent queries are expensive enough to be cached.
+    """
+    return bool(query_kwargs.get("txt_filter") or query_kwargs.get("popular"))
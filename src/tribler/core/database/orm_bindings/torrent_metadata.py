@@ -54,7 +54,7 @@ if TYPE_CHECKING:
         Database type for torrent metadata.
         """
 
-        rowid: list[int]
+        rowid: int
         infohash: bytes
         size: int | None
         torrent_date: datetime | None
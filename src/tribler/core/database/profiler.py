@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sized
+    from sqlite3 import Connection
+    from typing import TypeVar
+
+    ResultType = TypeVar("ResultType", bound=Sized)
+
+# The values of these parameters select different queries, the values of all other parameters are left out of the shape
+SHAPE_PARAMETERS = frozenset(("metadata_type", "hide_xxx", "sort_by", "sort_desc", "popular", "self_checked_torrent"))
+
+
+class QueryStatsDict(TypedDict):
+    """
+    Statistics of the queries of a single parameter shape.
+    """
+
+    shape: str
+    calls: int
+    total_time: float
+    mean_time: float
+    max_time: float
+    mean_rows: float
+    sql: str
+    plan: list[str]
+
+
+class QueryShapeStats:
+    """
+    The aggregated statistics of the queries of a single parameter shape.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create new (empty) statistics.
+        """
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.total_rows = 0
+
+        # The SQL and query plan of the slowest call.
+        self.sql = ""
+        self.plan: list[str] = []
+
+
+class QueryProfiler:
+    """
+    Record the wall time, row count, SQL and query plan of database queries, aggregated by their parameter shape.
+
+    The profiler is disabled by default: the SQL of every query has to be traced and the query plan of the slowest query
+    of every shape is retrieved from SQLite, which is too much overhead to do all the time.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Create a new profiler.
+        """
+        self.enabled = enabled
+        self.shapes: dict[str, QueryShapeStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_shape(parameters: dict[str, Any]) -> str:
+        """
+        Describe the given query parameters, without the values that do not change the query itself.
+        """
+        return " ".join(f"{name}={value}" if name in SHAPE_PARAMETERS else name
+                        for name, value in sorted(parameters.items())
+                        if value is not None and value not in ("", [], set()))
+
+    def profile(self, connection: Connection, parameters: dict[str, Any],
+                query: Callable[[], ResultType]) -> ResultType:
+        """
+        Run the given query on the given connection and record its statistics under the shape of the given parameters.
+
+        :returns: the result of the query.
+        """
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+        start = perf_counter()
+        try:
+            result = query()
+        finally:
+            duration = perf_counter() - start
+            connection.set_trace_callback(None)
+
+        shape = self.make_shape(parameters)
+        # The FTS index also runs its own (short) statements: the query itself is the longest statement.
+        sql = max((statement for statement in statements if statement.lstrip().upper().startswith("SELECT")),
+                  key=len, default="")
+        with self._lock:
+            stats = self.shapes.setdefault(shape, QueryShapeStats())
+            stats.calls += 1
+            stats.total_time += duration
+            stats.total_rows += len(result)
+            slowest = duration >= stats.max_time
+            if slowest:
+                stats.max_time = duration
+        if slowest and sql:
+            plan = [detail for _, _, _, detail in connection.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            with self._lock:
+                stats.sql = sql
+                stats.plan = plan
+        return result
+
+    def get_statistics(self, limit: int | None = None) -> list[QueryStatsDict]:
+        """
+        Get the statistics of the shapes with the highest mean wall time first.
+        """
+        with self._lock:
+            statistics = [QueryStatsDict(shape=shape, calls=stats.calls, total_time=stats.total_time,
+                                         mean_time=stats.total_time / stats.calls, max_time=stats.max_time,
+                                         mean_rows=stats.total_rows / stats.calls, sql=stats.sql, plan=stats.plan)
+                          for shape, stats in self.shapes.items()]
+        statistics.sort(key=lambda s: s["mean_time"], reverse=True)
+        return statistics[:limit]
+
+    def reset(self) -> None:
+        """
+        Forget all recorded statistics.
+        """
+        with self._lock:
+            self.shapes.clear()
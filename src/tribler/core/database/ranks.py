@@ -8,6 +8,11 @@ from __future__ import annotations
 import re
 import time
 from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 SECONDS_IN_DAY = 60 * 60 * 24
 
@@ -42,13 +47,25 @@ def torrent_rank(query: str, title: str, seeders: int = 0, leechers: int = 0, fr
                       using the `time()` function call and simplifies testing.
     :return: the torrent rank value in range [0, 1]
     """
+    return health_torrent_rank(query, title, seeders_rank(seeders or 0, leechers or 0), freshness)
+
+
+def health_torrent_rank(query: str, title: str, health_rank: float = 0, freshness: float | None = None) -> float:
+    """
+    Calculates search rank for a torrent, of which the seeders_rank is already known.
+
+    :param query: a user-defined query string
+    :param title: a torrent name
+    :param health_rank: the seeders_rank of the torrent, in the range [0, 1]
+    :param freshness: the number of seconds since the torrent creation, see ``torrent_rank``.
+    :return: the torrent rank value in range [0, 1]
+    """
     tr = title_rank(query or "", title or "")
-    sr = (seeders_rank(seeders or 0, leechers or 0) + 9) / 10  # range [0.9, 1]
+    sr = ((health_rank or 0) + 9) / 10  # range [0.9, 1]
     fr = (freshness_rank(freshness) + 9) / 10  # range [0.9, 1]
     return tr * sr * fr
 
 
-
 def seeders_rank(seeders: int, leechers: int = 0) -> float:
     """
     Calculates rank based on the number of torrent's seeders and leechers.
@@ -88,9 +105,12 @@ def title_rank(query: str, title: str) -> float:
     :param title: a torrent name
     :return: the similarity of the title string to a query string as a float value in range [0, 1]
     """
-    pat_query = word_re.findall(query.lower())
+    pat_query, word_weights, remainder_weight = query_terms(query)
+    if not pat_query:
+        return 1.0
+
     pat_title = word_re.findall(title.lower())
-    return calculate_rank(pat_query, pat_title)
+    return _calculate_rank(pat_query, word_weights, remainder_weight, pat_title)
 
 
 # These coefficients are found empirically. Their exact values are not very important for a relative ranking of results
@@ -110,8 +130,34 @@ REMAINDER_COEFF = 10
 # The total_error value is some positive number. We want to have the resulted rank in range [0, 1].
 RANK_NORMALIZATION_COEFF = 10
 
+# The number of distinct query strings for which the parsed words and weights are kept. The SQLite ``search_rank``
+# function is called once per candidate row with the same query string, so even a small cache avoids re-parsing.
+QUERY_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def query_terms(query: str) -> tuple[tuple[str, ...], tuple[float, ...], float]:
+    """
+    Parse a query string into the words and weights that are needed to rank titles against it.
+
+    :param query: a user-defined query string
+    :return: a three-element tuple of the lowercase query words, the weight of each word and the weight of each
+             excess title word
+    """
+    words = tuple(word_re.findall(query.lower()))
+    return words, _word_weights(len(words)), 1 / (REMAINDER_COEFF + len(words))
+
 
-def calculate_rank(query: list[str], title: list[str]) -> float:
+def _word_weights(count: int) -> tuple[float, ...]:
+    """
+    Get the weights of the first ``count`` query words.
+
+    The first word is more important than the second word, and so on.
+    """
+    return tuple(POSITION_COEFF / (POSITION_COEFF + i) for i in range(count))
+
+
+def calculate_rank(query: Sequence[str], title: list[str]) -> float:
     """
     Calculates the similarity of the title to the query as a float value in range [0, 1].
 
@@ -122,25 +168,36 @@ def calculate_rank(query: list[str], title: list[str]) -> float:
     if not query:
         return 1.0
 
+    return _calculate_rank(query, _word_weights(len(query)), 1 / (REMAINDER_COEFF + len(query)), title)
+
+
+def _calculate_rank(query: Sequence[str], word_weights: Sequence[float], remainder_weight: float,
+                    title: list[str]) -> float:
+    """
+    Calculates the similarity of the title to a non-empty query, using precomputed query word weights.
+
+    This is the inner loop of ``calculate_rank``, which is executed for every candidate row of a search query.
+    """
     if not title:
         return 0.0
 
     q_title = deque(title)
     total_error = 0.0
-    for i, word in enumerate(query):
-        # The first word is more important than the second word, and so on
-        word_weight = POSITION_COEFF / (POSITION_COEFF + i)
-
-        found, skipped = find_word_and_rotate_title(word, q_title)
-        if found:
-            # if the query word is found in the title, add penalty for skipped words in title before it
-            total_error += skipped * word_weight
-        else:
+    for word, word_weight in zip(query, word_weights, strict=True):
+        # Inlined version of find_word_and_rotate_title() to avoid a function call per query word
+        try:
+            skipped = q_title.index(word)
+        except ValueError:
             # if the query word is not found in the title, add a big penalty for it
             total_error += MISSED_WORD_PENALTY * word_weight
+            continue
+
+        q_title.rotate(-skipped)
+        q_title.popleft()
+        # if the query word is found in the title, add penalty for skipped words in title before it
+        total_error += skipped * word_weight
 
     # a small penalty for excess words in the title that was not mentioned in the search phrase
-    remainder_weight = 1 / (REMAINDER_COEFF + len(query))
     remained_words_error = len(q_title) * remainder_weight
     total_error += remained_words_error
 
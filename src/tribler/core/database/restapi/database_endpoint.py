@@ -322,7 +322,7 @@ class DatabaseEndpoint(RESTEndpoint):
             return search_results, total, max_rowid
 
         try:
-            search_results, total, max_rowid = await mds.run_threaded(search_db)
+            search_results, total, max_rowid = await mds.run_threaded_read(search_db)
         except Exception as e:
             self._logger.exception("Error while performing DB search: %s: %s", type(e).__name__, e)
             return RESTResponse(status=HTTP_BAD_REQUEST)
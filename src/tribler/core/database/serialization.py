@@ -3,14 +3,18 @@ from __future__ import annotations
 import struct
 from binascii import hexlify
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Self
+from functools import lru_cache
+from typing import TYPE_CHECKING, Self, cast
 
 from ipv8.keyvault.crypto import default_eccrypto
 from ipv8.messaging.lazy_payload import VariablePayload, vp_compile
 from ipv8.messaging.serialization import VarLenUtf8, default_serializer
 
 if TYPE_CHECKING:
-    from ipv8.keyvault.keys import PrivateKey
+    from collections.abc import Iterator, Sequence
+    from concurrent.futures import Executor
+
+    from ipv8.keyvault.keys import PrivateKey, PublicKey
 
 default_serializer.add_packer("varlenIutf8", VarLenUtf8(">I"))
 EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
@@ -19,6 +23,9 @@ SIGNATURE_SIZE = 64
 NULL_SIG = b"\x00" * 64
 NULL_KEY = b"\x00" * 64
 
+PUBLIC_KEY_CACHE_SIZE = 1024  # The number of decoded public keys to keep, most payloads come from a few keys
+SIGNATURE_CHECK_CHUNK_SIZE = 250  # The number of signatures to verify per worker task
+
 # Metadata types. Should have been an enum, but in Python its unwieldy.
 TYPELESS = 100
 CHANNEL_NODE = 200
@@ -76,7 +83,9 @@ def read_payload_with_offset(data: bytes, offset: int = 0) -> tuple[SignedPayloa
     metadata_type = struct.unpack_from(">H", data, offset=offset)[0]
     payload_class = METADATA_TYPE_TO_PAYLOAD_CLASS.get(metadata_type)
     if payload_class is not None:
+        start = offset
         payload, offset = default_serializer.unpack_serializable(payload_class, data, offset=offset)
+        payload.signed_data = data[start: offset]
         payload.signature = data[offset: offset + 64]
         return payload, offset + 64
 
@@ -96,6 +105,8 @@ class SignedPayload(VariablePayload):
     format_list = ["H", "H", "64s"]
 
     signature: bytes = NULL_SIG
+    # The serialized form that this payload was read from, the signature is checked over these bytes.
+    signed_data: bytes | None = None
     metadata_type: int
     reserved_flags: int
     public_key: bytes
@@ -150,12 +161,61 @@ class SignedPayload(VariablePayload):
         Check if the signature attached to this payload is valid for this payload.
         """
         return default_eccrypto.is_valid_signature(
-                default_eccrypto.key_from_public_bin(b"LibNaCLPK:" + self.public_key),
+                get_public_key(self.public_key),
                 self.serialized(),
                 self.signature
         )
 
 
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def get_public_key(public_key: bytes) -> PublicKey:
+    """
+    Get the key object for the raw public key bytes of a payload.
+    """
+    return default_eccrypto.key_from_public_bin(b"LibNaCLPK:" + public_key)
+
+
+def _check_signatures(payloads: Sequence[SignedPayload | TorrentMetadataView]) -> list[bool]:
+    """
+    Check, in order, whether the payloads are unsigned or have a valid signature.
+    """
+    results = []
+    for payload in payloads:
+        if not payload.has_signature():
+            results.append(True)
+            continue
+        try:
+            public_key = get_public_key(payload.public_key)
+        except Exception:
+            results.append(False)
+            continue
+        signed_data = payload.signed_data
+        if signed_data is None:
+            signed_data = cast("SignedPayload", payload).serialized()
+        results.append(default_eccrypto.is_valid_signature(public_key, signed_data, payload.signature))
+    return results
+
+
+def check_signatures(payloads: Sequence[SignedPayload | TorrentMetadataView],
+                     executor: Executor | None = None) -> list[bool]:
+    """
+    Check, for every payload, whether it is unsigned or has a valid signature.
+
+    Payloads that were read with ``read_payload_with_offset`` (and views) are checked against the bytes they were
+    read from, instead of being serialized again. Therefore, these payloads should not be modified before checking them.
+    If an executor is given, the payloads are checked in chunks by its workers.
+
+    :param payloads: the payloads to check.
+    :param executor: the (optional) executor to offload the checks to.
+    :return: for each payload, whether it may be processed.
+    """
+    if executor is None or len(payloads) <= SIGNATURE_CHECK_CHUNK_SIZE:
+        return _check_signatures(payloads)
+
+    chunks = [payloads[i: i + SIGNATURE_CHECK_CHUNK_SIZE] for i in range(0, len(payloads), SIGNATURE_CHECK_CHUNK_SIZE)]
+    return [valid for results in executor.map(_check_signatures, chunks) for valid in results]
+
+
 @vp_compile
 class ChannelNodePayload(SignedPayload):
     """
@@ -221,7 +281,7 @@ class TorrentMetadataPayload(ChannelNodePayload):
 
     infohash: bytes
     size: int
-    torrent_date: int
+    torrent_date: datetime  # Unpacked from the integer wire format, see ``fix_unpack_torrent_date``
     title: str
     tags: str
     tracker_info: str
@@ -278,6 +338,132 @@ METADATA_TYPE_TO_PAYLOAD_CLASS = {
     DELETED: DeletedMetadataPayload,
 }
 
+# The fixed-size fields at the start of every serialized TorrentMetadataPayload (and its subclasses)
+TORRENT_METADATA_HEADER = struct.Struct(">HH64sQQQ20sQI")
+
+
+_payload_layouts: dict[type[SignedPayload], tuple[int, ...]] = {}
+
+
+def _payload_layout(payload_class: type[SignedPayload]) -> tuple[int, ...]:
+    """
+    Get the sizes of the consecutive fixed-size parts of the given payload class, for every variable length field
+    (which has a four byte length prefix) the layout contains a -1, or a -2 if the field is a UTF-8 string.
+    """
+    layout = _payload_layouts.get(payload_class)
+    if layout is None:
+        parts = [0]
+        for fmt in payload_class.format_list:
+            if fmt.startswith("varlenI"):
+                parts.extend((-2 if fmt == "varlenIutf8" else -1, 0))
+            else:
+                parts[-1] += struct.calcsize(">" + fmt)
+        layout = _payload_layouts[payload_class] = tuple(parts)
+    return layout
+
+
+def _payload_end(payload_class: type[SignedPayload], data: bytes, offset: int) -> int:
+    """
+    Get the offset at which the payload of the given class, starting at the given offset, ends.
+
+    Only the length prefixes of the variable length fields are read. The UTF-8 strings are checked, but not kept: a
+    blob with an invalid string is rejected as a whole, before any of its payloads is processed.
+
+    :raises ValueError: if the payload is truncated or contains an invalid UTF-8 string.
+    """
+    for size in _payload_layout(payload_class):
+        if size < 0:
+            length = struct.unpack_from(">I", data, offset)[0]
+            if size == -2:
+                data[offset + 4: offset + 4 + length].decode()
+            offset += 4 + length
+        else:
+            offset += size
+    if offset + SIGNATURE_SIZE > len(data):
+        msg = f"Truncated {payload_class.__name__}"
+        raise ValueError(msg)
+    return offset
+
+
+class TorrentMetadataView:
+    """
+    A lightweight view of a serialized TorrentMetadataPayload, which references the buffer it was read from.
+
+    Only the fixed-size fields are unpacked: these suffice to check the signature and to find duplicates. The (utf8)
+    strings are only validated by ``iter_torrent_metadata`` and decoded when the full payload is created with
+    ``to_payload``.
+    """
+
+    __slots__ = ("data", "end", "id_", "infohash", "metadata_type", "payload_class", "public_key", "start",
+                 "timestamp")
+
+    def __init__(self, payload_class: type[TorrentMetadataPayload], data: bytes, start: int, end: int) -> None:
+        """
+        Create a view of the payload in the given data, from the start offset until (excluding) the end offset.
+        """
+        self.payload_class = payload_class
+        self.data = data
+        self.start = start
+        self.end = end
+        (self.metadata_type, _, self.public_key, self.id_, _, self.timestamp, self.infohash, _,
+         _) = TORRENT_METADATA_HEADER.unpack_from(data, start)
+
+    @property
+    def signed_data(self) -> bytes:
+        """
+        The serialized payload, without its signature.
+        """
+        return self.data[self.start: self.end]
+
+    @property
+    def signature(self) -> bytes:
+        """
+        The signature that follows the serialized payload.
+        """
+        return self.data[self.end: self.end + SIGNATURE_SIZE]
+
+    def has_signature(self) -> bool:
+        """
+        Check if this payload has an attached signature.
+        """
+        return self.public_key != NULL_KEY or self.data[self.end: self.end + SIGNATURE_SIZE] != NULL_SIG
+
+    def to_payload(self) -> TorrentMetadataPayload:
+        """
+        Unpack the full payload.
+        """
+        payload, _ = default_serializer.unpack_serializable(self.payload_class, self.data, offset=self.start)
+        payload.signed_data = self.signed_data
+        payload.signature = self.signature
+        return payload
+
+
+def unpack_view(payload: TorrentMetadataPayload | TorrentMetadataView) -> TorrentMetadataPayload:
+    """
+    Get the full payload, for either a payload or a view of one.
+    """
+    return payload.to_payload() if isinstance(payload, TorrentMetadataView) else payload
+
+
+def iter_torrent_metadata(data: bytes, offset: int = 0) -> Iterator[TorrentMetadataView]:
+    """
+    Walk the concatenated payloads in the data buffer and yield a view for every torrent payload.
+
+    Deprecated payloads are skipped without unpacking them.
+
+    :raises UnknownBlobTypeException: if the data contains a payload of an unknown type.
+    :raises ValueError: if the data ends with an incomplete payload, or contains an invalid UTF-8 string.
+    """
+    while offset < len(data):
+        metadata_type = struct.unpack_from(">H", data, offset=offset)[0]
+        payload_class = METADATA_TYPE_TO_PAYLOAD_CLASS.get(metadata_type)
+        if payload_class is None:
+            raise UnknownBlobTypeException
+        end = _payload_end(payload_class, data, offset)
+        if issubclass(payload_class, TorrentMetadataPayload):
+            yield TorrentMetadataView(payload_class, data, offset, end)
+        offset = end + SIGNATURE_SIZE
+
 
 @vp_compile
 class HealthItemsPayload(VariablePayload):
@@ -7,6 +7,9 @@ import re
 import sqlite3
 import threading
 from asyncio import get_running_loop
+from binascii import hexlify
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from os.path import getsize
@@ -19,10 +22,12 @@ from pony import orm
 from pony.orm import Database, db_session, desc, left_join, raw_sql, select  # noqa: F401 (desc is used by pony!)
 from pony.orm.dbproviders.sqlite import keep_exception
 
+from tribler.core.database.cache import SearchResultCache, is_cacheable_query
 from tribler.core.database.orm_bindings import misc, torrent_metadata, tracker_state
 from tribler.core.database.orm_bindings import torrent_state as torrent_state_
-from tribler.core.database.orm_bindings.torrent_metadata import NULL_KEY_SUBST
-from tribler.core.database.ranks import torrent_rank
+from tribler.core.database.orm_bindings.torrent_metadata import COMMITTED, NULL_KEY_SUBST
+from tribler.core.database.profiler import QueryProfiler
+from tribler.core.database.ranks import health_torrent_rank, torrent_rank
 from tribler.core.database.serialization import (
     CHANNEL_TORRENT,
     COLLECTION_NODE,
@@ -30,12 +35,20 @@ from tribler.core.database.serialization import (
     REGULAR_TORRENT,
     HealthItemsPayload,
     TorrentMetadataPayload,
-    read_payload_with_offset,
+    TorrentMetadataView,
+    check_signatures,
+    iter_torrent_metadata,
+    time2int,
+    unpack_view,
 )
+from tribler.core.libtorrent.trackers import get_uniformed_tracker_url
+from tribler.core.notifier import Notification
 from tribler.core.torrent_checker.healthdataclasses import HealthInfo
+from tribler.upgrade_script import upgrade_metadata_db
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
+    from concurrent.futures import Executor
     from sqlite3 import Connection
 
     from ipv8.keyvault.keys import PrivateKey
@@ -67,11 +80,17 @@ class ProcessingResult:
 
     data: dict[str, Any]
     obj_state: ObjState
-    rowid: list[int]
+    rowid: int
 
 
 BETA_DB_VERSIONS = [0, 1, 2, 3, 4, 5]
-CURRENT_DB_VERSION = 15
+CURRENT_DB_VERSION = 16
+
+DEFAULT_READ_POOL_SIZE = 4  # The number of read-only connections in WAL mode
+DEFAULT_WAL_CHECKPOINT_INTERVAL = 60.0  # seconds between checkpoints of the write-ahead log
+
+FTS_MERGE_INTERVAL = 300  # seconds between merges of the FTS index segments
+FTS_MERGE_PAGES = 500  # the (approximate) maximum number of pages written per merge
 
 MIN_BATCH_SIZE = 10
 MAX_BATCH_SIZE = 1000
@@ -79,6 +98,9 @@ MAX_BATCH_SIZE = 1000
 POPULAR_TORRENTS_FRESHNESS_PERIOD = 60 * 60 * 24  # Last day
 POPULAR_TORRENTS_COUNT = 100
 
+# The format in which Pony stores datetime values in SQLite
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
 # This table should never be used from ORM directly.
 # It is created as a VIRTUAL table by raw SQL and
 # maintained by SQL triggers.
@@ -93,15 +115,17 @@ sql_add_fts_trigger_insert = """
         INSERT INTO FtsIndex(rowid, title) VALUES (new.rowid, new.title);
     END;"""
 
+# FtsIndex is an external content table: removing a row from it requires the old title, to find the indexed terms.
 sql_add_fts_trigger_delete = """
     CREATE TRIGGER IF NOT EXISTS fts_ad AFTER DELETE ON ChannelNode
     BEGIN
-        DELETE FROM FtsIndex WHERE rowid = old.rowid;
+        INSERT INTO FtsIndex(FtsIndex, rowid, title) VALUES ('delete', old.rowid, old.title);
     END;"""
 
+# Only title changes have to be indexed again. Notably, this trigger should not fire for the health columns.
 sql_add_fts_trigger_update = """
-    CREATE TRIGGER IF NOT EXISTS fts_au AFTER UPDATE ON ChannelNode BEGIN
-        DELETE FROM FtsIndex WHERE rowid = old.rowid;
+    CREATE TRIGGER IF NOT EXISTS fts_au AFTER UPDATE OF title ON ChannelNode BEGIN
+        INSERT INTO FtsIndex(FtsIndex, rowid, title) VALUES ('delete', old.rowid, old.title);
         INSERT INTO FtsIndex(rowid, title) VALUES (new.rowid, new.title);
     END;"""
 
@@ -119,6 +143,82 @@ sql_add_torrentstate_trigger_after_update = """
     END;
 """
 
+# The health of a torrent is copied to the ChannelNode rows that refer to it, so that sorting on health does not need
+# to join the TorrentState table. These columns are not part of the ORM entities and are maintained by the triggers
+# below. The health_rank column is the seeders_rank (see ranks.py) of the health: (s + l * 0.1) / (100 + s + l * 0.1).
+sql_add_channelnode_health_columns = [
+    "ALTER TABLE ChannelNode ADD COLUMN health_seeders INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE ChannelNode ADD COLUMN health_leechers INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE ChannelNode ADD COLUMN health_last_check INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE ChannelNode ADD COLUMN health_rank REAL NOT NULL DEFAULT 0",
+]
+
+# A single row is selected from this view with max(), which gives zeros (instead of no row) for a missing state.
+sql_create_health_view = """
+    CREATE VIEW IF NOT EXISTS TorrentStateHealth AS
+    SELECT rowid,
+           coalesce(seeders, 0) AS seeders,
+           coalesce(leechers, 0) AS leechers,
+           coalesce(last_check, 0) AS last_check,
+           (coalesce(seeders, 0) + coalesce(leechers, 0) * 0.1)
+           / (100 + coalesce(seeders, 0) + coalesce(leechers, 0) * 0.1) AS rank
+    FROM TorrentState;
+"""
+
+sql_add_torrentstate_trigger_health_update = """
+    CREATE TRIGGER IF NOT EXISTS torrentstate_health_au AFTER UPDATE OF seeders, leechers, last_check ON TorrentState
+    BEGIN
+        UPDATE ChannelNode SET (health_seeders, health_leechers, health_last_check, health_rank) =
+            (SELECT coalesce(max(seeders), 0), coalesce(max(leechers), 0), coalesce(max(last_check), 0),
+                    coalesce(max(rank), 0)
+             FROM TorrentStateHealth WHERE rowid = new.rowid)
+        WHERE health = new.rowid;
+    END;
+"""
+
+sql_add_channelnode_trigger_health_insert = """
+    CREATE TRIGGER IF NOT EXISTS channelnode_health_ai AFTER INSERT ON ChannelNode WHEN new.health IS NOT NULL
+    BEGIN
+        UPDATE ChannelNode SET (health_seeders, health_leechers, health_last_check, health_rank) =
+            (SELECT coalesce(max(seeders), 0), coalesce(max(leechers), 0), coalesce(max(last_check), 0),
+                    coalesce(max(rank), 0)
+             FROM TorrentStateHealth WHERE rowid = new.health)
+        WHERE rowid = new.rowid;
+    END;
+"""
+
+sql_add_channelnode_trigger_health_update = """
+    CREATE TRIGGER IF NOT EXISTS channelnode_health_au AFTER UPDATE OF health ON ChannelNode
+    BEGIN
+        UPDATE ChannelNode SET (health_seeders, health_leechers, health_last_check, health_rank) =
+            (SELECT coalesce(max(seeders), 0), coalesce(max(leechers), 0), coalesce(max(last_check), 0),
+                    coalesce(max(rank), 0)
+             FROM TorrentStateHealth WHERE rowid = new.health)
+        WHERE rowid = new.rowid;
+    END;
+"""
+
+# Sorting on health walks this index, instead of sorting all (joined) rows.
+sql_create_index_channelnode_health = """
+    CREATE INDEX IF NOT EXISTS idx_channelnode__health_seeders_leechers
+    ON ChannelNode (health_seeders, health_leechers);
+"""
+
+# The popular torrents are the first rows of this index. It contains all columns of the query, so the table itself
+# does not have to be read.
+sql_create_index_torrentstate_popular = """
+    CREATE INDEX IF NOT EXISTS idx_torrentstate__popular
+    ON TorrentState (seeders, leechers, last_check)
+    WHERE has_data = 1;
+"""
+
+# The FTS pre-filter in search_keyword looks up the seeders of (at most) 10000 matching rows. This index allows it to
+# do so without reading the (large) ChannelNode rows.
+sql_create_index_channelnode_search = """
+    CREATE INDEX IF NOT EXISTS idx_channelnode__rowid_health_seeders
+    ON ChannelNode (rowid, health_seeders);
+"""
+
 sql_create_partial_index_torrentstate_last_check = """
     CREATE INDEX IF NOT EXISTS idx_torrentstate__last_check__partial
     ON TorrentState (last_check, seeders, leechers, self_checked)
@@ -131,17 +231,31 @@ class MetadataStore:
     Storage of metadata for channels and torrents.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0915
             self,
             db_filename: str,
             private_key: PrivateKey,
             disable_sync: bool = False,
             notifier: Notifier | None = None,
             check_tables: bool = True,
-            db_version: int = CURRENT_DB_VERSION
+            db_version: int = CURRENT_DB_VERSION,
+            *,
+            wal_mode: bool = False,
+            read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+            wal_checkpoint_interval: float = DEFAULT_WAL_CHECKPOINT_INTERVAL,
+            profile_queries: bool = False,
+            signature_workers: int = 0
     ) -> None:
         """
         Create a new metadata store.
+
+        In WAL mode, threaded queries run on a pool of read-only connections, while all threaded writes go through
+        a single writer connection. This allows queries to proceed while ingestion writes. WAL mode is not available
+        for in-memory databases.
+
+        If ``profile_queries`` is set, the statistics of the entry queries are recorded, see ``QueryProfiler``.
+
+        If ``signature_workers`` is set, the signatures of large batches of payloads are checked by that many threads.
         """
         self.notifier = notifier  # Reference to app-level notification service
         self.db_path = db_filename
@@ -153,6 +267,25 @@ class MetadataStore:
         self.batch_size = 10  # reasonable number, a little bit more than typically fits in a single UDP packet
         self.reference_timedelta = timedelta(milliseconds=100)
         self.sleep_on_external_thread = 0.05  # sleep this amount of seconds between batches executed on external thread
+        self.search_cache = SearchResultCache()
+        self.query_profiler = QueryProfiler(profile_queries)
+        # Optional worker pool to check payload signatures with
+        self.signature_executor: Executor | None = ThreadPoolExecutor(
+            max_workers=signature_workers, thread_name_prefix="MetadataStoreSignatures"
+        ) if signature_workers > 0 else None
+
+        self.wal_mode = wal_mode and db_filename != ":memory:"
+        self.wal_checkpoint_interval = wal_checkpoint_interval
+        self._last_checkpoint = time()
+        self._thread_state = threading.local()
+        self._read_pool_size = read_pool_size
+        self._read_executor: ThreadPoolExecutor | None = None
+        self._write_executor: ThreadPoolExecutor | None = None
+        if self.wal_mode:
+            self._read_executor = ThreadPoolExecutor(max_workers=read_pool_size,
+                                                     thread_name_prefix="MetadataStoreReader",
+                                                     initializer=self._mark_read_only)
+            self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MetadataStoreWriter")
 
         # Before we start binding and initializing, do a quick integrity check. We remove the existing db if this fails.
         # See https://github.com/Tribler/tribler/issues/8815 for the reasons behind this behavior.
@@ -169,7 +302,7 @@ class MetadataStore:
         @self.db.on_connect
         def on_connect(_: Database, connection: Connection) -> None:
             cursor = connection.cursor()
-            cursor.execute("PRAGMA journal_mode = DELETE")
+            cursor.execute("PRAGMA journal_mode = WAL" if self.wal_mode else "PRAGMA journal_mode = DELETE")
             cursor.execute("PRAGMA synchronous = NORMAL")
             cursor.execute("PRAGMA temp_store = MEMORY")
             cursor.execute("PRAGMA foreign_keys = ON")
@@ -181,8 +314,12 @@ class MetadataStore:
                 cursor.execute("PRAGMA journal_mode = 0")
                 cursor.execute("PRAGMA synchronous = 0")
 
+            # The rank only depends on its arguments, which allows SQLite to optimize its usage
             sqlite_rank = keep_exception(torrent_rank)
-            connection.create_function("search_rank", 5, sqlite_rank)
+            connection.create_function("search_rank", 5, sqlite_rank, deterministic=True)
+            # The same rank, for the precomputed health_rank column (instead of the seeders and leechers)
+            sqlite_health_rank = keep_exception(health_torrent_rank)
+            connection.create_function("search_rank", 4, sqlite_health_rank, deterministic=True)
 
             # Make sure we have the tracker_id field in the TorrentState table
             cursor.execute("PRAGMA table_info(TorrentState)")
@@ -192,6 +329,10 @@ class MetadataStore:
                 cursor.execute("ALTER TABLE TorrentState ADD COLUMN tracker_id INTEGER")
                 self._logger.info("Added tracker_id column to TorrentState")
 
+            # Connections of the read pool should never write, all writes go through the writer connection
+            if getattr(self._thread_state, "read_only", False):
+                cursor.execute("PRAGMA query_only = ON")
+
         self.MiscData = misc.define_binding(self.db)
 
         self.TrackerState = tracker_state.define_binding(self.db)
@@ -219,10 +360,15 @@ class MetadataStore:
                 self.db.execute(sql_create_fts_table)
                 self.create_fts_triggers()
                 self.create_torrentstate_triggers()
+                self.create_health_columns()
+        with db_session(ddl=True):
+            self.upgrade_fts_triggers()
 
         if create_db:
             with db_session:
                 self.MiscData(name="db_version", value=str(db_version))
+        else:
+            upgrade_metadata_db(self)
 
     def fast_integrity_check(self, remove_broken: bool = True) -> bool:
         """
@@ -317,6 +463,67 @@ class MetadataStore:
         cursor = self.db.get_connection().cursor()
         cursor.execute("insert into FtsIndex(rowid, title) select rowid, title from ChannelNode")
 
+    def rebuild_fts_index(self) -> None:
+        """
+        Replace the contents of the FTS index by the current titles and merge the index into a single segment.
+        """
+        cursor = self.db.get_connection().cursor()
+        cursor.execute("INSERT INTO FtsIndex(FtsIndex) VALUES ('delete-all')")
+        self.fill_fts_index()
+        cursor.execute("INSERT INTO FtsIndex(FtsIndex) VALUES ('optimize')")
+
+    def upgrade_fts_triggers(self) -> None:
+        """
+        Replace missing or outdated FTS triggers and rebuild the FTS index if they had to be replaced.
+
+        Older triggers did not remove the terms of deleted and updated titles from the index, and the triggers are
+        missing if Tribler stopped during an import with deferred FTS updates.
+        """
+        cursor = self.db.get_connection().cursor()
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'fts_%'")
+        triggers = dict(cursor.fetchall())
+        if (triggers.keys() == {"fts_ai", "fts_ad", "fts_au"}
+                and "'delete'" in triggers["fts_ad"] and "UPDATE OF title" in triggers["fts_au"]):
+            return
+        self.drop_fts_triggers()
+        self.create_fts_triggers()
+        self.rebuild_fts_index()
+        self._logger.info("Replaced the FTS triggers and rebuilt the FTS index")
+
+    @contextmanager
+    def deferred_fts(self) -> Iterator[None]:
+        """
+        Do not update the FTS index while the context is active and rebuild the index when the context exits.
+
+        For large imports, this is much faster than updating the index for every row. However, text searches do not
+        find the imported entries until the import finishes. This context manager opens its own database sessions and
+        should not be used inside a db_session.
+        """
+        with db_session(ddl=True):
+            self.drop_fts_triggers()
+        try:
+            yield
+        finally:
+            with db_session(ddl=True):
+                self.rebuild_fts_index()
+                self.create_fts_triggers()
+            self.search_cache.invalidate()
+
+    def merge_fts_segments(self, pages: int = FTS_MERGE_PAGES) -> bool:
+        """
+        Merge some of the segments of the FTS index, writing roughly the given number of pages at most.
+
+        Every update of the index adds a small segment, which slows down text searches until the segments are merged.
+
+        :returns: whether any segments were merged.
+        """
+        with db_session(immediate=True):
+            connection = self.db.get_connection()
+            changes = connection.total_changes
+            connection.cursor().execute("INSERT INTO FtsIndex(FtsIndex, rank) VALUES ('merge', ?)", (pages,))
+            # SQLite reports at least two changes if the merge command did any work.
+            return connection.total_changes - changes >= 2
+
     def create_torrentstate_triggers(self) -> None:
         """
         Create the torrent state triggers.
@@ -325,32 +532,133 @@ class MetadataStore:
         cursor.execute(sql_add_torrentstate_trigger_after_insert)
         cursor.execute(sql_add_torrentstate_trigger_after_update)
 
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """
+        Copy the changes in the write-ahead log back into the database file.
+
+        :param mode: the SQLite checkpoint mode: PASSIVE, FULL, RESTART or TRUNCATE.
+        :returns: whether the checkpoint was blocked, the number of pages in the log, and the number of copied pages.
+        """
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            msg = f"Unknown checkpoint mode {mode}"
+            raise ValueError(msg)
+        # Pony keeps a transaction open on its connections, which would block the checkpoint: use our own connection.
+        connection = sqlite3.connect(self.db_path)
+        try:
+            busy, log_pages, checkpointed_pages = connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        finally:
+            connection.close()
+        self._last_checkpoint = time()
+        return busy, log_pages, checkpointed_pages
+
+    def create_health_columns(self) -> None:
+        """
+        Create the health columns of the ChannelNode table, with their triggers and indices.
+
+        Existing databases get these columns through ``upgrade_metadata_db()``, which also fills them.
+        """
+        cursor = self.db.get_connection().cursor()
+        cursor.execute(sql_create_health_view)
+        for statement in sql_add_channelnode_health_columns:
+            cursor.execute(statement)
+        cursor.execute(sql_add_torrentstate_trigger_health_update)
+        cursor.execute(sql_add_channelnode_trigger_health_insert)
+        cursor.execute(sql_add_channelnode_trigger_health_update)
+        cursor.execute(sql_create_index_channelnode_health)
+        cursor.execute(sql_create_index_channelnode_search)
+        cursor.execute(sql_create_index_torrentstate_popular)
+
     def shutdown(self) -> None:
         """
         Disconnect the connection to the database.
         """
         self._shutting_down = True
+        if self.signature_executor is not None:
+            self.signature_executor.shutdown()
+        if self._read_executor is not None:
+            self._disconnect_workers(self._read_executor, self._read_pool_size)
+        if self._write_executor is not None:
+            self._disconnect_workers(self._write_executor, 1)
+        if self.wal_mode:
+            self.checkpoint("TRUNCATE")
         self.db.disconnect()
 
+    def _disconnect_workers(self, executor: ThreadPoolExecutor, workers: int) -> None:
+        """
+        Close the connection of every thread of the given executor and stop the executor.
+        """
+        barrier = threading.Barrier(workers)
+
+        def disconnect() -> None:
+            self.db.disconnect()
+            # Keep this thread busy until every other thread got its own disconnect call
+            barrier.wait()
+
+        for _ in range(workers):
+            executor.submit(disconnect)
+        executor.shutdown(wait=True)
+
+    def _mark_read_only(self) -> None:
+        """
+        Mark the current thread as a thread of the read pool, its database connection will not allow writes.
+        """
+        self._thread_state.read_only = True
+
+    def _checkpoint_if_due(self) -> None:
+        """
+        Checkpoint the write-ahead log if the checkpoint interval has passed.
+        """
+        if time() - self._last_checkpoint >= self.wal_checkpoint_interval:
+            try:
+                self.checkpoint()
+            except Exception as e:
+                self._logger.warning("Failed to checkpoint the database: %s: %s", type(e).__name__, str(e))
+
+    async def _run_in_executor(self, executor: ThreadPoolExecutor | None,
+                               func: Callable, *args: Any, **kwargs) -> Any:  # noqa: ANN401
+        """
+        Run ``func`` on the given executor, or on the default executor if it is None.
+
+        The connections of our own executors are kept open. Other threads close their connection when done.
+        """
+
+        def wrapper():  # noqa: ANN202
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if executor is self._write_executor and executor is not None:
+                    self._checkpoint_if_due()
+                elif executor is None and threading.current_thread() is not threading.main_thread():
+                    self.db.disconnect()
+
+        return await get_running_loop().run_in_executor(executor, wrapper)
+
     async def run_threaded(self, func: Callable, *args: Any, **kwargs) -> Any:  # noqa: ANN401
         """
         Run ``func`` threaded and close DB connection at the end of the execution.
 
+        In WAL mode, ``func`` runs on the writer thread instead, which keeps its connection open.
+
         :param func: the function to be executed threaded
         :param args: args for the function call
         :param kwargs: kwargs for the function call
         :return: a result of the func call.
         """
+        return await self._run_in_executor(self._write_executor, func, *args, **kwargs)
 
-        def wrapper():  # noqa: ANN202
-            try:
-                return func(*args, **kwargs)
-            finally:
-                is_main_thread = threading.current_thread() is threading.main_thread()
-                if not is_main_thread:
-                    self.db.disconnect()
+    async def run_threaded_read(self, func: Callable, *args: Any, **kwargs) -> Any:  # noqa: ANN401
+        """
+        Run the read-only ``func`` threaded.
 
-        return await get_running_loop().run_in_executor(None, wrapper)
+        In WAL mode, ``func`` runs on the read pool, concurrently with the writer thread. Otherwise, this is the same
+        as ``run_threaded``.
+
+        :param func: the function to be executed threaded
+        :param args: args for the function call
+        :param kwargs: kwargs for the function call
+        :return: a result of the func call.
+        """
+        return await self._run_in_executor(self._read_executor, func, *args, **kwargs)
 
     async def process_compressed_mdblob_threaded(self, compressed_data: bytes, **kwargs) -> list[ProcessingResult]:
         """
@@ -363,8 +671,8 @@ class MetadataStore:
                                    e.__class__.__name__, str(e), exc_info=e)
             return []
 
-    def process_compressed_mdblob(self, compressed_data: bytes,
-                                  skip_personal_metadata_payload: bool = True) -> list[ProcessingResult]:
+    def process_compressed_mdblob(self, compressed_data: bytes, skip_personal_metadata_payload: bool = True,
+                                  deferred_fts: bool = False) -> list[ProcessingResult]:
         """
         Decompress the given data and return a list of uncompressed results.
         """
@@ -385,7 +693,8 @@ class MetadataStore:
                 raise
 
         return self.process_squashed_mdblob(decompressed_data, health_info=health_info,
-                                            skip_personal_metadata_payload=skip_personal_metadata_payload)
+                                            skip_personal_metadata_payload=skip_personal_metadata_payload,
+                                            deferred_fts=deferred_fts)
 
     def process_torrent_health(self, health: HealthInfo) -> bool:
         """
@@ -403,9 +712,12 @@ class MetadataStore:
         if add:
             self._logger.debug("Add health info %s", str(health))
             torrent_state = self.TorrentState.from_health(health)
+            self.search_cache.invalidate()
 
         if health.should_replace(torrent_state.to_health()):
             self._logger.debug("Update health info %s", str(health))
+            # Popular torrents and text searches are ordered by health
+            self.search_cache.invalidate()
             if health.tracker:
                 # Get the tracker from the db, and add it if it isn't in there already.
                 tracker = self.TrackerState.get_for_update(url=health.tracker) or self.TrackerState(url=health.tracker)
@@ -417,9 +729,10 @@ class MetadataStore:
                                   last_check=health.last_check, tracker_id=0, self_checked=False)
         return add
 
-    def process_squashed_mdblob(self, chunk_data: bytes, external_thread: bool = False,  # noqa: C901
+    def process_squashed_mdblob(self, chunk_data: bytes, external_thread: bool = False,
                                 health_info: list[tuple[int, int, int]] | None = None,
-                                skip_personal_metadata_payload: bool = True) -> list[ProcessingResult]:
+                                skip_personal_metadata_payload: bool = True,
+                                deferred_fts: bool = False) -> list[ProcessingResult]:
         """
         Process raw concatenated payloads blob. This routine breaks the database access into smaller batches.
         It uses a congestion-control like algorithm to determine the optimal batch size, targeting the
@@ -431,61 +744,61 @@ class MetadataStore:
             imperfections. It only makes sense to use it when this routine runs on a non-reactor thread.
         :param health_info: the health info to update a torrent with.
         :param skip_personal_metadata_payload: don't process our own torrents.
+        :param deferred_fts: rebuild the FTS index after processing, instead of updating it for every entry. This is
+            only faster for imports that are large compared to the size of the database, see ``deferred_fts()``.
         :return: a list of tuples of (<metadata or payload>, <action type>)
         """
-        offset = 0
-        payload_list = []
-        while offset < len(chunk_data):
-            payload, offset = read_payload_with_offset(chunk_data, offset)
-            if payload and isinstance(payload, TorrentMetadataPayload):
-                # Silently ignore deprecated payloads
-                payload_list.append(payload)
+        # Only the fixed-size fields are unpacked here, the rest is only unpacked for torrents that we do not know yet
+        payload_list = list(iter_torrent_metadata(chunk_data))
 
         if health_info and len(health_info) == len(payload_list):
             with db_session:
                 for payload, (seeders, leechers, last_check) in zip(payload_list, health_info, strict=False):
-                    if hasattr(payload, "infohash"):
-                        health = HealthInfo(payload.infohash, last_check=last_check,
-                                            seeders=seeders, leechers=leechers)
-                        self.process_torrent_health(health)
+                    health = HealthInfo(payload.infohash, last_check=last_check,
+                                        seeders=seeders, leechers=leechers)
+                    self.process_torrent_health(health)
+
+        # Don't process torrents with a bad signature. These are checked in bulk, outside of the database sessions.
+        valid = check_signatures(payload_list, self.signature_executor)
+        payload_list = [payload for payload, is_valid in zip(payload_list, valid, strict=True) if is_valid]
 
         result = []
         total_size = len(payload_list)
         start = 0
-        while start < total_size:
-            end = start + self.batch_size
-            batch = payload_list[start:end]
-            batch_start_time = datetime.now()  # noqa: DTZ005
-
-            # We separate the sessions to minimize database locking.
-            with db_session(immediate=True):
-                for payload in batch:
-                    result.extend(self.process_payload(payload, skip_personal_metadata_payload))
-
-            # Batch size adjustment
-            batch_end_time = datetime.now() - batch_start_time  # noqa: DTZ005
-            target_coeff = batch_end_time.total_seconds() / self.reference_timedelta.total_seconds()
-            if len(batch) == self.batch_size:
-                # Adjust batch size only for full batches
-                if target_coeff < 0.8:
-                    self.batch_size += self.batch_size
-                elif target_coeff > 1.0:
-                    self.batch_size = int(float(self.batch_size) / target_coeff)
-                # we want to guarantee that at least something
-                # will go through, but not too much
-                self.batch_size = min(max(self.batch_size, MIN_BATCH_SIZE), MAX_BATCH_SIZE)
-            self._logger.debug(
-                (
-                    "Added payload batch to DB (entries, seconds): %i %f",
-                    (self.batch_size, float(batch_end_time.total_seconds())),
+        with self.deferred_fts() if deferred_fts else nullcontext():
+            while start < total_size:
+                end = start + self.batch_size
+                batch = payload_list[start:end]
+                batch_start_time = datetime.now()  # noqa: DTZ005
+
+                # We separate the sessions to minimize database locking.
+                with db_session(immediate=True):
+                    result.extend(self.process_payloads(batch, skip_personal_metadata_payload, signatures_checked=True))
+
+                # Batch size adjustment
+                batch_end_time = datetime.now() - batch_start_time  # noqa: DTZ005
+                target_coeff = batch_end_time.total_seconds() / self.reference_timedelta.total_seconds()
+                if len(batch) == self.batch_size:
+                    # Adjust batch size only for full batches
+                    if target_coeff < 0.8:
+                        self.batch_size += self.batch_size
+                    elif target_coeff > 1.0:
+                        self.batch_size = int(float(self.batch_size) / target_coeff)
+                    # we want to guarantee that at least something
+                    # will go through, but not too much
+                    self.batch_size = min(max(self.batch_size, MIN_BATCH_SIZE), MAX_BATCH_SIZE)
+                self._logger.debug(
+                    (
+                        "Added payload batch to DB (entries, seconds): %i %f",
+                        (self.batch_size, float(batch_end_time.total_seconds())),
+                    )
                 )
-            )
-            start = end
-            if self._shutting_down:
-                break
+                start = end
+                if self._shutting_down:
+                    break
 
-            if external_thread:
-                sleep(self.sleep_on_external_thread)
+                if external_thread:
+                    sleep(self.sleep_on_external_thread)
 
         return result
 
@@ -511,6 +824,7 @@ class MetadataStore:
         if payload.public_key == NULL_KEY:
             node = self.TorrentMetadata.add_ffa_from_dict(payload.to_dict())
             if node:
+                self.search_cache.invalidate()
                 return [ProcessingResult(data=node.to_simple_dict(),
                                          obj_state=ObjState.NEW_OBJECT,
                                          rowid=node.rowid)]
@@ -525,10 +839,170 @@ class MetadataStore:
 
         # Process signed torrents
         obj = self.TorrentMetadata.from_payload(payload)
+        self.search_cache.invalidate()
         return [ProcessingResult(data=obj.to_simple_dict(),
                                  obj_state=ObjState.NEW_OBJECT,
                                  rowid=obj.rowid)]
 
+    @db_session
+    def process_payloads(self, payloads: Sequence[TorrentMetadataPayload | TorrentMetadataView],  # noqa: C901
+                         skip_personal_metadata_payload: bool = True,
+                         signatures_checked: bool = False) -> list[ProcessingResult]:
+        """
+        Write a batch of payloads to our database (if necessary).
+
+        This gives the same results as calling ``process_payload`` for every payload, but signed payloads are
+        deduplicated and inserted with a fixed number of queries for the entire batch, instead of through the ORM.
+        The batch should not exceed ``MAX_BATCH_SIZE`` payloads, to stay clear of the SQLite variable limit.
+        Views of payloads are only fully unpacked if they are inserted.
+
+        :param payloads: the payloads (or views of payloads) to process.
+        :param skip_personal_metadata_payload: don't process our own torrents.
+        :param signatures_checked: whether the payloads are already known to be unsigned or validly signed.
+        """
+        valid = [True] * len(payloads) if signatures_checked else check_signatures(payloads, self.signature_executor)
+
+        results: dict[int, list[ProcessingResult]] = {}
+        signed: dict[tuple[bytes, int], tuple[int, TorrentMetadataPayload | TorrentMetadataView]] = {}
+        duplicates: dict[int, tuple[bytes, int]] = {}
+        for index, payload in enumerate(payloads):
+            if ((skip_personal_metadata_payload and payload.public_key == self.my_public_key_bin)
+                    or payload.metadata_type != REGULAR_TORRENT
+                    or not valid[index]):
+                continue
+            if payload.public_key == NULL_KEY:
+                # Free-for-all entries are rare and need the ORM logic of add_ffa_from_dict
+                results[index] = self.process_payload(unpack_view(payload), skip_personal_metadata_payload)
+            elif (payload.public_key, payload.id_) in signed:
+                duplicates[index] = (payload.public_key, payload.id_)
+            else:
+                signed[(payload.public_key, payload.id_)] = (index, payload)
+
+        if signed:
+            self.db.flush()
+            cursor = self.db.get_connection().cursor()
+
+            # Do we already know about these objects? In that case, we keep the first one (i.e., no versioning).
+            known = self._select_node_rowids(cursor, list(signed))
+            new = {key: (index, unpack_view(payload)) for key, (index, payload) in signed.items() if key not in known}
+
+            inserted = {}
+            if new:
+                self._insert_payloads(cursor, [payload for _, payload in new.values()])
+                inserted = self._select_node_rowids(cursor, list(new))
+                new_results = self._new_payload_results(cursor, {rowid: new[key][1] for key, rowid in inserted.items()})
+                for key, rowid in inserted.items():
+                    results[new[key][0]] = [new_results[rowid]]
+
+            # Duplicates are reported with the data of the object that we already have.
+            nodes = {node.rowid: node for node in self.get_entries_by_rowids(list(known.values()))}
+            for key, rowid in known.items():
+                if rowid in nodes:
+                    results[signed[key][0]] = [ProcessingResult(data=nodes[rowid].to_simple_dict(),
+                                                                obj_state=ObjState.DUPLICATE_OBJECT,
+                                                                rowid=rowid)]
+            for index, key in duplicates.items():
+                if (first_result := results.get(signed[key][0])) is not None:
+                    results[index] = [ProcessingResult(data=first_result[0].data,
+                                                       obj_state=ObjState.DUPLICATE_OBJECT,
+                                                       rowid=first_result[0].rowid)]
+
+        return [result for index in sorted(results) for result in results[index]]
+
+    def _select_node_rowids(self, cursor: sqlite3.Cursor,
+                            keys: list[tuple[bytes, int]]) -> dict[tuple[bytes, int], int]:
+        """
+        Get the rowids of the nodes with the given ``(public_key, id_)`` keys, if they exist.
+        """
+        cursor.execute(f"""SELECT public_key, id_, rowid FROM ChannelNode
+                           WHERE (public_key, id_) IN (VALUES {", ".join(["(?, ?)"] * len(keys))})""",  # noqa: S608
+                       [value for key in keys for value in key])
+        return {(public_key, id_): rowid for public_key, id_, rowid in cursor.fetchall()}
+
+    def _insert_payloads(self, cursor: sqlite3.Cursor, payloads: list[TorrentMetadataPayload]) -> None:
+        """
+        Insert new signed payloads, and their torrent and tracker states, using one statement per table.
+        """
+        infohashes = list({payload.infohash for payload in payloads})
+        placeholders = ", ".join(["?"] * len(infohashes))
+        cursor.executemany("INSERT OR IGNORE INTO TorrentState (infohash, seeders, leechers, last_check, self_checked, "
+                           "has_data) VALUES (?, 0, 0, 0, 0, 0)", [(infohash, ) for infohash in infohashes])
+        cursor.execute(f"SELECT infohash, rowid FROM TorrentState WHERE infohash IN ({placeholders})",  # noqa: S608
+                       infohashes)
+        torrent_states = dict(cursor.fetchall())
+
+        tracker_urls = {}
+        for payload in payloads:
+            if payload.tracker_info and (url := get_uniformed_tracker_url(payload.tracker_info)):
+                tracker_urls[payload.infohash] = url
+        if tracker_urls:
+            urls = list(set(tracker_urls.values()))
+            cursor.executemany("INSERT OR IGNORE INTO TrackerState (url, last_check, alive, failures) "
+                               "VALUES (?, 0, 1, 0)", [(url, ) for url in urls])
+            cursor.execute(f"SELECT url, rowid FROM TrackerState WHERE url IN ({', '.join(['?'] * len(urls))})",  # noqa: S608
+                           urls)
+            tracker_states = dict(cursor.fetchall())
+            cursor.executemany("INSERT OR IGNORE INTO TorrentState_TrackerState (torrentstate, trackerstate) "
+                               "VALUES (?, ?)", [(torrent_states[infohash], tracker_states[url])
+                                                 for infohash, url in tracker_urls.items()])
+
+        added_on = datetime.utcnow().strftime(SQLITE_DATETIME_FORMAT)  # noqa: DTZ003
+        cursor.executemany("""INSERT OR IGNORE INTO ChannelNode (infohash, size, torrent_date, tracker_info, title,
+                                  tags, metadata_type, reserved_flags, origin_id, public_key, id_, timestamp,
+                                  signature, added_on, status, xxx, health, tag_processor_version)
+                              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, 0)""",
+                           [(payload.infohash, payload.size, payload.torrent_date.strftime(SQLITE_DATETIME_FORMAT),
+                             payload.tracker_info, payload.title, payload.tags, payload.metadata_type,
+                             payload.reserved_flags, payload.origin_id, payload.public_key, payload.id_,
+                             payload.timestamp, payload.signature, added_on, COMMITTED,
+                             torrent_states[payload.infohash]) for payload in payloads])
+        self.search_cache.invalidate()
+
+    def _new_payload_results(self, cursor: sqlite3.Cursor,
+                             payloads: dict[int, TorrentMetadataPayload]) -> dict[int, ProcessingResult]:
+        """
+        Create the results for freshly inserted payloads (by rowid) and notify our listeners of their creation.
+        """
+        infohashes = list({payload.infohash for payload in payloads.values()})
+        placeholders = ", ".join(["?"] * len(infohashes))
+        cursor.execute(f"""SELECT infohash, seeders, leechers, last_check FROM TorrentState
+                           WHERE infohash IN ({placeholders})""", infohashes)  # noqa: S608
+        health = {infohash: (seeders, leechers, last_check) for infohash, seeders, leechers, last_check
+                  in cursor.fetchall()}
+        cursor.execute(f"""SELECT ts.infohash, tr.url FROM TorrentState ts
+                           JOIN TorrentState_TrackerState tt ON tt.torrentstate = ts.rowid
+                           JOIN TrackerState tr ON tr.rowid = tt.trackerstate
+                           WHERE ts.infohash IN ({placeholders})""", infohashes)  # noqa: S608
+        trackers: dict[bytes, list[str]] = {}
+        for infohash, url in cursor.fetchall():
+            trackers.setdefault(infohash, []).append(url)
+
+        results = {}
+        for rowid, payload in payloads.items():
+            seeders, leechers, last_check = health[payload.infohash]
+            results[rowid] = ProcessingResult(data={
+                "name": payload.title,
+                "category": payload.tags,
+                "infohash": hexlify(payload.infohash).decode(),
+                "size": payload.size,
+                "num_seeders": seeders,
+                "num_leechers": leechers,
+                "last_tracker_check": last_check,
+                "created": time2int(payload.torrent_date),
+                "tag_processor_version": 0,
+                "type": payload.metadata_type,
+                "id": payload.id_,
+                "origin_id": payload.origin_id,
+                "public_key": hexlify(payload.public_key).decode(),
+                "status": COMMITTED,
+                "trackers": trackers.get(payload.infohash, []),
+            }, obj_state=ObjState.NEW_OBJECT, rowid=rowid)
+        if self.notifier:
+            self.notifier.notify_batch(Notification.new_torrent_metadata_created,
+                                       [{"infohash": payload.infohash, "title": payload.title}
+                                        for payload in payloads.values()])
+        return results
+
     @db_session
     def get_num_torrents(self) -> int:
         """
@@ -561,6 +1035,8 @@ class MetadataStore:
             # They are scattered randomly through the entire database file, so fetching all these torrents is slow.
             # Also, the torrent_rank function used inside the final ORDER BY section is written in Python. It is about
             # 30 times slower than a possible similar function written in C due to SQLite-Python communication cost.
+            # The query string is only parsed once per query (see ranks.query_terms), but every row still pays for
+            # a call into Python.
             #
             # To speed up the query, we limit and filter search results in several iterations, and each time apply
             # a more expensive ranking algorithm:
@@ -569,20 +1045,19 @@ class MetadataStore:
             #     in degenerative cases. In typical cases, when the text query is specific enough, the number of
             #     matching torrents is not that big.
             #   * Then, we sort these 10000 torrents to prioritize torrents with seeders and restrict the number
-            #     of torrents to just 1000.
+            #     of torrents to just 1000. The seeders are read from a covering index, SQLite would otherwise
+            #     choose to read the (much larger) rows of the table.
             #   * Finally, in the main query, we apply a slow ranking function to these 1000 torrents to show the most
             #     relevant torrents at the top of the search result list.
             #
-            # This multistep sort+limit sequence allows speedup queries up to two orders of magnitude. To further
-            # speed up full-text search queries, we can rewrite the torrent_rank function to C one day.
+            # This multistep sort+limit sequence allows speedup queries up to two orders of magnitude.
             fts_ids = raw_sql("""
                 SELECT fts.rowid
                 FROM (
                     SELECT rowid FROM FtsIndex WHERE FtsIndex MATCH $query ORDER BY rowid DESC LIMIT 10000
                 ) fts
-                LEFT JOIN ChannelNode cn on fts.rowid = cn.rowid
-                LEFT JOIN main.TorrentState ts on cn.health = ts.rowid
-                ORDER BY coalesce(ts.seeders, 0) DESC, fts.rowid DESC
+                LEFT JOIN ChannelNode cn INDEXED BY idx_channelnode__rowid_health_seeders on fts.rowid = cn.rowid
+                ORDER BY coalesce(cn.health_seeders, 0) DESC, fts.rowid DESC
                 LIMIT 1000
             """)
         return left_join(g for g in cast("TorrentMetadata", self.TorrentMetadata) if g.rowid in fts_ids)
@@ -626,20 +1101,21 @@ class MetadataStore:
                 raise TypeError(msg)
 
             t = time() - POPULAR_TORRENTS_FRESHNESS_PERIOD  # noqa: F841 (this is used in the following query)
-            return self.TorrentMetadata.select_by_sql("""
-                           SELECT ChannelNode.* FROM
-                             (SELECT * FROM TorrentState
-                              WHERE TorrentState.has_data == 1
-                                AND TorrentState.last_check >= $t
-                                AND (TorrentState.seeders > 0 OR TorrentState.leechers > 0)
-                              ORDER BY TorrentState.seeders DESC, TorrentState.leechers DESC,
-                                       TorrentState.last_check DESC
-                              LIMIT $POPULAR_TORRENTS_COUNT) results
-                           LEFT JOIN
-                             ChannelNode WHERE ChannelNode.health == results.rowid
-                           GROUP BY ChannelNode.infohash
-                           ;
-                           """)
+            # The torrent states are read from the idx_torrentstate__popular index. Only one entry per infohash is kept.
+            popular_ids = raw_sql("""
+                SELECT min(ChannelNode.rowid) FROM
+                  (SELECT rowid FROM TorrentState
+                   WHERE TorrentState.has_data == 1
+                     AND TorrentState.last_check >= $t
+                     AND (TorrentState.seeders > 0 OR TorrentState.leechers > 0)
+                   ORDER BY TorrentState.seeders DESC, TorrentState.leechers DESC,
+                            TorrentState.last_check DESC
+                   LIMIT $POPULAR_TORRENTS_COUNT) results
+                JOIN ChannelNode ON ChannelNode.health == results.rowid
+                GROUP BY ChannelNode.infohash
+            """)
+            return (select(g for g in cast("TorrentMetadata", self.TorrentMetadata) if g.rowid in popular_ids)
+                    .sort_by(raw_sql("g.health_seeders DESC, g.health_leechers DESC")))
         else:
             pony_query = left_join(g for g in cast("TorrentMetadata", self.TorrentMetadata))
 
@@ -684,10 +1160,11 @@ class MetadataStore:
         pony_query = pony_query.sort_by("desc(g.rowid)" if sort_desc else "g.rowid")
 
         if sort_by == "HEALTH":
+            # The health columns are copies of the TorrentState of a torrent, which do not need a join
             pony_query = pony_query.sort_by(
-                "(desc(g.health.seeders), desc(g.health.leechers))"
+                raw_sql("g.health_seeders DESC, g.health_leechers DESC")
                 if sort_desc
-                else "(g.health.seeders, g.health.leechers)"
+                else raw_sql("g.health_seeders, g.health_leechers")
             )
         elif sort_by == "size":
             # Remark: this can be optimized to skip cases where size field does not matter
@@ -710,37 +1187,35 @@ class MetadataStore:
                 search_rank(
                     $QUERY_STRING,
                     g.title,
-                    torrentstate.seeders,
-                    torrentstate.leechers,
+                    g.health_rank,
                     $CURRENT_TIME - strftime('%s', g.torrent_date)
                 ) DESC,
 
-                "torrentstate"."last_check" DESC,
+                g.health_last_check DESC,
 
             So, the channel torrents and channel folders are always on top if they are not filtered out.
             Then regular torrents are selected in order of their relevance according to a search_rank() result.
             If two torrents have the same search rank, they are ordered by the last time they were checked.
 
             The search_rank() function is called directly from the SQLite query, but is implemented in Python,
-            it is actually the torrent_rank() function from core/utilities/search_utils.py, wrapped with
+            it is actually the health_torrent_rank() function from core/database/ranks.py, wrapped with
             keep_exception() to return possible exception from SQLite to Python.
 
             The search_rank() function receives the following arguments:
               - the current query string (like "Big Buck Bunny");
               - the title of the current torrent;
-              - the number of seeders;
-              - the number of leechers;
+              - the precomputed seeders_rank() of the health of the torrent;
               - the number of seconds since the torrent's creation time.
+
+            The health columns are maintained by triggers, so the TorrentState table is not joined.
             """
 
             pony_query = pony_query.sort_by(
                 f"""
                 (1 if g.metadata_type == {CHANNEL_TORRENT} else 2 if g.metadata_type == {COLLECTION_NODE} else 3),
                 raw_sql('''search_rank(
-                    $txt_filter, g.title, torrentstate.seeders, torrentstate.leechers,
-                    $int(time()) - strftime('%s', g.torrent_date)
-                ) DESC'''),
-                desc(g.health.last_check)  # just to trigger the TorrentState table inclusion into the left join
+                    $txt_filter, g.title, g.health_rank, $int(time()) - strftime('%s', g.torrent_date)
+                ) DESC, g.health_last_check DESC''')
             """
             )
 
@@ -750,7 +1225,7 @@ class MetadataStore:
         """
         Retrieve entries in a thread and return a list of results.
         """
-        return await self.run_threaded(self.get_entries, **kwargs)
+        return await self.run_threaded_read(self.get_entries, **kwargs)
 
     @db_session
     def get_entries(self, first: int = 1, last: int | None = None, **kwargs) -> list[TorrentMetadata]:
@@ -758,16 +1233,38 @@ class MetadataStore:
         Get some torrents. Optionally sort the results by a specific field, or filter the channels based
         on a keyword/whether you are subscribed to it.
 
+        Text searches and popular torrent queries are cached, see ``SearchResultCache``.
+
         :return: A list of class members
         """
-        pony_query = self.get_entries_query(**kwargs)
-        result = pony_query[(first or 1) - 1: last]
+        cache_key = self.search_cache.make_key(first=first, last=last, **kwargs) if is_cacheable_query(kwargs) else None
+        cached = self.search_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            result = self.get_entries_by_rowids(cached)
+        else:
+            generation = self.search_cache.generation
+            pony_query = self.get_entries_query(**kwargs)
+            if self.query_profiler.enabled:
+                result = self.query_profiler.profile(self.db.get_connection(), kwargs,
+                                                     lambda: pony_query[(first or 1) - 1: last])
+            else:
+                result = pony_query[(first or 1) - 1: last]
+            if cache_key is not None:
+                self.search_cache.put(cache_key, [entry.rowid for entry in result], generation)
         for entry in result:
             # ACHTUNG! This is necessary in order to load entry.health inside db_session,
             # to be able to perform successfully `entry.to_simple_dict()` later
             entry.to_simple_dict()
         return result
 
+    @db_session
+    def get_entries_by_rowids(self, rowids: list[int]) -> list[TorrentMetadata]:
+        """
+        Get the entries with the given row ids, in the given order. Row ids that no longer exist are skipped.
+        """
+        entries = {entry.rowid: entry for entry in self.TorrentMetadata.select(lambda g: g.rowid in rowids)}
+        return [entries[rowid] for rowid in rowids if rowid in entries]
+
     @db_session
     def get_total_count(self, **kwargs) -> int | None:
         """
@@ -791,7 +1288,7 @@ class MetadataStore:
         """
         Get the highest-known row id.
         """
-        return (select(max(obj.rowid) for obj in cast("TorrentMetadata", self.TorrentMetadata)).get() or 0)
+        return orm.max(obj.rowid for obj in cast("TorrentMetadata", self.TorrentMetadata)) or 0
 
     fts_keyword_search_re = re.compile(r"\w+", re.UNICODE)
 
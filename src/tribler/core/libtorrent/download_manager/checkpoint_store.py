@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
+
+CHECKPOINT_STORE_FILENAME = "checkpoints.db"
+
+logger = logging.getLogger(__name__)
+
+
+def dump_config(config: DownloadConfig) -> str:
+    """
+    Serialize the given download config, without its resume data, which is stored separately.
+    """
+    parser = config.config
+    defaults = parser.defaults()
+    sections = {parser.default_section: dict(defaults)}
+    for section in parser.sections():
+        sections[section] = {key: value for key, value in parser.items(section, raw=True)
+                             if defaults.get(key) != value and (section, key) != ("state", "engineresumedata")}
+    return json.dumps(sections)
+
+
+def load_config(config: DownloadConfig, dumped: str) -> None:
+    """
+    Read a serialized download config into the given download config.
+    """
+    config.config.read_dict(json.loads(dumped))
+
+
+class CheckpointStore:
+    """
+    Store the checkpoints of all downloads in a single SQLite database, instead of in a file per download.
+
+    Every checkpoint holds the download config and the raw bencoded resume data of a single download. Checkpoints are
+    first buffered in memory and then written in a single transaction: the buffer is taken with ``take_pending()`` and
+    ``write()`` can then be called from a worker thread. The database is only created when the first checkpoint is
+    written.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Create a new store for the database at the given path.
+        """
+        self.path = path
+        self.connection: sqlite3.Connection | None = None
+        self.lock = Lock()
+        self.pending: dict[bytes, tuple[str, bytes] | None] = {}  # The unwritten checkpoints, None for removals
+        self.known: set[bytes] = set()  # The infohashes of the loaded and stored checkpoints
+
+    def __contains__(self, infohash: bytes) -> bool:
+        """
+        Whether a checkpoint exists for the given infohash.
+        """
+        if infohash in self.pending:
+            return self.pending[infohash] is not None
+        return infohash in self.known
+
+    def open(self) -> sqlite3.Connection:
+        """
+        Get the connection to the database, create the database if it does not exist yet.
+        """
+        if self.connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS checkpoints "
+                                    "(infohash BLOB PRIMARY KEY, config TEXT NOT NULL, resume_data BLOB NOT NULL)")
+        return self.connection
+
+    def put(self, infohash: bytes, config: DownloadConfig, resume_data: bytes) -> None:
+        """
+        Buffer the checkpoint of the given download, until it is flushed.
+        """
+        self.pending[infohash] = (dump_config(config), resume_data)
+
+    def remove(self, infohash: bytes) -> None:
+        """
+        Buffer the removal of the checkpoint of the given download, until it is flushed.
+        """
+        self.pending[infohash] = None
+
+    def load(self) -> list[tuple[bytes, str, bytes]]:
+        """
+        Load the infohash, serialized config and resume data of all stored checkpoints.
+        """
+        if self.connection is None and not self.path.exists():
+            return []
+        with self.lock:
+            rows = self.open().execute("SELECT infohash, config, resume_data FROM checkpoints").fetchall()
+        self.known.update(infohash for infohash, _, _ in rows)
+        return rows
+
+    def take_pending(self) -> dict[bytes, tuple[str, bytes] | None]:
+        """
+        Take the buffered checkpoints, to write them with ``write()``.
+        """
+        pending, self.pending = self.pending, {}
+        for infohash, checkpoint in pending.items():
+            if checkpoint is None:
+                self.known.discard(infohash)
+            else:
+                self.known.add(infohash)
+        return pending
+
+    def requeue(self, pending: dict[bytes, tuple[str, bytes] | None]) -> None:
+        """
+        Buffer the given checkpoints again, unless they have been replaced in the meantime.
+        """
+        self.pending = pending | self.pending
+
+    def write(self, pending: dict[bytes, tuple[str, bytes] | None]) -> bool:
+        """
+        Write the given checkpoints to the database, in a single transaction.
+
+        :returns: whether the checkpoints were written.
+        """
+        with self.lock:
+            try:
+                connection = self.open()
+                with connection:
+                    connection.executemany("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                                           [(infohash, *checkpoint) for infohash, checkpoint in pending.items()
+                                            if checkpoint is not None])
+                    connection.executemany("DELETE FROM checkpoints WHERE infohash = ?",
+                                           [(infohash,) for infohash, checkpoint in pending.items()
+                                            if checkpoint is None])
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Could not write %d checkpoints: %s", len(pending), str(e))
+                return False
+        return True
+
+    def flush(self) -> None:
+        """
+        Write all buffered checkpoints to the database.
+        """
+        if self.pending:
+            pending = self.take_pending()
+            if not self.write(pending):
+                self.requeue(pending)
+
+    def close(self) -> None:
+        """
+        Write all buffered checkpoints and close the database.
+        """
+        self.flush()
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
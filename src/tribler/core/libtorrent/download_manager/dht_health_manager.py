@@ -11,7 +11,7 @@ from ipv8.taskmanager import TaskManager
 from tribler.core.torrent_checker.healthdataclasses import HealthInfo
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Callable
 
 
 class DHTHealthManager(TaskManager):
@@ -19,18 +19,22 @@ class DHTHealthManager(TaskManager):
     This class manages BEP33 health requests to the libtorrent DHT.
     """
 
-    def __init__(self, lt_session: lt.session) -> None:
+    def __init__(self, lt_session: lt.session, set_packet_inspection: Callable[[bool], None] | None = None) -> None:
         """
         Initialize the DHT health manager.
 
         :param lt_session: The session used to perform health lookups.
+        :param set_packet_inspection: Called with True when the first lookup starts and with False when the last lookup
+                                      ends, to only receive the raw DHT packets of the session while we need them.
         """
         TaskManager.__init__(self)
         self.lookup_futures: dict[bytes, Future[HealthInfo]] = {}  # Map from binary infohash to future
         self.bf_seeders: dict[bytes, bytearray] = {}  # Map from infohash to (final) seeders bloomfilter
         self.bf_peers: dict[bytes, bytearray] = {}  # Map from infohash to (final) peers bloomfilter
         self.outstanding: dict[str, bytes] = {}  # Map from transaction_id to infohash
+        self.transactions: dict[bytes, set[str]] = {}  # Map from infohash to its outstanding transaction_ids
         self.lt_session = lt_session
+        self.set_packet_inspection = set_packet_inspection
 
     def get_health(self, infohash: bytes, timeout: float = 15) -> Awaitable[HealthInfo]:
         """
@@ -42,6 +46,9 @@ class DHTHealthManager(TaskManager):
         if infohash in self.lookup_futures:
             return self.lookup_futures[infohash]
 
+        if not self.lookup_futures and self.set_packet_inspection is not None:
+            self.set_packet_inspection(True)
+
         lookup_future: Future[HealthInfo] = Future()
         self.lookup_futures[infohash] = lookup_future
         self.bf_seeders[infohash] = bytearray(256)
@@ -50,7 +57,7 @@ class DHTHealthManager(TaskManager):
         # Perform a get_peers request. This should result in get_peers responses with the BEP33 bloom filters.
         self.lt_session.dht_get_peers(lt.sha1_hash(bytes(infohash)))
 
-        self.register_task(f"lookup_{hexlify(infohash).decode}", self.finalize_lookup, infohash, delay=timeout)
+        self.register_task(f"lookup_{hexlify(infohash).decode()}", self.finalize_lookup, infohash, delay=timeout)
 
         return lookup_future
 
@@ -60,7 +67,7 @@ class DHTHealthManager(TaskManager):
 
         :param infohash: The infohash of the lookup we finialize.
         """
-        for transaction_id in [key for key, value in self.outstanding.items() if value == infohash]:
+        for transaction_id in self.transactions.pop(infohash, ()):
             self.outstanding.pop(transaction_id, None)
 
         if infohash not in self.lookup_futures:
@@ -76,6 +83,8 @@ class DHTHealthManager(TaskManager):
             self.lookup_futures[infohash].set_result(health)
 
         self.lookup_futures.pop(infohash, None)
+        if not self.lookup_futures and self.set_packet_inspection is not None:
+            self.set_packet_inspection(False)
 
     @staticmethod
     def combine_bloomfilters(bf1: bytearray, bf2: bytearray) -> bytearray:
@@ -87,10 +96,8 @@ class DHTHealthManager(TaskManager):
         :return: A bytearray with the combined bloomfilter.
         """
         final_bf_len = min(len(bf1), len(bf2))
-        final_bf = bytearray(final_bf_len)
-        for bf_index in range(final_bf_len):
-            final_bf[bf_index] = bf1[bf_index] | bf2[bf_index]
-        return final_bf
+        final_bf = int.from_bytes(bf1[:final_bf_len], "big") | int.from_bytes(bf2[:final_bf_len], "big")
+        return bytearray(final_bf.to_bytes(final_bf_len, "big"))
 
     @staticmethod
     def get_size_from_bloomfilter(bf: bytearray) -> int:
@@ -100,20 +107,7 @@ class DHTHealthManager(TaskManager):
         :param bf: The bloom filter of which we estimate the size.
         :return: A rounded integer, approximating the number of items in the filter.
         """
-
-        def tobits(s: bytes) -> list[int]:
-            result = []
-            for num in s:
-                bits = bin(num)[2:]
-                bits = "00000000"[len(bits):] + bits
-                result.extend([int(b) for b in bits])
-            return result
-
-        bits_array = tobits(bytes(bf))
-        total_zeros = 0
-        for bit in bits_array:
-            if bit == 0:
-                total_zeros += 1
+        total_zeros = len(bf) * 8 - int.from_bytes(bf, "big").bit_count()
 
         if total_zeros == 0:
             return 6000  # The maximum capacity of the bloom filter used in BEP33
@@ -130,11 +124,13 @@ class DHTHealthManager(TaskManager):
         :param transaction_id: The ID of the query
         :param infohash: The infohash for which the query was sent.
         """
+        previous = self.outstanding.pop(transaction_id, None)
+        if previous is not None:
+            # Libtorrent may reuse a transaction_id for another infohash.
+            self.transactions[previous].discard(transaction_id)
         if infohash in self.lookup_futures:
             self.outstanding[transaction_id] = infohash
-        elif transaction_id in self.outstanding:
-            # Libtorrent is reusing the transaction_id, and is now using it for a infohash that we're not interested in.
-            self.outstanding.pop(transaction_id, None)
+            self.transactions.setdefault(infohash, set()).add(transaction_id)
 
     def received_bloomfilters(self, transaction_id: str, bf_seeds: bytearray = bytearray(256),  # noqa: B008
                               bf_peers: bytearray = bytearray(256)) -> None:  # noqa: B008
@@ -39,6 +39,7 @@ if TYPE_CHECKING:
 
 Getter = Callable[[Any], Any]
 logger = logging.getLogger(__name__)
+versions = itertools.count(1)  # The versions of the states of all downloads, see Download.mark_changed()
 
 
 class SaveResumeDataError(Exception):
@@ -110,6 +111,7 @@ class AlertHandlerDict(TypedDict):
     add_torrent_alert: list[Callable[[lt.add_torrent_alert], None]]
     torrent_removed_alert: list[Callable[[lt.torrent_removed_alert], None]]
     read_piece_alert: list[Callable[[lt.read_piece_alert], None]]
+    piece_finished_alert: list[Callable[[lt.piece_finished_alert], None]]
 
 
 @lru_cache(maxsize=1)
@@ -160,6 +162,7 @@ class Download(TaskManager):
         self.checkpoint_after_next_hashcheck = False
         self.tracker_status: dict[str, tuple[int, str]] = {}  # {url: (num_peers, status_str)}
         self.piece_hashes_v2: list[bytes | None] = []  # Only populated for pure v2 torrents
+        self.version = next(versions)  # Increases whenever the state of this download changes
 
         self.futures: dict[str, list[tuple[Future, Callable, Getter | None]]] = defaultdict(list)
         self.alert_handlers: dict[str, list[Callable[[lt.torrent_alert], None]]] = defaultdict(list)
@@ -176,7 +179,8 @@ class Download(TaskManager):
             torrent_error_alert=[self.on_torrent_error_alert],
             add_torrent_alert=[self.on_add_torrent_alert],
             torrent_removed_alert=[self.on_torrent_removed_alert],
-            read_piece_alert=[self.on_read_piece_alert]
+            read_piece_alert=[self.on_read_piece_alert],
+            piece_finished_alert=[self.on_piece_finished_alert]
         )))
 
         self.future_added = self.wait_for_alert("add_torrent_alert", lambda a: a.handle)
@@ -267,6 +271,15 @@ class Download(TaskManager):
             # The piece read failed, but we do have a handle. Try again.
             self.handle.read_piece(alert.piece)
 
+    def on_piece_finished_alert(self, alert: lt.piece_finished_alert) -> None:
+        """
+        Callback for a piece that has been downloaded and checked.
+
+        These alerts are only enabled while this download is streaming.
+        """
+        if self.stream is not None:
+            self.stream.on_piece_finished(alert.piece_index)
+
     async def get_torrent_data(self) -> dict[bytes, Any] | None:
         """
         Return torrent data, if the handle is valid and metadata is available.
@@ -446,6 +459,12 @@ class Download(TaskManager):
 
         self.checkpoint()
 
+    def mark_changed(self) -> None:
+        """
+        Give the state of this download a new version, so that it is included in the next incremental state update.
+        """
+        self.version = next(versions)
+
     def get_anon_mode(self) -> bool:
         """
         Get whether this torrent is anonymized.
@@ -474,6 +493,7 @@ class Download(TaskManager):
         """
         Dispatch an alert to the appriopriate registered handlers.
         """
+        self.mark_changed()
         try:
             if alert.category() in [lt.alert.category_t.error_notification, lt.alert.category_t.performance_warning]:
                 self._logger.debug("Got alert: %s", str(alert))
@@ -511,10 +531,10 @@ class Download(TaskManager):
         if alert.state == lt.torrent_status.downloading and self.tdef.torrent_info is None:
             self.post_alert("metadata_received_alert")
 
-    def on_save_resume_data_alert(self, alert: lt.save_resume_data_alert) -> None:  # noqa: PLR0915
+    def on_save_resume_data_alert(self, alert: lt.save_resume_data_alert) -> None:
         """
         Callback for the alert that contains the resume data of a specific download.
-        This resume data will be written to a file on disk.
+        This resume data will be written to the checkpoint store.
         """
         self._logger.debug("On save resume data alert: %s", str(alert))
         if self.checkpoint_disabled:
@@ -566,19 +586,12 @@ class Download(TaskManager):
             save_path = Path(resume_data.save_path).absolute()
             self.tdef.atp.save_path = str(save_path)
         self.tdef.atp.resume_data = resume_data.resume_data
-        self.config.set_engineresumedata(self.tdef.atp)
-
-        # Save it to file
-        basename = hexlify(self.tdef.infohash).decode() + ".conf"
-        Path(self.download_manager.get_checkpoint_dir()).mkdir(parents=True, exist_ok=True)
-        filename = self.download_manager.get_checkpoint_dir() / basename
+        resume_buf = self.config.set_engineresumedata(self.tdef.atp)
         self.config.config["download_defaults"]["name"] = self.tdef.atp.name  # store name (for debugging)
-        try:
-            self.config.write(str(filename))
-        except OSError as e:
-            self._logger.warning("%s: %s", e.__class__.__name__, str(e))
-        else:
-            self._logger.debug("Resume data has been saved to: %s", filename)
+
+        # The checkpoint store writes the checkpoint to disk later, together with the checkpoints of other downloads.
+        self.download_manager.checkpoint_store.put(self.tdef.infohash, self.config, resume_buf)
+        self._logger.debug("Resume data has been saved for: %s", hexlify(self.tdef.infohash).decode())
 
     def on_tracker_reply_alert(self, alert: lt.tracker_reply_alert) -> None:
         """
@@ -738,6 +751,7 @@ class Download(TaskManager):
         old_status = self.get_state().get_status()
 
         self.lt_status = lt_status
+        self.mark_changed()
         state = self.get_state()
 
         # Notify the GUI if the status has changed
@@ -1015,9 +1029,7 @@ class Download(TaskManager):
         if not self.handle or not self.handle.is_valid():
             # Libtorrent hasn't received or initialized this download yet
             # 1. Check if we have data for this infohash already (don't overwrite it if we do!)
-            basename = hexlify(self.tdef.infohash).decode() + ".conf"
-            filename = Path(self.download_manager.get_checkpoint_dir() / basename)
-            if not filename.is_file():
+            if self.tdef.infohash not in self.download_manager.checkpoint_store:
                 # 2. If there is no saved data for this infohash, checkpoint it without data so we do not
                 #    lose it when we crash or restart before the download becomes known.
                 self.post_alert("save_resume_data_alert", {"params": self.tdef.atp})
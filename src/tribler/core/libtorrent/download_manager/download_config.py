@@ -295,11 +295,15 @@ class DownloadConfig:
         return self.config["download_defaults"].getboolean("bootstrap_download",
                                                            fallback=DEFAULTS["download_defaults"]["bootstrap_download"])
 
-    def set_engineresumedata(self, engineresumedata: lt.add_torrent_params) -> None:
+    def set_engineresumedata(self, engineresumedata: lt.add_torrent_params) -> bytes:
         """
         Set the engine resume data dict for this download.
+
+        :returns: the bencoded resume data.
         """
-        self.config["state"]["engineresumedata"] = base64.b64encode(lt.write_resume_data_buf(engineresumedata)).decode()
+        resume_data = lt.write_resume_data_buf(engineresumedata)
+        self.config["state"]["engineresumedata"] = base64.b64encode(resume_data).decode()
+        return resume_data
 
     def get_engineresumedata(self) -> lt.add_torrent_params | None:
         """
@@ -8,15 +8,17 @@ from __future__ import annotations
 import asyncio
 import base64
 import binascii
+import contextlib
 import dataclasses
 import json
 import logging
 import os
 import time
-from asyncio import CancelledError, Future, gather, iscoroutine, shield, sleep, wait_for
+from asyncio import CancelledError, Future, gather, get_running_loop, iscoroutine, shield, sleep, wait_for
 from binascii import hexlify, unhexlify
 from collections import defaultdict
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, TypedDict, cast
@@ -25,9 +27,15 @@ import libtorrent as lt
 from ipv8.taskmanager import TaskManager
 from yarl import URL
 
+from tribler.core.libtorrent.download_manager.checkpoint_store import (
+    CHECKPOINT_STORE_FILENAME,
+    CheckpointStore,
+    load_config,
+)
 from tribler.core.libtorrent.download_manager.download import Download
 from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
 from tribler.core.libtorrent.download_manager.download_state import DownloadState, DownloadStatus
+from tribler.core.libtorrent.download_manager.metainfo_cache import MetainfoCache
 from tribler.core.libtorrent.torrentdef import TorrentDef, best_info_hash
 from tribler.core.libtorrent.uris import get_url, unshorten, url_to_path
 from tribler.core.notifier import Notification, Notifier
@@ -43,7 +51,12 @@ if TYPE_CHECKING:
 SOCKS5_PROXY_DEF = 2
 
 LTSTATE_FILENAME = "lt.state"
+METAINFO_CACHE_DIRNAME = "metainfo_cache"
 METAINFO_CACHE_PERIOD = 5 * 60
+CHECKPOINT_BATCH_SIZE = 64  # The number of checkpoints that are read in parallel at startup
+CHECKPOINT_FLUSH_INTERVAL = 5  # The number of seconds between writes of the buffered checkpoints
+TORRENT_UPDATES_MIN_INTERVAL = 1.0  # The number of seconds between torrent status updates, while torrents change
+TORRENT_UPDATES_MAX_INTERVAL = 5.0  # The number of seconds between torrent status updates, while nothing changes
 DEFAULT_DHT_ROUTERS = [
     ("dht.aelitis.com", 6881),
     ("dht.libtorrent.org", 6881),
@@ -67,6 +80,20 @@ class MetainfoLookup:
     pending: int
 
 
+@dataclasses.dataclass
+class AlertType:
+    """
+    How to process the alerts of a single class, and the number of processed alerts and their processing time.
+    """
+
+    name: str
+    handler: Callable[[Any, int], None] | None
+    infohash_source: str | None  # Where to find the infohash of the download: in "params", in "handle", or nowhere
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
 class MetainfoLookupResult(TypedDict):
     """
     The result of a MetainfoLookup, stored in the metainfo_cache.
@@ -90,15 +117,19 @@ def encode_atp(atp: dict) -> dict:
     return atp
 
 
-def upgrade_checkpoint(config: DownloadConfig) -> None:
+def upgrade_checkpoint(config: DownloadConfig) -> bool:
     """
-    Upgrade checkpoint and write it to disk.
+    Upgrade checkpoint.
+
+    :returns: whether the checkpoint changed and should be written to disk.
     """
     dl_defaults = config.config["download_defaults"]
     if "selected_file_indexes" in dl_defaults:
         indexes = dl_defaults.remove_option("selected_file_indexes")
         if config.get_selected_files() is None and indexes:
             config.set_selected_files(list(map(int, indexes)))
+        return True
+    return False
 
 
 class DownloadManager(TaskManager):
@@ -127,6 +158,7 @@ class DownloadManager(TaskManager):
         self.downloads: dict[bytes, Download] = {}
 
         self.checkpoint_directory = (self.state_dir / "dlcheckpoints")
+        self.checkpoint_store = CheckpointStore(self.checkpoint_directory / CHECKPOINT_STORE_FILENAME)
         self.checkpoints_count = 0
         self.checkpoints_loaded = 0
         self.all_checkpoints_are_loaded = False
@@ -140,6 +172,7 @@ class DownloadManager(TaskManager):
         """
         Dictionary that maps infohashes to cached metainfo items
         """
+        self.metainfo_disk_cache = MetainfoCache(self.state_dir / METAINFO_CACHE_DIRNAME)
 
         self.default_alert_mask = lt.alert.category_t.error_notification | lt.alert.category_t.status_notification | \
                                   lt.alert.category_t.storage_notification | lt.alert.category_t.performance_warning | \
@@ -153,6 +186,22 @@ class DownloadManager(TaskManager):
         self.dht_readiness_timeout = config.get("libtorrent/dht_readiness_timeout")
         self._last_states_list: list[DownloadState] = []
         self.session_stats: dict[int, dict] = {}
+        self.torrent_updates_interval = TORRENT_UPDATES_MIN_INTERVAL
+
+        # The handlers of the alerts that need more than forwarding to their download, by alert class
+        self.alert_handlers: dict[type, Callable[[Any, int], None]] = {}
+        self.alert_types: dict[type, AlertType] = {}
+        self.register_alert_handler(lt.state_update_alert, self.on_state_update_alert)
+        self.register_alert_handler(lt.state_changed_alert, self.on_state_changed_alert)
+        self.register_alert_handler(lt.tracker_reply_alert, self.on_tracker_alert)
+        self.register_alert_handler(lt.tracker_warning_alert, self.on_tracker_alert)
+        self.register_alert_handler(lt.tracker_error_alert, self.on_tracker_alert)
+        self.register_alert_handler(lt.listen_succeeded_alert, self.on_listen_succeeded_alert)
+        self.register_alert_handler(lt.peer_disconnected_alert, self.on_peer_disconnected_alert)
+        self.register_alert_handler(lt.session_stats_alert, self.on_session_stats_alert)
+        self.register_alert_handler(lt.dht_pkt_alert, self.on_dht_pkt_alert)
+        self.dht_packet_inspection = False
+        self.piece_progress_downloads: set[bytes] = set()  # The infohashes of the downloads that are streaming
 
     def _request_session_stats(self) -> None:
         for session in self.ltsessions.values():
@@ -187,11 +236,11 @@ class DownloadManager(TaskManager):
         # Create the checkpoints directory
         self.checkpoint_directory.mkdir(exist_ok=True, parents=True)
 
-        # Register tasks
-        self.register_task("process_alerts", self._task_process_alerts, interval=1, ignore=(Exception, ))
-        self.register_task("request_torrent_updates", self._request_torrent_updates, interval=1)
+        # Register tasks. Alerts are processed when libtorrent notifies us, see _start_alert_pump().
+        self.register_task("request_torrent_updates", self._request_torrent_updates)
         self.register_task("task_cleanup_metacache", self._task_cleanup_metainfo_cache, interval=60, delay=0)
         self.register_task("request_session_stats", self._request_session_stats, interval=5)
+        self.register_task("flush_checkpoints", self.flush_checkpoints, interval=CHECKPOINT_FLUSH_INTERVAL)
         self.register_task("process_advanced_rate_limits", self.process_advanced_rate_limits, interval=300)
 
         self.set_download_states_callback(self.sesscb_states_callback)
@@ -274,6 +323,11 @@ class DownloadManager(TaskManager):
 
         logger.info("Awaiting shutdown task manager...")
         await self.shutdown_task_manager()
+        self.checkpoint_store.close()
+
+        for ltsession in self.ltsessions.values():
+            if ltsession.done() and not ltsession.exception():
+                ltsession.result().set_alert_notify(lambda: None)
 
         if self.dht_health_manager:
             await self.dht_health_manager.shutdown_task_manager()
@@ -360,7 +414,7 @@ class DownloadManager(TaskManager):
             settings["force_proxy"] = True
 
         self.set_session_settings(ltsession, cast("lt.settings_pack", settings))
-        ltsession.set_alert_mask(self.default_alert_mask)
+        ltsession.set_alert_mask(self.get_alert_mask(hops))
 
         if hops == 0:
             self.set_proxy_settings(ltsession, *self.get_libtorrent_proxy_settings())
@@ -417,6 +471,7 @@ class DownloadManager(TaskManager):
             enable_mmap = self.config.get("libtorrent/allow_mmap") and hops < 0
             self.ltsessions[hops] = self.register_executor_task(f"Create session {hops}",
                                                                 self.create_session, actual_hops, enable_mmap)
+            self.ltsessions[hops].add_done_callback(partial(self._start_alert_pump, hops))
 
             if self.dht_readiness_timeout > 0 and self.config.get("libtorrent/dht"):
                 self.dht_ready_tasks[hops] = self.register_task(f"DHT readiness check {hops}",
@@ -447,40 +502,95 @@ class DownloadManager(TaskManager):
         """
         self._map_call_on_ltsessions(hops, "set_max_connections", conns)
 
-    def process_alert(self, alert: lt.alert, hops: int = 0) -> None:  # noqa: C901, PLR0912, PLR0915
+    def _start_alert_pump(self, hops: int, ltsession: Future[lt.session]) -> None:
         """
-        Process a libtorrent alert.
+        Process the alerts of the given (created) session as soon as libtorrent posts them.
+
+        Libtorrent calls the notify function from its own thread, when its alert queue is no longer empty. Therefore,
+        the function only schedules the processing on our event loop.
         """
-        alert_type = alert.__class__.__name__
+        if ltsession.cancelled() or ltsession.exception():
+            return
+        loop = get_running_loop()
 
-        # Periodically, libtorrent will send us a state_update_alert, which contains the torrent status of
-        # all torrents changed since the last time we received this alert.
-        if alert_type == "state_update_alert":
-            for status in cast("lt.state_update_alert", alert).status:
-                infohash = best_info_hash(status.info_hashes, status.info_hash)
-                if infohash not in self.downloads:
-                    logger.debug("Got state_update for unknown torrent %s", hexlify(infohash))
-                    continue
-                self.downloads[infohash].update_lt_status(status)
+        def notify() -> None:
+            with contextlib.suppress(RuntimeError):  # The event loop is closed
+                loop.call_soon_threadsafe(self._process_alerts, hops)
 
-        if alert_type == "state_changed_alert":
-            handle = cast("lt.state_changed_alert", alert).handle
-            infohash = best_info_hash(handle.info_hashes(), handle.info_hash())
-            if infohash not in self.downloads:
-                logger.debug("Got state_change for unknown torrent %s", hexlify(infohash))
-            else:
-                self.downloads[infohash].update_lt_status(handle.status())
-                self.downloads[infohash].process_alert(cast("lt.state_changed_alert", alert), alert_type)
+        ltsession.result().set_alert_notify(notify)
+        self._process_alerts(hops)  # Alerts that were posted before the notify function was set
 
-        if alert_type in ["tracker_reply_alert", "tracker_warning_alert", "tracker_error_alert"]:
-            handle = cast("lt.tracker_alert", alert).handle
-            infohash = best_info_hash(handle.info_hashes(), handle.info_hash())
-            self.downloads[infohash].process_alert(cast("lt.tracker_alert", alert), alert_type)
+    def _process_alerts(self, hops: int) -> None:
+        """
+        Process all alerts that are waiting in the queue of the session for the given number of hops.
+        """
+        for alert in self.ltsessions[hops].result().pop_alerts():
+            try:
+                self.process_alert(alert, hops=hops)
+            except Exception as e:
+                logger.exception("Failed to process %s: %s", alert.__class__.__name__, str(e))
+
+    def register_alert_handler(self, alert_class: type, handler: Callable[[Any, int], None]) -> None:
+        """
+        Call the given handler with every alert of the given class and the number of hops of its session.
+
+        Alerts that belong to a download are still forwarded to the download, after the handler has been called.
+        """
+        self.alert_handlers[alert_class] = handler
+        if alert_class in self.alert_types:
+            self.alert_types[alert_class].handler = handler
+
+    def create_alert_type(self, alert_class: type) -> AlertType:
+        """
+        Determine how to process the alerts of the given class.
+        """
+        infohash_source = None
+        if hasattr(alert_class, "params"):
+            infohash_source = "params"
+        elif hasattr(alert_class, "handle"):
+            infohash_source = "handle"
+        return AlertType(alert_class.__name__, self.alert_handlers.get(alert_class), infohash_source)
+
+    def get_alert_statistics(self) -> dict[str, dict[str, int | float]]:
+        """
+        Get the number of processed alerts and their processing time (in seconds), by alert type.
+        """
+        return {alert_type.name: {"count": alert_type.count,
+                                  "total_time": alert_type.total_time,
+                                  "max_time": alert_type.max_time}
+                for alert_type in self.alert_types.values()}
+
+    def process_alert(self, alert: lt.alert, hops: int = 0) -> None:
+        """
+        Process a libtorrent alert.
+        """
+        alert_class = type(alert)
+        alert_type = self.alert_types.get(alert_class)
+        if alert_type is None:
+            alert_type = self.alert_types[alert_class] = self.create_alert_type(alert_class)
+
+        start = time.perf_counter()
+        try:
+            if alert_type.handler is not None:
+                alert_type.handler(alert, hops)
+            if alert_type.infohash_source is not None:
+                self.forward_alert(alert, alert_type.name, alert_type.infohash_source, hops)
+        finally:
+            elapsed = time.perf_counter() - start
+            alert_type.count += 1
+            alert_type.total_time += elapsed
+            alert_type.max_time = max(alert_type.max_time, elapsed)
 
-        infohash = (best_info_hash(alert.params.info_hashes, alert.params.info_hash) if hasattr(alert, "params")
-                    else (
-            best_info_hash(alert.handle.info_hashes(), alert.handle.info_hash()) if hasattr(alert, "handle") else b""
-        ))
+    def forward_alert(self, alert: lt.alert, alert_type: str, source: str, hops: int) -> None:
+        """
+        Forward an alert to its download, found through the given attribute of the alert.
+        """
+        if source == "params":
+            params = cast("lt.add_torrent_alert | lt.save_resume_data_alert", alert).params
+            infohash = best_info_hash(params.info_hashes, params.info_hash)
+        else:
+            handle = cast("lt.torrent_alert", alert).handle
+            infohash = best_info_hash(handle.info_hashes(), handle.info_hash())
         download = self.downloads.get(infohash)
         if download and download.config.get_hops() == hops:
             if alert_type == "storage_moved_alert":
@@ -499,43 +609,129 @@ class DownloadManager(TaskManager):
                 handle = cast("lt.add_torrent_alert", alert).handle
                 self.ltsessions[hops].add_done_callback(lambda s: s.result().remove_torrent(handle))
 
-        if alert_type == "listen_succeeded_alert":
-            ls_alert = cast("lt.listen_succeeded_alert", alert)
-            self.listen_ports[hops][ls_alert.address] = ls_alert.port
-
-        elif alert_type == "peer_disconnected_alert":
-            self.notifier.notify(Notification.peer_disconnected,
-                                 peer_id=cast("lt.peer_disconnected_alert", alert).pid.to_bytes())
-
-        elif alert_type == "session_stats_alert":
-            ss_alert = cast("lt.session_stats_alert", alert)
-            queued_disk_jobs = ss_alert.values["disk.queued_disk_jobs"]
-            self.queued_write_bytes = ss_alert.values["disk.queued_write_bytes"]
-            num_write_jobs = ss_alert.values["disk.num_write_jobs"]
-            self.lt_session_shutdown_ready[hops] = queued_disk_jobs == self.queued_write_bytes == num_write_jobs == 0
-
-            self.session_stats[hops] = self.session_stats.get(hops, {})
-            self.session_stats[hops].update(ss_alert.values)
-
-        elif alert_type == "dht_pkt_alert" and self.dht_health_manager is not None:
-            # Unfortunately, the Python bindings don't have a direction attribute.
-            # So, we'll have to resort to using the string representation of the alert instead.
-            incoming = str(alert).startswith("<==")
-            decoded = cast("dict[bytes, Any]", lt.bdecode(cast("lt.dht_pkt_alert", alert).pkt_buf))
-            if not decoded:
-                return
+    def on_state_update_alert(self, alert: lt.state_update_alert, hops: int) -> None:
+        """
+        Periodically, libtorrent will send us a state_update_alert, which contains the torrent status of all torrents
+        changed since the last time we received this alert.
+        """
+        statuses = alert.status
+        for status in statuses:
+            infohash = best_info_hash(status.info_hashes, status.info_hash)
+            if infohash not in self.downloads:
+                logger.debug("Got state_update for unknown torrent %s", hexlify(infohash))
+                continue
+            self.downloads[infohash].update_lt_status(status)
+
+        # Request updates less often while nothing changes.
+        self.torrent_updates_interval = (TORRENT_UPDATES_MIN_INTERVAL if statuses
+                                         else min(TORRENT_UPDATES_MAX_INTERVAL, self.torrent_updates_interval * 2))
+
+    def on_state_changed_alert(self, alert: lt.state_changed_alert, hops: int) -> None:
+        """
+        Update the status of the download of which the state changed.
+        """
+        handle = alert.handle
+        infohash = best_info_hash(handle.info_hashes(), handle.info_hash())
+        if infohash not in self.downloads:
+            logger.debug("Got state_change for unknown torrent %s", hexlify(infohash))
+        else:
+            self.downloads[infohash].update_lt_status(handle.status())
+            self.downloads[infohash].process_alert(alert, "state_changed_alert")
+
+    def on_tracker_alert(self, alert: lt.tracker_alert, hops: int) -> None:
+        """
+        Forward a tracker reply, warning, or error to its download.
+        """
+        handle = alert.handle
+        infohash = best_info_hash(handle.info_hashes(), handle.info_hash())
+        self.downloads[infohash].process_alert(alert, alert.__class__.__name__)
+
+    def on_listen_succeeded_alert(self, alert: lt.listen_succeeded_alert, hops: int) -> None:
+        """
+        Store the port that the session for the given number of hops listens on.
+        """
+        self.listen_ports[hops][alert.address] = alert.port
+
+    def on_peer_disconnected_alert(self, alert: lt.peer_disconnected_alert, hops: int) -> None:
+        """
+        Notify that a peer disconnected.
+        """
+        self.notifier.notify(Notification.peer_disconnected, peer_id=alert.pid.to_bytes())
+
+    def on_session_stats_alert(self, alert: lt.session_stats_alert, hops: int) -> None:
+        """
+        Store the session statistics and determine whether the session can safely shut down.
+        """
+        queued_disk_jobs = alert.values["disk.queued_disk_jobs"]
+        self.queued_write_bytes = alert.values["disk.queued_write_bytes"]
+        num_write_jobs = alert.values["disk.num_write_jobs"]
+        self.lt_session_shutdown_ready[hops] = queued_disk_jobs == self.queued_write_bytes == num_write_jobs == 0
+
+        self.session_stats[hops] = self.session_stats.get(hops, {})
+        self.session_stats[hops].update(alert.values)
 
-            # We are sending a raw DHT message - notify the DHTHealthManager of the outstanding request.
-            if not incoming and decoded.get(b"y") == b"q" \
-                    and decoded.get(b"q") == b"get_peers" and decoded[b"a"].get(b"scrape") == 1:
-                self.dht_health_manager.requesting_bloomfilters(decoded[b"t"],
-                                                                decoded[b"a"][b"info_hash"])
+    def on_dht_pkt_alert(self, alert: lt.dht_pkt_alert, hops: int) -> None:
+        """
+        Inspect a raw DHT message for the BEP33 requests and responses of the DHTHealthManager.
+        """
+        if self.dht_health_manager is None or not self.dht_health_manager.lookup_futures:
+            return
+
+        # Unfortunately, the Python bindings don't have a direction attribute.
+        # So, we'll have to resort to using the string representation of the alert instead.
+        incoming = str(alert).startswith("<==")
+        decoded = cast("dict[bytes, Any]", lt.bdecode(alert.pkt_buf))
+        if not decoded:
+            return
+
+        # We are sending a raw DHT message - notify the DHTHealthManager of the outstanding request.
+        if not incoming and decoded.get(b"y") == b"q" \
+                and decoded.get(b"q") == b"get_peers" and decoded[b"a"].get(b"scrape") == 1:
+            self.dht_health_manager.requesting_bloomfilters(decoded[b"t"],
+                                                            decoded[b"a"][b"info_hash"])
+
+        # We received a raw DHT message - decode it and check whether it is a BEP33 message.
+        if incoming and b"r" in decoded and b"BFsd" in decoded[b"r"] and b"BFpe" in decoded[b"r"]:
+            self.dht_health_manager.received_bloomfilters(decoded[b"t"],
+                                                          bytearray(decoded[b"r"][b"BFsd"]),
+                                                          bytearray(decoded[b"r"][b"BFpe"]))
+
+    def set_dht_packet_inspection(self, enabled: bool) -> None:
+        """
+        Enable or disable the dht_pkt_alerts of the session without hops.
+
+        Every DHT packet results in an alert, so we only enable them while the DHTHealthManager has outstanding lookups.
+        """
+        self.dht_packet_inspection = enabled
+        session = self.ltsessions.get(0)
+        if session is not None and session.done() and not session.cancelled() and not session.exception():
+            session.result().set_alert_mask(self.get_alert_mask(0))
+
+    def set_piece_progress(self, infohash: bytes, enabled: bool) -> None:
+        """
+        Enable or disable the piece_finished_alerts for the given download.
+
+        Streams wait for these alerts, so we only enable them for the sessions of downloads that are streaming.
+        """
+        if enabled:
+            self.piece_progress_downloads.add(infohash)
+        else:
+            self.piece_progress_downloads.discard(infohash)
+        for hops, session in self.ltsessions.items():
+            if session.done() and not session.cancelled() and not session.exception():
+                session.result().set_alert_mask(self.get_alert_mask(hops))
 
-            # We received a raw DHT message - decode it and check whether it is a BEP33 message.
-            if incoming and b"r" in decoded and b"BFsd" in decoded[b"r"] and b"BFpe" in decoded[b"r"]:
-                self.dht_health_manager.received_bloomfilters(decoded[b"t"],
-                                                              bytearray(decoded[b"r"][b"BFsd"]),
-                                                              bytearray(decoded[b"r"][b"BFpe"]))
+    def get_alert_mask(self, hops: int) -> int:
+        """
+        Get the categories of the alerts that the session for the given number of hops should post.
+        """
+        alert_mask = self.default_alert_mask
+        if hops == 0 and self.dht_packet_inspection:
+            alert_mask |= lt.alert.category_t.dht_log_notification
+        if any(infohash in self.downloads and self.downloads[infohash].config.get_hops() == hops
+               for infohash in self.piece_progress_downloads):
+            alert_mask |= lt.alert.category_t.piece_progress_notification
+        return alert_mask
 
     async def get_metainfo(self, infohash: bytes, timeout: float = 7, hops: int | None = -1,  # noqa: C901,PLR0912,PLR0915
                            health_check: bool = False, url: str | None = None) -> MetainfoLookupResult | None:
@@ -551,11 +747,23 @@ class DownloadManager(TaskManager):
         :return: The metainfo
         """
         infohash_hex = hexlify(infohash)
+        cached_info = None
+        if infohash not in self.downloads and (health_check or infohash not in self.metainfo_cache):
+            cached_info = await get_running_loop().run_in_executor(None, self.metainfo_disk_cache.get, infohash)
+        # The metainfo may have been retrieved by another request while we were reading the disk cache.
         if infohash in self.metainfo_cache and not health_check:
             logger.info("Returning metainfo from cache for %s", infohash_hex)
             return self.metainfo_cache[infohash]
 
         tdef: TorrentDef | None = None
+        if cached_info is not None and not health_check:
+            logger.info("Returning metainfo from disk cache for %s", infohash_hex)
+            atp = lt.parse_magnet_uri(url) if url and url.startswith("magnet") else lt.add_torrent_params()
+            atp.ti, atp.info_hashes = cached_info, cached_info.info_hashes()
+            self.metainfo_cache[infohash] = MetainfoLookupResult(time=time.time(), tdef=TorrentDef(atp),
+                                                                 seeders=0, leechers=0)
+            return self.metainfo_cache[infohash]
+
         logger.info("Trying to fetch metainfo for %s", infohash_hex)
         if infohash in self.metainfo_requests:
             download = self.metainfo_requests[infohash].download
@@ -571,6 +779,9 @@ class DownloadManager(TaskManager):
                 atp.info_hashes = lt.info_hash_t(lt.sha1_hash(infohash), atp.info_hashes.v2)
             else:
                 atp.info_hashes = lt.info_hash_t(atp.info_hashes.v1, lt.sha256_hash(infohash))
+            if cached_info is not None:
+                # We only have to determine the swarm size, instead of also waiting for the metainfo.
+                atp.ti = cached_info
             tdef = TorrentDef(atp)
             dcfg = DownloadConfig.from_defaults(self.config)
             dcfg.set_hops(hops or self.config.get("libtorrent/download_defaults/number_hops"))
@@ -587,7 +798,8 @@ class DownloadManager(TaskManager):
 
         t_start = time.time()
         try:
-            await wait_for(shield(download.future_metainfo), timeout)
+            if cached_info is None or download.tdef.atp.ti is None:
+                await wait_for(shield(download.future_metainfo), timeout)
         except (CancelledError, TimeoutError) as e:
             logger.warning("%s: %s (timeout=%f)", type(e).__name__, str(e), timeout)
             logger.info("Failed to retrieve metainfo for %s", infohash_hex)
@@ -600,11 +812,14 @@ class DownloadManager(TaskManager):
                 download.set_max_upload_rate(10)
                 await asyncio.sleep(timeout - (time.time() - t_start))
             seeders, leechers = download.get_state().get_num_seeds_peers()
-            self.metainfo_cache[infohash] = MetainfoLookupResult(time=time.time(),
-                                                                 tdef=tdef,
-                                                                 seeders=seeders,
-                                                                 leechers=leechers)
-            return self.metainfo_cache[infohash]
+            result = self.metainfo_cache[infohash] = MetainfoLookupResult(time=time.time(),
+                                                                          tdef=tdef,
+                                                                          seeders=seeders,
+                                                                          leechers=leechers)
+            if download.tdef.atp.ti is not None and cached_info is None:
+                await get_running_loop().run_in_executor(None, self.metainfo_disk_cache.put, infohash,
+                                                         download.tdef.atp.ti)
+            return result
         finally:
             if infohash in self.metainfo_requests:
                 self.metainfo_requests[infohash].pending -= 1
@@ -621,13 +836,21 @@ class DownloadManager(TaskManager):
                 del self.metainfo_cache[info_hash]
 
     async def _request_torrent_updates(self) -> None:
-        for ltsession in self.ltsessions.values():
-            (await ltsession).post_torrent_updates(0xffffffff)
+        """
+        Keep requesting the status of the torrents that changed, less often while nothing changes.
 
-    async def _task_process_alerts(self) -> None:
-        for hops, ltsession in list(self.ltsessions.items()):
-            for alert in (await ltsession).pop_alerts():
-                self.process_alert(alert, hops=hops)
+        A failed request is logged and retried after the interval, so that the torrent updates never stop.
+        """
+        while True:
+            try:
+                if self.downloads:
+                    for ltsession in list(self.ltsessions.values()):
+                        (await ltsession).post_torrent_updates(0xffffffff)
+                else:
+                    self.torrent_updates_interval = TORRENT_UPDATES_MAX_INTERVAL
+            except Exception:
+                self._logger.exception("Failed to request torrent updates")
+            await sleep(self.torrent_updates_interval)
 
     def _map_call_on_ltsessions(self, hops: int | None, funcname: str, *args: Any, **kwargs) -> None:  # noqa: ANN401
         if hops is None:
@@ -670,6 +893,10 @@ class DownloadManager(TaskManager):
                 tdef.atp.trackers = magnet_trackers
                 tdef.atp.peers = magnet_peers
                 tdef.atp.url_seeds = magnet_seeds
+            elif (cached_info := await get_running_loop().run_in_executor(None, self.metainfo_disk_cache.get,
+                                                                           tdef.infohash)) is not None:
+                logger.info("Metainfo found in disk cache")
+                tdef.atp.ti = cached_info
             return await self.start_download(tdef=tdef, config=config)
         if scheme == "file":
             logger.info("File scheme detected")
@@ -765,6 +992,9 @@ class DownloadManager(TaskManager):
                                        remove_content=True, remove_checkpoint=False)
             self.downloads[infohash] = download
 
+        # New downloads change quickly: get their status updates at the highest rate.
+        self.torrent_updates_interval = TORRENT_UPDATES_MIN_INTERVAL
+
         known = {best_info_hash(h.info_hashes(), h.info_hash()): h for h in ltsession.get_torrents()}
         existing_handle = known.get(infohash)
         if existing_handle:
@@ -1063,18 +1293,68 @@ class DownloadManager(TaskManager):
 
     async def load_checkpoints(self) -> None:
         """
-        Load the checkpoint files in the checkpoint directory.
+        Load the checkpoints in the checkpoint store and migrate the checkpoint files in the checkpoint directory.
         """
         self._logger.info("Load checkpoints...")
+        loop = get_running_loop()
+        stored = await loop.run_in_executor(None, self.checkpoint_store.load)
         checkpoint_filenames = sorted(self.get_checkpoint_dir().glob("*.conf"), key=lambda p: len(p.parts[-1]))
-        self.checkpoints_count = len(checkpoint_filenames)
-        for i, filename in enumerate(checkpoint_filenames, start=1):
-            await self.load_checkpoint(filename)
-            self.checkpoints_loaded = i
-            await sleep(0)
+        self.checkpoints_count = len(stored) + len(checkpoint_filenames)
+
+        # Decoding the checkpoints is slow: do it in worker threads, instead of on the event loop.
+        for i in range(0, len(stored), CHECKPOINT_BATCH_SIZE):
+            batch = stored[i:i + CHECKPOINT_BATCH_SIZE]
+            checkpoints = await gather(*[loop.run_in_executor(None, self.read_stored_checkpoint, config, resume_data)
+                                         for _, config, resume_data in batch])
+            for (infohash, _, _), checkpoint in zip(batch, checkpoints, strict=True):
+                if checkpoint is not None and self.is_removed_checkpoint(*checkpoint):
+                    self._logger.info("Removing checkpoint %s of removed download", hexlify(infohash).decode())
+                    self.checkpoint_store.remove(infohash)
+                elif checkpoint is not None:
+                    await self.start_checkpoint(hexlify(infohash).decode(), *checkpoint)
+                self.checkpoints_loaded += 1
+
+        await self.migrate_checkpoints(checkpoint_filenames)
+
         self.all_checkpoints_are_loaded = True
         self._logger.info("Checkpoints are loaded")
 
+    async def migrate_checkpoints(self, checkpoint_filenames: list[Path]) -> None:
+        """
+        Load the given checkpoint files, move them to the checkpoint store and remove them.
+        """
+        loop = get_running_loop()
+        migrated = []
+        for i in range(0, len(checkpoint_filenames), CHECKPOINT_BATCH_SIZE):
+            batch = checkpoint_filenames[i:i + CHECKPOINT_BATCH_SIZE]
+            checkpoints = await gather(*[loop.run_in_executor(None, self.read_checkpoint, filename)
+                                         for filename in batch])
+            for filename, checkpoint in zip(batch, checkpoints, strict=True):
+                if checkpoint is not None:
+                    infohash = TorrentDef(checkpoint[1]).infohash
+                    if infohash not in self.checkpoint_store:
+                        self.checkpoint_store.put(infohash, checkpoint[0], lt.write_resume_data_buf(checkpoint[1]))
+                        await self.start_checkpoint(filename, *checkpoint)
+                    migrated.append(filename)
+                self.checkpoints_loaded += 1
+        if migrated:
+            # Only remove the checkpoint files once their checkpoints are safely stored.
+            pending = self.checkpoint_store.take_pending()
+            if await loop.run_in_executor(None, self.checkpoint_store.write, pending):
+                self._logger.info("Migrated %d checkpoint files to the checkpoint store", len(migrated))
+                for filename in migrated:
+                    filename.unlink(missing_ok=True)
+            else:
+                self.checkpoint_store.requeue(pending)
+
+    async def flush_checkpoints(self) -> None:
+        """
+        Write the buffered checkpoints to the checkpoint store, in a worker thread.
+        """
+        pending = self.checkpoint_store.take_pending()
+        if pending and not await get_running_loop().run_in_executor(None, self.checkpoint_store.write, pending):
+            self.checkpoint_store.requeue(pending)
+
     def resume_from_legacy(self, metainfo: str, filename: str) -> lt.add_torrent_params:
         """
         Generate resume data from the legacy metainfo format. Don't use this unless you are loading a checkpoint!
@@ -1140,32 +1420,77 @@ class DownloadManager(TaskManager):
         """
         Load a checkpoint from a given file name.
         """
+        checkpoint = self.read_checkpoint(filename)
+        if checkpoint is None:
+            return False
+        return await self.start_checkpoint(filename, *checkpoint)
+
+    def read_checkpoint(self, filename: Path | str) -> tuple[DownloadConfig, lt.add_torrent_params] | None:
+        """
+        Read the config and resume data of a checkpoint, or remove the checkpoint if its download was removed.
+
+        This does not touch the downloads or the libtorrent sessions, so it can be called from a worker thread.
+
+        :returns: the config and resume data, or None if the checkpoint cannot be resumed.
+        """
         try:
             config = DownloadConfig.from_defaults(self.config)
             config.read(str(filename), config)
-            upgrade_checkpoint(config)
-            config.write(str(filename))
+            if upgrade_checkpoint(config):
+                config.write(str(filename))
         except Exception:
             self._logger.exception("Could not open checkpoint file %s", filename)
-            return False
+            return None
 
         # Replace the following line with ``resumedata = config.get_engineresumedata()`` to drop legacy
         resumedata = self.load_legacy_checkpoint(config.get_engineresumedata(), config, str(filename))
         if resumedata is None:
             self._logger.exception("Could not open checkpoint file %s, missing resumedata.", filename)
-            return False
+            return None
         resumedata.flags |= int(lt.torrent_flags.no_verify_files)
 
-        tdef = TorrentDef(resumedata)
-
-        if config.get_dest_dir() == "" or tdef.infohash == (b"\x00" * 20):  # removed torrent ignoring
+        if self.is_removed_checkpoint(config, resumedata):
             self._logger.info("Removing checkpoint %s destdir is %s", filename, config.get_dest_dir())
             os.remove(filename)
-            return False
+            return None
+        return config, resumedata
 
+    def read_stored_checkpoint(self, dumped_config: str,
+                               resume_data: bytes) -> tuple[DownloadConfig, lt.add_torrent_params] | None:
+        """
+        Decode the config and resume data of a checkpoint from the checkpoint store.
+
+        This does not touch the downloads or the libtorrent sessions, so it can be called from a worker thread.
+
+        :returns: the config and resume data, or None if the checkpoint cannot be decoded.
+        """
+        try:
+            config = DownloadConfig.from_defaults(self.config)
+            load_config(config, dumped_config)
+            resumedata = lt.read_resume_data(resume_data)
+        except (ValueError, RuntimeError):
+            self._logger.exception("Could not decode stored checkpoint")
+            return None
+        config.config["state"]["engineresumedata"] = base64.b64encode(resume_data).decode()
+        resumedata.flags |= int(lt.torrent_flags.no_verify_files)
+        return config, resumedata
+
+    @staticmethod
+    def is_removed_checkpoint(config: DownloadConfig, resumedata: lt.add_torrent_params) -> bool:
+        """
+        Whether the given checkpoint belongs to a download that was removed.
+        """
+        return config.get_dest_dir() == "" or TorrentDef(resumedata).infohash == (b"\x00" * 20)
+
+    async def start_checkpoint(self, filename: Path | str, config: DownloadConfig,
+                               resumedata: lt.add_torrent_params) -> bool:
+        """
+        Start the download of a checkpoint that was read from the given file name, unless it already exists.
+        """
+        tdef = TorrentDef(resumedata)
         try:
             if self.download_exists(tdef.infohash):
-                self._logger.info("Not resuming checkpoint because download has already been added")
+                self._logger.info("Not resuming checkpoint %s because download has already been added", filename)
             else:
                 download = await self.start_download(tdef=tdef, config=config)
                 if config.get_post_handle_ops() != 0:
@@ -1181,10 +1506,10 @@ class DownloadManager(TaskManager):
         """
         if infohash not in self.downloads:
             try:
-                basename = hexlify(infohash).decode() + ".conf"
-                filename = self.get_checkpoint_dir() / basename
-                self._logger.debug("Removing download checkpoint %s", filename)
-                filename.unlink(missing_ok=True)
+                self._logger.debug("Removing download checkpoint %s", hexlify(infohash))
+                self.checkpoint_store.remove(infohash)
+                # Checkpoint files only remain until they are migrated to the checkpoint store.
+                (self.get_checkpoint_dir() / (hexlify(infohash).decode() + ".conf")).unlink(missing_ok=True)
             except:
                 # Show must go on
                 self._logger.exception("Could not remove state")
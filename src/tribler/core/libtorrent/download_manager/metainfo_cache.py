@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+import os
+from binascii import hexlify
+from collections import OrderedDict
+from threading import RLock
+from typing import TYPE_CHECKING
+
+import libtorrent as lt
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+METAINFO_CACHE_MAX_SIZE = 128 * 1024 * 1024  # The maximum number of bytes of metainfo to keep on disk
+
+logger = logging.getLogger(__name__)
+
+
+class MetainfoCache:
+    """
+    A size-bounded, on-disk cache of the bencoded info dictionaries of torrents, by infohash.
+
+    Every info dictionary is stored in its own file, of which the modification time is its last use. The least recently
+    used files are removed when the cache grows too large. Files that do not match their infohash are removed when
+    they are loaded.
+
+    All methods do file I/O, so they should be called from a worker thread when called from the event loop.
+    """
+
+    def __init__(self, directory: Path, max_size: int = METAINFO_CACHE_MAX_SIZE) -> None:
+        """
+        Create a new cache in the given directory, which is created when the first info dictionary is stored.
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        self.entries: OrderedDict[str, int] | None = None  # The file sizes by file name, least recently used first
+        self.lock = RLock()
+
+    def get_entries(self) -> OrderedDict[str, int]:
+        """
+        Get the cached files, which are read from the cache directory when they are first needed.
+        """
+        if self.entries is None:
+            files = []
+            if self.directory.is_dir():
+                for path in self.directory.glob("*.info"):
+                    stat = path.stat()
+                    files.append((stat.st_mtime, path.name, stat.st_size))
+            self.entries = OrderedDict((name, size) for _, name, size in sorted(files))
+            self.size = sum(self.entries.values())
+        return self.entries
+
+    def get_path(self, infohash: bytes) -> Path:
+        """
+        Get the path of the file for the given infohash.
+        """
+        return self.directory / f"{hexlify(infohash).decode()}.info"
+
+    def get(self, infohash: bytes) -> lt.torrent_info | None:
+        """
+        Load the torrent info of the given infohash, if it is cached.
+        """
+        with self.lock:
+            path = self.get_path(infohash)
+            entries = self.get_entries()
+            if path.name not in entries:
+                return None
+
+            try:
+                info_section = path.read_bytes()
+                torrent_info = lt.load_torrent_buffer(b"d4:info" + info_section + b"e").ti
+            except (OSError, RuntimeError) as e:
+                logger.warning("Removing unreadable metainfo of %s: %s", hexlify(infohash).decode(), str(e))
+                self.remove(infohash)
+                return None
+            if torrent_info is None:
+                logger.warning("Removing metainfo of %s, which holds no torrent info", hexlify(infohash).decode())
+                self.remove(infohash)
+                return None
+
+            info_hashes = torrent_info.info_hashes()
+            if infohash not in (info_hashes.v1.to_bytes(), info_hashes.v2.to_bytes()):
+                logger.warning("Removing metainfo of %s, which does not match its infohash",
+                               hexlify(infohash).decode())
+                self.remove(infohash)
+                return None
+
+            entries.move_to_end(path.name)
+            os.utime(path)
+            return torrent_info
+
+    def put(self, infohash: bytes, torrent_info: lt.torrent_info) -> None:
+        """
+        Store the info dictionary of the given torrent info, and make room for it if the cache is full.
+        """
+        info_section = bytes(torrent_info.info_section())
+        if len(info_section) > self.max_size:
+            return
+
+        with self.lock:
+            path = self.get_path(infohash)
+            entries = self.get_entries()
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first, so that an interrupted write never leaves a truncated file.
+                temp_path = path.with_suffix(".tmp")
+                temp_path.write_bytes(info_section)
+                temp_path.replace(path)
+            except OSError as e:
+                logger.warning("Could not store the metainfo of %s: %s", hexlify(infohash).decode(), str(e))
+                return
+
+            self.size += len(info_section) - entries.pop(path.name, 0)
+            entries[path.name] = len(info_section)
+            while self.size > self.max_size:
+                name, size = entries.popitem(last=False)
+                self.size -= size
+                (self.directory / name).unlink(missing_ok=True)
+
+    def remove(self, infohash: bytes) -> None:
+        """
+        Remove the info dictionary of the given infohash from the cache.
+        """
+        with self.lock:
+            path = self.get_path(infohash)
+            self.size -= self.get_entries().pop(path.name, 0)
+            path.unlink(missing_ok=True)
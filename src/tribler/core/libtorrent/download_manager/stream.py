@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import logging
 import math
-from asyncio import sleep
+from asyncio import Future, get_running_loop, shield, wait_for
+from contextlib import suppress
+from itertools import islice
 from pathlib import Path
+from threading import RLock
 from typing import TYPE_CHECKING, cast
 
 from tribler.core.libtorrent.download_manager.download_state import DownloadStatus
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Hashable
     from io import BufferedReader
     from types import TracebackType
     from typing import Self
@@ -25,6 +28,12 @@ FOOTER_SIZE = 1 * 1024 * 1024
 BUFFER_PERCENT = 0.05
 # Deadlines to be used for pieces that are at the current file cursor position
 DEADLINE_PRIO_MAP = [7, 6, 6, 4, 4, 4, 4, 3, 3, 3, 3, 3, 3, 3, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]
+# The number of pieces to read ahead after a seek or a stall, doubled after every read that did not need to wait
+MIN_READ_AHEAD = 4
+# The maximum number of seconds to wait for a finished piece, before checking the download state again
+PIECE_WAIT_TIMEOUT = 1.0
+# The maximum number of readers of a stream, the oldest reader is stopped when another reader starts
+MAX_CURSORS = 4
 
 
 class NotStreamingError(Exception):
@@ -55,7 +64,11 @@ class Stream:
         self.file_name: Path | None = None
         self.buffer_size: int = 0
         self.piece_length: int = 0
-        self.cursor_pieces: dict[int, list[int]] = {}
+        self.cursor_pieces: dict[Hashable, list[int]] = {}  # The pieces ahead of every reader, oldest reader first
+        self.piece_distances: dict[int, int] | None = None  # The distance to the nearest cursor of prioritized pieces
+        self.lock = RLock()  # Readers are closed from worker threads
+        self.pieces_finished: set[int] = set()  # The pieces that finished since the stream was enabled
+        self.progress: Future[None] | None = None  # Fires when the next piece finishes
 
     async def enable(self, file_index: int = 0,
                      buffer_position: int | None = None, buffer_percent: float = BUFFER_PERCENT,
@@ -69,17 +82,8 @@ class Stream:
         if file_index >= num_files or file_index < 0:
             raise NoAvailableStreamError
 
-        # Set the new file
-        self.file_index = file_index
-        filename = Path(tinfo.file_at(file_index).path)
-        if num_files > 1:
-            filename = filename.relative_to(tinfo.name())
-        self.file_size = tinfo.file_at(file_index).size
-        content_dest = self.download.get_content_dest()
-        self.file_name = (content_dest / filename if tinfo.num_files() > 1
-                          else content_dest)
-        self.buffer_size = int(self.file_size * buffer_percent)
-        self.piece_length = tinfo.piece_length()
+        # Get notified of finished pieces, instead of polling the download state
+        self.download.download_manager.set_piece_progress(self.download.get_def().infohash, True)
 
         # Ensure the download isn't paused
         self.download.resume()
@@ -87,9 +91,19 @@ class Stream:
         # Wait until the download is in the correct state
         status = self.download.get_state().get_status()
         while status not in [DownloadStatus.DOWNLOADING, DownloadStatus.SEEDING]:
-            await sleep(1)
+            with suppress(TimeoutError):
+                await wait_for(self.download.wait_for_alert("state_changed_alert"), PIECE_WAIT_TIMEOUT)
             status = self.download.get_state().get_status()
 
+        # Set the new file, the readers of other files keep reading their own file
+        self.file_index = file_index
+        self.file_size = tinfo.file_at(file_index).size
+        self.file_name = self.get_file_name(file_index)
+        self.buffer_size = int(self.file_size * buffer_percent)
+        self.piece_length = tinfo.piece_length()
+        # The file priority raises all pieces of the file: update all of them on the next priority update
+        self.piece_distances = None
+
         # Give the selected file a high priority
         file_priorities: list[int] = self.download.get_file_priorities()
         file_priorities[file_index] = 7
@@ -121,13 +135,34 @@ class Stream:
         # Wait until completed
         await self.wait_for_pieces(pieces_needed)
 
-    def iter_pieces(self, have: bool | None = None, start_from: int | None = None) -> Generator[int]:
+    def get_file_name(self, file_index: int) -> Path:
         """
-        Generator function that yield the pieces for the active file index.
+        Get the path of the file with the given index on disk.
+        """
+        if file_index == self.file_index and self.file_name is not None:
+            return self.file_name
+        tinfo = cast("lt.torrent_info", self.download.get_def().torrent_info)
+        content_dest = self.download.get_content_dest()
+        if tinfo.num_files() == 1:
+            return content_dest
+        return content_dest / Path(tinfo.file_at(file_index).path).relative_to(tinfo.name())
+
+    def get_file_size(self, file_index: int | None = None) -> int:
+        """
+        Get the size of the file with the given index, or of the active file.
+        """
+        if file_index is None or file_index == self.file_index:
+            return self.file_size
+        return cast("lt.torrent_info", self.download.get_def().torrent_info).file_at(file_index).size
+
+    def iter_pieces(self, have: bool | None = None, start_from: int | None = None,
+                    file_index: int | None = None) -> Generator[int]:
+        """
+        Generator function that yield the pieces for the given file index, or the active file index.
         """
         pieces_have = self.download.get_state().get_pieces_complete()
-        first_piece = self.byte_to_piece(0)
-        last_piece = min(self.byte_to_piece(self.file_size - 1), len(pieces_have) - 1)
+        first_piece = self.byte_to_piece(0, file_index)
+        last_piece = min(self.byte_to_piece(self.get_file_size(file_index) - 1, file_index), len(pieces_have) - 1)
 
         for piece in range(first_piece, last_piece + 1):
             if start_from is not None and piece < start_from:
@@ -135,74 +170,140 @@ class Stream:
             if have is None or (have and pieces_have[piece]) or (not have and not pieces_have[piece]):
                 yield piece
 
+    def on_piece_finished(self, piece: int) -> None:
+        """
+        Wake up the readers that are waiting for a piece to finish.
+        """
+        self.pieces_finished.add(piece)
+        if self.progress is not None:
+            if not self.progress.done():
+                self.progress.set_result(None)
+            self.progress = None
+
+    async def wait_for_progress(self, timeout: float = PIECE_WAIT_TIMEOUT) -> None:
+        """
+        Waits until the next piece finishes, or until the timeout expires.
+        """
+        if self.progress is None:
+            self.progress = Future()
+        with suppress(TimeoutError):
+            await wait_for(shield(self.progress), timeout)
+
     async def wait_for_pieces(self, pieces_needed: list[int]) -> None:
         """
         Waits until the specified pieces have been completed.
         """
         while not self.pieces_complete(pieces_needed):
-            await sleep(1)
+            await self.wait_for_progress()
 
     def pieces_complete(self, pieces: list[int]) -> bool:
         """
         Checks if the specified pieces have been completed.
+
+        The download state is only updated periodically, so we also check the pieces that finished since.
         """
         have = self.download.get_state().get_pieces_complete()
-        return all(have[piece] for piece in pieces)
+        return all(have[piece] or piece in self.pieces_finished for piece in pieces)
 
-    def bytes_to_pieces(self, bytes_begin: int, bytes_end: int) -> list[int]:
+    def bytes_to_pieces(self, bytes_begin: int, bytes_end: int, file_index: int | None = None) -> list[int]:
         """
-        Returns the pieces that represents the given byte range.
+        Returns the pieces that represents the given byte range of the given file, or the active file.
         """
+        file_size = self.get_file_size(file_index)
         pieces_have = self.download.get_state().get_pieces_complete()
-        first_piece = self.byte_to_piece(0)
-        last_piece = min(self.byte_to_piece(self.file_size - 1), len(pieces_have) - 1)
+        first_piece = self.byte_to_piece(0, file_index)
+        last_piece = min(self.byte_to_piece(file_size - 1, file_index), len(pieces_have) - 1)
 
         bytes_begin = max(bytes_begin, 0)
-        bytes_end = min(bytes_end, self.file_size - 1)
-        start_piece = max(self.byte_to_piece(bytes_begin), first_piece)
-        end_piece = min(self.byte_to_piece(bytes_end), last_piece)
+        bytes_end = min(bytes_end, file_size - 1)
+        start_piece = max(self.byte_to_piece(bytes_begin, file_index), first_piece)
+        end_piece = min(self.byte_to_piece(bytes_end, file_index), last_piece)
         return list(range(start_piece, end_piece + 1))
 
-    def byte_to_piece(self, byte_begin: int) -> int:
+    def byte_to_piece(self, byte_begin: int, file_index: int | None = None) -> int:
         """
-        Finds the piece position that begin_bytes is mapped to.
+        Finds the piece position that begin_bytes of the given file, or the active file, is mapped to.
         """
         return (cast("lt.torrent_info", self.download.get_def().torrent_info)
-                .map_file(self.file_index, byte_begin, 0).piece)
+                .map_file(self.file_index if file_index is None else file_index, byte_begin, 0).piece)
+
+    def add_cursor(self, key: Hashable) -> None:
+        """
+        Register a new reader, and stop the oldest readers if there are too many.
+
+        If we seek multiple times in a row, the video player will keep all connections open until the required pieces
+        have been downloaded. By removing their cursors, the read functions of these connections will return b"",
+        causing the DownloadsEndpoint to drop the connections.
+        """
+        with self.lock:
+            self.cursor_pieces[key] = []
+            while len(self.cursor_pieces) > MAX_CURSORS:
+                del self.cursor_pieces[next(iter(self.cursor_pieces))]
+
+    def set_cursor(self, key: Hashable, pieces: list[int]) -> None:
+        """
+        Set the pieces ahead of a registered reader and update the priorities accordingly.
+        """
+        with self.lock:
+            if key in self.cursor_pieces:
+                self.cursor_pieces[key] = pieces
+                self.update_priorities()
+
+    def remove_cursor(self, key: Hashable) -> None:
+        """
+        Unregister a reader, and reset the priorities if it was the last reader.
+        """
+        with self.lock:
+            if self.cursor_pieces.pop(key, None) is None:
+                return
+            if self.cursor_pieces:
+                self.update_priorities()
+            elif self.piece_distances:
+                self.piece_distances = None
+                self.reset_priorities()
 
     def update_priorities(self) -> None:
         """
         Sets the piece priorities and deadlines according to the cursors of the outstanding stream requests.
+
+        Every piece gets the priority and deadline of its nearest cursor, so that the readers take turns in getting
+        their next piece. Only the pieces of which the nearest cursor changed are updated.
         """
-        piece_priorities: list[int] = self.download.get_piece_priorities()
-        if not piece_priorities:
-            return
+        with self.lock:
+            piece_priorities: list[int] = self.download.get_piece_priorities()
+            if not piece_priorities:
+                return
 
-        # Iterate over all pieces that have not yet been downloaded, and determine their appropriate priority/deadline.
-        for piece in self.iter_pieces(have=False):
-            deadline: int | None = None
+            distances: dict[int, int] = {}
             for pieces in self.cursor_pieces.values():
-                if piece in pieces and (deadline is None or pieces.index(piece) < deadline):
-                    deadline = pieces.index(piece)
-                    break
+                for distance, piece in enumerate(pieces):
+                    if distances.get(piece, distance) >= distance:
+                        distances[piece] = distance
 
-            if deadline is not None and deadline < len(DEADLINE_PRIO_MAP):
-                # Starting at the position of the cursor, set priorities according to DEADLINE_PRIO_MAP
-                if piece_priorities[piece] != DEADLINE_PRIO_MAP[deadline]:
-                    self.download.set_piece_deadline(piece, deadline * 10)
-                piece_priorities[piece] = DEADLINE_PRIO_MAP[deadline]
-            elif deadline is not None:
-                # Set the pieces that are within the buffer to a lower priority
-                if piece_priorities[piece] != 1:
-                    self.download.set_piece_deadline(piece, deadline * 10)
-                piece_priorities[piece] = 1
+            if self.piece_distances is None:
+                changed = set(self.iter_pieces(have=False)) | distances.keys()
             else:
-                # All other pieces get the lowest priority
-                if piece_priorities[piece] != 1:
+                changed = {piece for piece in distances.keys() | self.piece_distances.keys()
+                           if distances.get(piece) != self.piece_distances.get(piece)}
+            self.piece_distances = distances
+
+            pieces_have = self.download.get_state().get_pieces_complete()
+            for piece in changed:
+                if pieces_have[piece]:
+                    continue
+                deadline = distances.get(piece)
+                if deadline is None:
+                    # All other pieces get the lowest priority
                     self.download.reset_piece_deadline(piece)
-                piece_priorities[piece] = 1
+                    piece_priorities[piece] = 1
+                else:
+                    # Starting at the position of the cursor, set priorities according to DEADLINE_PRIO_MAP.
+                    # The pieces that are further within the buffer get a lower priority.
+                    self.download.set_piece_deadline(piece, deadline * 10)
+                    piece_priorities[piece] = (DEADLINE_PRIO_MAP[deadline] if deadline < len(DEADLINE_PRIO_MAP)
+                                               else 1)
 
-        self.download.set_piece_priorities(piece_priorities)
+            self.download.set_piece_priorities(piece_priorities)
 
     def reset_priorities(self, pieces: list[int] | None = None, priority: int = 4) -> None:
         """
@@ -223,8 +324,11 @@ class Stream:
         """
         Closes the Stream.
         """
-        self.cursor_pieces.clear()
-        self.reset_priorities()
+        with self.lock:
+            self.cursor_pieces.clear()
+            self.piece_distances = None
+            self.reset_priorities()
+        self.download.download_manager.set_piece_progress(self.download.get_def().infohash, False)
 
 
 class StreamReader:
@@ -233,14 +337,16 @@ class StreamReader:
     stream instance according to read position.
     """
 
-    def __init__(self, stream: Stream, start_offset: int = 0) -> None:
+    def __init__(self, stream: Stream, start_offset: int = 0, file_index: int | None = None) -> None:
         """
-        Creates a new StreamChunk.
+        Creates a new StreamChunk for the given file, or the active file of the stream.
         """
         self._logger = logging.getLogger(self.__class__.__name__)
         self.stream = stream
+        self.file_index = stream.file_index if file_index is None else file_index
         self.file: BufferedReader | None = None
         self.start_offset = self.seek_offset = start_offset
+        self.read_ahead = MIN_READ_AHEAD  # The number of pieces to prioritize after the seek position
 
     async def __aenter__(self) -> Self:
         """
@@ -262,32 +368,39 @@ class StreamReader:
         """
         if self.stream.file_name is None:
             raise NotStreamingError
+        file_name = self.stream.get_file_name(self.file_index)
 
-        while not self.stream.file_name.exists():
-            await sleep(1)
+        loop = get_running_loop()
+        while not await loop.run_in_executor(None, file_name.exists):
+            await self.stream.wait_for_progress()
 
-        self.file = open(self.stream.file_name, "rb")  # noqa: SIM115, ASYNC230
+        self.file = await loop.run_in_executor(None, open, file_name, "rb")
         self.file.seek(self.seek_offset)
+        self.stream.add_cursor(self)
 
-        # If we seek multiple times in a row, the video player will keep all connections open until the required
-        # pieces have been downloaded. This considerably slows down the final and most important request.
-        # To avoid issues, we allow only 1 connection at a time. By clearing cursor_pieces, the read functions of
-        # the other connections will return b"", caused the DownloadsEndpoint to drop the connections.
-        self.stream.cursor_pieces.clear()
+    def get_max_read_ahead(self) -> int:
+        """
+        Get the number of pieces that fit in the buffer of the stream.
+        """
+        return max(math.ceil(self.stream.buffer_size / self.stream.piece_length), 1)
 
     async def seek(self, byte_offset: int) -> None:
         """
         Seeks the stream to the related piece that represents the position byte.
         Also updates the dynamic buffer accordingly.
         """
+        if byte_offset != self.seek_offset:
+            # Focus on the pieces that are needed first, so that playback can resume as soon as possible.
+            self.read_ahead = MIN_READ_AHEAD
+
         # Find and store the pieces that we need at the given offset
-        piece_offset = self.stream.byte_to_piece(byte_offset)
-        num_pieces = math.ceil(self.stream.buffer_size / self.stream.piece_length)
-        pieces = list(self.stream.iter_pieces(have=False, start_from=piece_offset))[:num_pieces]
-        self.stream.cursor_pieces[self.start_offset] = pieces
+        piece_offset = self.stream.byte_to_piece(byte_offset, self.file_index)
+        num_pieces = min(self.read_ahead, self.get_max_read_ahead())
+        pieces = list(islice(self.stream.iter_pieces(have=False, start_from=piece_offset, file_index=self.file_index),
+                             num_pieces))
 
         # Update the torrent priorities
-        self.stream.update_priorities()
+        self.stream.set_cursor(self, pieces)
 
         # Update the file cursor
         if self.file:
@@ -299,25 +412,44 @@ class StreamReader:
         Reads piece_length bytes starting from the current seek position.
         """
         # Do we need to stop reading?
-        if self.start_offset not in self.stream.cursor_pieces or not self.file:
+        if self not in self.stream.cursor_pieces or not self.file:
             return b""
 
         await self.seek(self.seek_offset)
-        piece = self.stream.byte_to_piece(self.seek_offset)
+        piece = self.stream.byte_to_piece(self.seek_offset, self.file_index)
         self._logger.debug("Chunk %s: Get piece %s", self.start_offset, piece)
 
         # Note the even though we're reading piece_length at a time, that doesn't mean that we only need 1 piece.
-        pieces_needed = self.stream.bytes_to_pieces(self.seek_offset, self.seek_offset + self.stream.piece_length)
-        await self.stream.wait_for_pieces(pieces_needed)
+        pieces_needed = self.stream.bytes_to_pieces(self.seek_offset, self.seek_offset + self.stream.piece_length,
+                                                    self.file_index)
+        if self.stream.pieces_complete(pieces_needed):
+            # The pieces arrive in time: buffer further ahead.
+            self.read_ahead = min(2 * self.read_ahead, self.get_max_read_ahead())
+        else:
+            # The pieces are late: focus on the pieces that are needed first.
+            self.read_ahead = MIN_READ_AHEAD
+            await self.stream.wait_for_pieces(pieces_needed)
 
         # Using libtorrent's `read_piece` is too slow for our purposes, so we read the data from disk.
-        result = self.file.read(self.stream.piece_length)
+        result = await get_running_loop().run_in_executor(None, self.read_file, self.seek_offset,
+                                                          self.stream.piece_length)
         self._logger.debug("Chunk %s: Got bytes %s-%s, piecelen: %s",
                            self.start_offset, self.seek_offset, self.seek_offset + len(result),
                            self.stream.piece_length)
-        self.seek_offset = self.file.tell()
+        self.seek_offset += len(result)
         return result
 
+    def read_file(self, offset: int, size: int) -> bytes:
+        """
+        Read at most the given number of bytes from the file, starting from the given offset.
+
+        This blocks on disk I/O: don't call this on the event loop.
+        """
+        if not self.file:
+            return b""
+        self.file.seek(offset)
+        return self.file.read(size)
+
     def close(self) -> None:
         """
         Closes the reader amd unregisters the cursor pieces from the stream instance
@@ -327,6 +459,4 @@ class StreamReader:
             self.file.close()
             self.file = None
 
-        pieces = self.stream.cursor_pieces.pop(self.start_offset, None)
-        if pieces:
-            self.stream.reset_priorities(pieces)
+        self.stream.remove_cursor(self)
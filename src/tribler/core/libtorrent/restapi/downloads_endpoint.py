@@ -5,7 +5,7 @@ import mimetypes
 from asyncio import get_event_loop, shield
 from binascii import hexlify, unhexlify
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, cast
 
 import libtorrent as lt
 from aiohttp import web
@@ -58,6 +58,17 @@ class JSONFilesInfo(TypedDict):
     progress: float
 
 
+class DownloadSnapshot(NamedTuple):
+    """
+    The information of a download, as it was at a given version of the download.
+    """
+
+    version: int
+    tdef: TorrentDef
+    has_metadata: bool
+    info: dict[str, Any]
+
+
 class DownloadsEndpoint(RESTEndpoint):
     """
     This endpoint is responsible for all requests regarding downloads. Examples include getting all downloads,
@@ -74,6 +85,7 @@ class DownloadsEndpoint(RESTEndpoint):
         super().__init__()
         self.download_manager = download_manager
         self.tunnel_community = tunnel_community
+        self.download_snapshots: dict[bytes, DownloadSnapshot] = {}
         self.app.add_routes([
             web.get("", self.get_downloads),
             web.put("", self.add_download),
@@ -199,6 +211,13 @@ class DownloadsEndpoint(RESTEndpoint):
                 "description": "If specified, only return downloads excluding this one",
                 "type": "str",
                 "required": False
+            },
+            {
+                "in": "query",
+                "name": "since",
+                "description": "If specified, only return downloads that changed after this version",
+                "type": "integer",
+                "required": False
             }
         ],
         responses={
@@ -237,7 +256,9 @@ class DownloadsEndpoint(RESTEndpoint):
                         TOTAL: Integer,
                         LOADED: Integer,
                         ALL_LOADED: Boolean,
-                    })
+                    }),
+                    "version": Integer,
+                    "infohashes": [String]
                 }),
             }
         },
@@ -247,9 +268,12 @@ class DownloadsEndpoint(RESTEndpoint):
                     "in bytes. The estimated time assumed is given in seconds.\n\n"
                     "Detailed information about peers and pieces is only requested when the get_peers and/or "
                     "get_pieces flag is set. Note that setting this flag has a negative impact on performance "
-                    "and should only be used in situations where this data is required. "
+                    "and should only be used in situations where this data is required. \n\n"
+                    "Every response contains the version of the most recently changed download. When this version "
+                    "is passed as the since parameter, only the downloads that changed afterwards are returned, "
+                    "together with the infohashes of all downloads."
     )
-    async def get_downloads(self, request: Request) -> RESTResponse:
+    async def get_downloads(self, request: Request) -> RESTResponse:  # noqa: C901
         """
         Return all downloads, both active and inactive.
         """
@@ -265,74 +289,33 @@ class DownloadsEndpoint(RESTEndpoint):
             ALL_LOADED: self.download_manager.all_checkpoints_are_loaded,
         }
 
+        try:
+            since = int(params["since"]) if params.get("since") else None
+        except ValueError:
+            return RESTResponse({"error": {
+                                    "handled": True,
+                                    "message": "since must be an integer"
+                                }}, status=HTTP_BAD_REQUEST)
+        version = since or 0
         result = []
+        infohashes = []
         downloads = self.download_manager.get_downloads()
         for download in downloads:
             if download.hidden:
                 continue
-            state = download.get_state()
-            tdef = download.get_def()
-            hex_infohash = hexlify(tdef.infohash).decode()
+            hex_infohash = hexlify(download.get_def().infohash).decode()
             if params.get("excluded") == hex_infohash:
                 continue
+            infohashes.append(hex_infohash)
 
-            num_seeds, num_peers = state.get_num_seeds_peers()
-            num_connected_seeds, num_connected_peers = download.get_num_connected_seeds_peers()
-
-            tracker_info: list[TrackerStatusDict] = (download.get_tracker_status()
-                                                     if download.handle is not None and download.handle.is_valid()
-                                                     else [])
-            num_seeds_scraped = max([ti.get("seeds", 0) for ti in tracker_info]) if tracker_info else 0
-            num_peers_scraped = max([ti.get("leeches", 0) for ti in tracker_info]) if tracker_info else 0
-            if (num_seeds_scraped + num_peers_scraped) > (num_seeds + num_peers):
-                num_seeds = num_seeds_scraped
-                num_peers = num_peers_scraped
-
-            name = tdef.name
-            status = self._get_extended_status(download)
-
-            info = {
-                "name": name,
-                "progress": state.get_progress(),
-                "infohash": hex_infohash,
-                "speed_down": state.get_current_payload_speed(DOWNLOAD),
-                "speed_up": state.get_current_payload_speed(UPLOAD),
-                "status": status.name,
-                "status_code": status.value,
-                "size": tdef.torrent_info.total_size() if tdef.torrent_info else 0,
-                "eta": state.get_eta(),
-                "num_peers": num_peers,
-                "num_seeds": num_seeds,
-                "num_connected_peers": num_connected_peers,
-                "num_connected_seeds": num_connected_seeds,
-                "all_time_upload": state.all_time_upload,
-                "all_time_download": state.all_time_download,
-                "all_time_ratio": state.get_all_time_ratio(),
-                "last_download": state.get_last_down(),
-                "last_upload": state.get_last_up(),
-                "trackers": tracker_info,
-                "hops": download.config.get_hops(),
-                "anon_download": download.get_anon_mode(),
-                "safe_seeding": download.config.get_safe_seeding(),
-                "upload_limit": download.get_upload_limit(),
-                "download_limit": download.get_download_limit(),
-                "seeding_ratio": download.get_seeding_ratio(),
-                "destination": str(download.config.get_dest_dir()),
-                "completed_dir": str(download.config.get_completed_dir() or ""),
-                "total_pieces": tdef.torrent_info.num_pieces() if tdef.torrent_info else 0,
-                "error": repr(state.get_error()) if state.get_error() else "",
-                "time_added": download.config.get_time_added(),
-                "time_finished": download.tdef.atp.completed_time,
-                # To prevent the queue_position from becoming stale, we get it directly from the download
-                "queue_position": download.get_queue_position(),
-                "auto_managed": download.config.get_auto_managed(),
-                "user_stopped": download.config.get_user_stopped(),
-                "streamable": bool(tdef and tdef.torrent_info
-                                   and any(tdef.torrent_info.file_at(fi).path.endswith(("mp4", "m4v", "mov", "mkv"))
-                                           for fi in range(tdef.torrent_info.num_files())))
-            }
+            info = self.get_download_snapshot(download)
+            version = max(version, download.version)
+            if (unfiltered or params.get("infohash") == hex_infohash) and (get_peers or get_pieces
+                                                                           or get_availability):
+                # Don't modify the snapshot
+                info = dict(info)
+                state = download.get_state()
 
-            if unfiltered or params.get("infohash") == info["infohash"]:
                 # Add peers information if requested
                 if get_peers:
                     info["peers"] = state.get_peer_list(include_have=False)
@@ -344,9 +327,101 @@ class DownloadsEndpoint(RESTEndpoint):
                 # Add availability if requested
                 if get_availability:
                     info["availability"] = state.get_availability()
+            elif since is not None and download.version <= since:
+                continue
 
             result.append(info)
-        return RESTResponse({"downloads": result, "checkpoints": checkpoints})
+
+        # Forget the snapshots of removed downloads
+        if len(self.download_snapshots) > len(infohashes):
+            for infohash in self.download_snapshots.keys() - {unhexlify(h) for h in infohashes}:
+                self.download_snapshots.pop(infohash)
+
+        response = {"downloads": result, "checkpoints": checkpoints, "version": version}
+        if since is not None:
+            response["infohashes"] = infohashes
+        return RESTResponse(response)
+
+    def get_download_snapshot(self, download: Download) -> dict[str, Any]:
+        """
+        Get the information of the given download, which is only gathered again when the download has changed.
+        """
+        tdef = download.get_def()
+        status = self._get_extended_status(download)
+        snapshot = self.download_snapshots.get(tdef.infohash)
+        if snapshot is not None and snapshot.version == download.version:
+            if snapshot.info["status_code"] == status.value:
+                return snapshot.info
+            # The tunnels influence the status, without changing the download itself
+            download.mark_changed()
+
+        # The fields that only depend on the metainfo are only determined once
+        has_metadata = tdef.torrent_info is not None
+        if snapshot is not None and snapshot.tdef is tdef and snapshot.has_metadata == has_metadata:
+            size, total_pieces, streamable = (snapshot.info["size"], snapshot.info["total_pieces"],
+                                              snapshot.info["streamable"])
+        elif tdef.torrent_info is not None:
+            size = tdef.torrent_info.total_size()
+            total_pieces = tdef.torrent_info.num_pieces()
+            streamable = any(tdef.torrent_info.file_at(fi).path.endswith(("mp4", "m4v", "mov", "mkv"))
+                             for fi in range(tdef.torrent_info.num_files()))
+        else:
+            size = total_pieces = 0
+            streamable = False
+
+        state = download.get_state()
+        num_seeds, num_peers = state.get_num_seeds_peers()
+        num_connected_seeds, num_connected_peers = download.get_num_connected_seeds_peers()
+
+        tracker_info: list[TrackerStatusDict] = (download.get_tracker_status()
+                                                 if download.handle is not None and download.handle.is_valid()
+                                                 else [])
+        num_seeds_scraped = max([ti.get("seeds", 0) for ti in tracker_info]) if tracker_info else 0
+        num_peers_scraped = max([ti.get("leeches", 0) for ti in tracker_info]) if tracker_info else 0
+        if (num_seeds_scraped + num_peers_scraped) > (num_seeds + num_peers):
+            num_seeds = num_seeds_scraped
+            num_peers = num_peers_scraped
+
+        info = {
+            "name": tdef.name,
+            "progress": state.get_progress(),
+            "infohash": hexlify(tdef.infohash).decode(),
+            "speed_down": state.get_current_payload_speed(DOWNLOAD),
+            "speed_up": state.get_current_payload_speed(UPLOAD),
+            "status": status.name,
+            "status_code": status.value,
+            "size": size,
+            "eta": state.get_eta(),
+            "num_peers": num_peers,
+            "num_seeds": num_seeds,
+            "num_connected_peers": num_connected_peers,
+            "num_connected_seeds": num_connected_seeds,
+            "all_time_upload": state.all_time_upload,
+            "all_time_download": state.all_time_download,
+            "all_time_ratio": state.get_all_time_ratio(),
+            "last_download": state.get_last_down(),
+            "last_upload": state.get_last_up(),
+            "trackers": tracker_info,
+            "hops": download.config.get_hops(),
+            "anon_download": download.get_anon_mode(),
+            "safe_seeding": download.config.get_safe_seeding(),
+            "upload_limit": download.get_upload_limit(),
+            "download_limit": download.get_download_limit(),
+            "seeding_ratio": download.get_seeding_ratio(),
+            "destination": str(download.config.get_dest_dir()),
+            "completed_dir": str(download.config.get_completed_dir() or ""),
+            "total_pieces": total_pieces,
+            "error": repr(state.get_error()) if state.get_error() else "",
+            "time_added": download.config.get_time_added(),
+            "time_finished": download.tdef.atp.completed_time,
+            # Libtorrent updates the state of all downloads of which the queue position changes
+            "queue_position": download.get_queue_position(),
+            "auto_managed": download.config.get_auto_managed(),
+            "user_stopped": download.config.get_user_stopped(),
+            "streamable": streamable
+        }
+        self.download_snapshots[tdef.infohash] = DownloadSnapshot(download.version, tdef, has_metadata, info)
+        return info
 
     def _post_handle_events(self, download: Download) -> None:
         """
@@ -569,6 +644,7 @@ class DownloadsEndpoint(RESTEndpoint):
             except Exception as e:
                 self._logger.exception(e)
                 return return_handled_exception(e)
+            download.mark_changed()
             return RESTResponse({"modified": True, "infohash": hexlify(download.get_def().infohash).decode()})
 
         if "selected_files" in parameters:
@@ -644,6 +720,7 @@ class DownloadsEndpoint(RESTEndpoint):
                                         "message": "unknown state parameter"
                                     }}, status=HTTP_BAD_REQUEST)
 
+        download.mark_changed()
         return RESTResponse({"modified": True, "infohash": hexlify(download.get_def().infohash).decode()})
 
     @docs(
@@ -981,7 +1058,7 @@ class TorrentStreamResponse(StreamResponse):
 
         start = start or 0
         await stream.enable(self._file_index)
-        reader = StreamReader(stream, start)
+        reader = StreamReader(stream, start, self._file_index)
         await reader.open()
         try:
             writer = await super().prepare(request)
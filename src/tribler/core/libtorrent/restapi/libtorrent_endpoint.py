@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from aiohttp import web
 from aiohttp_apispec import docs
 from ipv8.REST.schema import schema
-from marshmallow.fields import Integer
+from marshmallow.fields import Float, Integer
 
 from tribler.core.restapi.rest_endpoint import RESTEndpoint, RESTResponse
 
@@ -30,7 +30,8 @@ class LibTorrentEndpoint(RESTEndpoint):
         super().__init__()
         self.download_manager = download_manager
         self.app.add_routes([web.get("/settings", self.get_libtorrent_settings),
-                             web.get("/session", self.get_libtorrent_session_info)])
+                             web.get("/session", self.get_libtorrent_session_info),
+                             web.get("/alerts", self.get_libtorrent_alert_statistics)])
 
     @docs(
         tags=["Libtorrent"],
@@ -99,3 +100,23 @@ class LibTorrentEndpoint(RESTEndpoint):
             hop = int(args["hop"])
 
         return RESTResponse({"hop": hop, "session": self.download_manager.session_stats.get(hop, {})})
+
+    @docs(
+        tags=["Libtorrent"],
+        summary="Return the number of processed Libtorrent alerts and their processing time, by alert type.",
+        responses={
+            200: {
+                "description": "Return a dictonary with the processing statistics of every alert type",
+                "schema": schema(LibtorrentAlertsResponse={"alerts": schema(LibtorrentAlertStatistics={
+                    "count": Integer,
+                    "total_time": Float,
+                    "max_time": Float
+                })})
+            }
+        }
+    )
+    async def get_libtorrent_alert_statistics(self, request: Request) -> RESTResponse:
+        """
+        Return the number of processed Libtorrent alerts and their processing time (in seconds), by alert type.
+        """
+        return RESTResponse({"alerts": self.download_manager.get_alert_statistics()})
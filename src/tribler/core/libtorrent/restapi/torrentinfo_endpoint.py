@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from asyncio.exceptions import TimeoutError as AsyncTimeoutError
 from binascii import hexlify
+from contextlib import nullcontext
 from pathlib import Path
 from ssl import SSLError
 from typing import TYPE_CHECKING, Literal, TypedDict, cast, overload
@@ -36,6 +37,7 @@ if TYPE_CHECKING:
     from aiohttp.web_request import Request
 
     from tribler.core.libtorrent.download_manager.download_manager import DownloadManager
+    from tribler.core.torrent_checker.http_client import HttpClientPool
 
 logger = logging.getLogger(__name__)
 
@@ -78,18 +80,21 @@ def recursive_unicode(obj: Iterable, ignore_errors: bool = False) -> Iterable:
 @overload
 async def query_uri(uri: str, connector: BaseConnector | None = None, headers: LooseHeaders | None = None,
                     timeout: ClientTimeout | None = None, return_json: Literal[False] = False,
-                    valid_cert: bool = True) -> bytes: ...
+                    valid_cert: bool = True, *, session: ClientSession | None = None) -> bytes: ...
 
 @overload
 async def query_uri(uri: str, connector: BaseConnector | None = None, headers: LooseHeaders | None = None,
                     timeout: ClientTimeout | None = None, return_json: Literal[True] = True,
-                    valid_cert: bool = True) -> dict: ...
+                    valid_cert: bool = True, *, session: ClientSession | None = None) -> dict: ...
 
-async def query_uri(uri: str, connector: BaseConnector | None = None, headers: LooseHeaders | None = None,
+async def query_uri(uri: str, connector: BaseConnector | None = None, headers: LooseHeaders | None = None,  # noqa: PLR0913
                     timeout: ClientTimeout | None = None, return_json: bool = False,
-                    valid_cert: bool = True) -> bytes | dict:
+                    valid_cert: bool = True, *, session: ClientSession | None = None) -> bytes | dict:
     """
     Retrieve the response for the given aiohttp context.
+
+    If a (shared) session is given, it is used and left open. Otherwise, a new session is created for the given
+    connector.
     """
     kwargs: dict = {"headers": headers}
     if timeout:
@@ -97,8 +102,8 @@ async def query_uri(uri: str, connector: BaseConnector | None = None, headers: L
         # actual value has been passed to this function.
         kwargs["timeout"] = timeout
 
-    async with ClientSession(connector=connector, raise_for_status=True) as session, \
-            await session.get(uri, ssl=valid_cert, **kwargs) as response:
+    async with (nullcontext(session) if session else ClientSession(connector=connector)) as client, \
+            await client.get(uri, ssl=valid_cert, raise_for_status=True, **kwargs) as response:
         if return_json:
             return await response.json(content_type=None)
         return await response.read()
@@ -117,6 +122,7 @@ class TorrentInfoEndpoint(RESTEndpoint):
         """
         super().__init__()
         self.download_manager = download_manager
+        self.http_clients: HttpClientPool | None = None
         self.app.add_routes([web.post("/uri", self.get_torrent_info),
                              web.put("/file", self.get_torrent_info_from_file)])
 
@@ -219,10 +225,11 @@ class TorrentInfoEndpoint(RESTEndpoint):
                                     }}, status=HTTP_INTERNAL_SERVER_ERROR)
         elif scheme in ("http", "https"):
             try:
+                session = self.http_clients.get_session() if self.http_clients else None
                 try:
-                    response = await query_uri(uri)
+                    response = await query_uri(uri, session=session)
                 except ClientConnectorCertificateError:
-                    response = await query_uri(uri, valid_cert=False)
+                    response = await query_uri(uri, valid_cert=False, session=session)
                     valid_cert = False
             except (ServerConnectionError, ClientResponseError, SSLError, ClientConnectorError,
                     AsyncTimeoutError, ValueError) as e:
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import logging
+import time
 import typing
+from asyncio import ensure_future, get_event_loop, iscoroutine
 from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
+from threading import Lock
 
 from ipv8.messaging.anonymization.tunnel import Circuit
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Callable
+    from asyncio import AbstractEventLoop, Future
+    from collections.abc import Callable, Iterable
+
+NOTIFIER_MAX_PENDING = 10000  # The maximum number of undelivered notifications per asynchronous observer
+
+logger = logging.getLogger(__name__)
 
 
 class Desc(typing.NamedTuple):
@@ -53,6 +63,116 @@ class Notification(Enum):
     ask_add_download = Desc("ask_add_download", ["uri"], [str])
 
 
+# The argument names of every notification, to validate notifications without building sets
+arguments = {notification: frozenset(notification.value.fields) for notification in Notification}
+
+
+class NotificationStatsDict(typing.TypedDict):
+    """
+    The statistics of a single notification topic.
+    """
+
+    count: int
+    rate: float
+    handler_time: float
+    max_handler_time: float
+
+
+@dataclass
+class NotificationStats:
+    """
+    The number of notifications of a topic and the time spent in their handlers.
+    """
+
+    count: int = 0
+    handler_time: float = 0.0
+    max_handler_time: float = 0.0
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def record(self, count: int, handler_time: float) -> None:
+        """
+        Record the given number of notifications, which took the given number of seconds to handle.
+
+        Notifications may be recorded by any thread, concurrently with the event loop.
+        """
+        with self.lock:
+            self.count += count
+            self.handler_time += handler_time
+            self.max_handler_time = max(self.max_handler_time, handler_time)
+
+
+class AsyncObserver:
+    """
+    An observer that is called on the event loop, instead of on the stack of the notifying thread.
+
+    Observers may be coroutine functions. Notifications are dropped while too many notifications are undelivered.
+    """
+
+    def __init__(self, notifier: Notifier, observer: Callable[..., typing.Any], loop: AbstractEventLoop,
+                 topic: Notification | None = None, max_pending: int = NOTIFIER_MAX_PENDING) -> None:
+        """
+        Create a new asynchronous wrapper of the given observer of the given topic, or of all topics for delegates.
+        """
+        self.notifier = notifier
+        self.observer = observer
+        self.loop = loop
+        self.topic = topic
+        self.max_pending = max_pending
+        self.pending = 0
+        self.dropped = 0
+        self.lock = Lock()
+        self.tasks: set[Future] = set()  # The event loop only keeps weak references to running tasks
+
+    def __call__(self, *args: typing.Any, **kwargs) -> None:  # noqa: ANN401
+        """
+        Schedule the delivery of a single notification.
+        """
+        self.schedule([(args, kwargs)])
+
+    def schedule(self, calls: list[tuple[tuple, dict]]) -> None:
+        """
+        Schedule the delivery of the given notifications (positional and keyword arguments), in a single callback.
+        """
+        with self.lock:
+            room = self.max_pending - self.pending
+            if len(calls) > room:
+                self.dropped += len(calls) - room
+                calls = calls[:room]
+            self.pending += len(calls)
+        if calls:
+            self.loop.call_soon_threadsafe(self.deliver, calls)
+
+    def done(self, task: Future | None = None) -> None:
+        """
+        Mark a notification as delivered.
+        """
+        self.tasks.discard(task)
+        with self.lock:
+            self.pending -= 1
+
+    def deliver(self, calls: list[tuple[tuple, dict]]) -> None:
+        """
+        Call the observer for the given notifications.
+        """
+        if self.dropped:
+            logger.warning("Dropped %d notifications for a slow observer %s", self.dropped, self.observer)
+            self.dropped = 0
+        for args, kwargs in calls:
+            start = time.perf_counter()
+            try:
+                result = self.observer(*args, **kwargs)
+            except Exception:
+                logger.exception("Observer %s failed", self.observer)
+                result = None
+            if iscoroutine(result):
+                task = ensure_future(result)
+                self.tasks.add(task)
+                task.add_done_callback(self.done)
+            else:
+                self.done()
+            self.notifier.stats[self.topic or args[0]].record(0, time.perf_counter() - start)
+
+
 class Notifier:
     """
     The class responsible for managing and calling observers of global Tribler events.
@@ -64,23 +184,81 @@ class Notifier:
         """
         self.observers: dict[Notification, list[Callable[..., None]]] = defaultdict(list)
         self.delegates: set[Callable[..., None]] = set()
+        self.stats = {notification: NotificationStats() for notification in Notification}
+        self.started = time.monotonic()
 
-    def add(self, topic: Notification, observer: Callable[..., None]) -> None:
+    def add(self, topic: Notification, observer: Callable[..., typing.Any], asynchronous: bool = False) -> None:
         """
         Add an observer for the given Notification type.
+
+        Asynchronous observers are called on the event loop of the calling thread, and may be coroutine functions.
         """
-        self.observers[topic].append(observer)
+        self.observers[topic].append(AsyncObserver(self, observer, get_event_loop(), topic)
+                                     if asynchronous else observer)
 
-    def notify(self, topic: Notification | str, /, **kwargs) -> None:
+    def add_delegate(self, delegate: Callable[..., typing.Any], asynchronous: bool = False) -> None:
         """
-        Notify all observers that have subscribed to the given topic.
+        Add a delegate that is called for all notifications, with the notification as its first argument.
+        """
+        self.delegates.add(AsyncObserver(self, delegate, get_event_loop()) if asynchronous else delegate)
+
+    def get_stats(self) -> dict[str, NotificationStatsDict]:
         """
-        notification = getattr(Notification, topic) if isinstance(topic, str) else topic
-        topic_name, args, types = notification.value
-        if set(args) ^ set(kwargs.keys()):
+        Get the rate (per second) of every notified topic and the time spent in its handlers.
+        """
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {notification.value.name: NotificationStatsDict(count=stats.count,
+                                                               rate=stats.count / elapsed,
+                                                               handler_time=stats.handler_time,
+                                                               max_handler_time=stats.max_handler_time)
+                for notification, stats in self.stats.items() if stats.count}
+
+    @staticmethod
+    def validate(notification: Notification, kwargs: dict[str, typing.Any]) -> None:
+        """
+        Check if the given arguments match the arguments of the given notification.
+        """
+        if kwargs.keys() != arguments[notification]:
+            topic_name, args, types = notification.value
             message = f"{topic_name} expecting arguments {args} (of types {types}) but received {kwargs}"
             raise ValueError(message)
-        for observer in self.observers[notification]:
+
+    def notify(self, topic: Notification | str, /, **kwargs) -> None:
+        """
+        Notify all observers that have subscribed to the given topic.
+        """
+        notification = topic if isinstance(topic, Notification) else Notification[topic]
+        self.validate(notification, kwargs)
+        start = time.perf_counter()
+        for observer in self.observers.get(notification, ()):
             observer(**kwargs)
         for delegate in self.delegates:
             delegate(notification, **kwargs)
+        self.stats[notification].record(1, time.perf_counter() - start)
+
+    def notify_batch(self, topic: Notification | str, batch: Iterable[dict[str, typing.Any]]) -> None:
+        """
+        Notify all observers that have subscribed to the given topic of multiple notifications.
+
+        Asynchronous observers receive the entire batch in a single callback on the event loop.
+        """
+        notification = topic if isinstance(topic, Notification) else Notification[topic]
+        batch = list(batch)
+        for kwargs in batch:
+            self.validate(notification, kwargs)
+        if not batch:
+            return
+        start = time.perf_counter()
+        for observer in self.observers.get(notification, ()):
+            if isinstance(observer, AsyncObserver):
+                observer.schedule([((), kwargs) for kwargs in batch])
+            else:
+                for kwargs in batch:
+                    observer(**kwargs)
+        for delegate in self.delegates:
+            if isinstance(delegate, AsyncObserver):
+                delegate.schedule([((notification,), kwargs) for kwargs in batch])
+            else:
+                for kwargs in batch:
+                    delegate(notification, **kwargs)
+        self.stats[notification].record(len(batch), time.perf_counter() - start)
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import time
-from asyncio import CancelledError, Event, Future, Queue
+from asyncio import FIRST_COMPLETED, CancelledError, Event, Future, ensure_future, sleep, wait
+from collections import OrderedDict
 from contextlib import suppress
 from importlib.metadata import PackageNotFoundError, version
+from itertools import count
 from traceback import format_exception
 from typing import TYPE_CHECKING, TypedDict
 
@@ -17,6 +19,8 @@ from tribler.core.notifier import Notification, Notifier
 from tribler.core.restapi.rest_endpoint import RESTEndpoint, RESTResponse
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from aiohttp.web_request import Request
     from ipv8.messaging.anonymization.tunnel import Circuit
 
@@ -33,6 +37,13 @@ topics_to_send_to_gui = [
     Notification.report_config_error,
     Notification.ask_add_download,
 ]
+# The topics of which only the last message per infohash is sent, if multiple messages are waiting to be sent
+coalesced_topics = {
+    Notification.torrent_status_changed.value.name,
+    Notification.torrent_health_updated.value.name,
+}
+EVENTS_BUFFER_SIZE = 1000  # The maximum number of messages waiting to be sent per connection
+EVENTS_BATCH_INTERVAL = 0.05  # The number of seconds to collect messages, to send them in a single write
 
 
 class MessageDict(TypedDict):
@@ -44,6 +55,51 @@ class MessageDict(TypedDict):
     kwargs: dict[str, str]
 
 
+class EventSubscriber:
+    """
+    A connection to the events endpoint, with its own buffer of encoded messages that are waiting to be sent.
+
+    When the buffer is full, the oldest message is dropped. Waiting messages of coalesced topics are replaced by newer
+    messages for the same infohash.
+    """
+
+    def __init__(self, topics: set[str] | None = None, max_size: int = EVENTS_BUFFER_SIZE) -> None:
+        """
+        Create a new subscriber to the given topics, or to all topics.
+        """
+        self.topics = topics
+        self.max_size = max_size
+        self.buffer: OrderedDict[Hashable, bytes] = OrderedDict()
+        self.counter = count()  # The keys of the messages that are not coalesced
+        self.dropped = 0
+        self.ready = Event()
+
+    def put(self, topic: str, key: Hashable | None, message: bytes) -> None:
+        """
+        Buffer an encoded message of the given topic, replacing the waiting message with the same key.
+        """
+        if self.topics is not None and topic not in self.topics:
+            return
+        if key is None:
+            key = next(self.counter)
+        else:
+            self.buffer.pop(key, None)
+        self.buffer[key] = message
+        if len(self.buffer) > self.max_size:
+            self.buffer.popitem(last=False)
+            self.dropped += 1
+        self.ready.set()
+
+    def take(self) -> bytes:
+        """
+        Take all waiting messages, as a single chunk.
+        """
+        messages = b"".join(self.buffer.values())
+        self.buffer.clear()
+        self.ready.clear()
+        return messages
+
+
 class EventsEndpoint(RESTEndpoint):
     """
     Important events in Tribler are returned over the events endpoint. This connection is held open. Each event is
@@ -59,15 +115,13 @@ class EventsEndpoint(RESTEndpoint):
         """
         self.shutdown_event = Event()
         super().__init__()
-        self.events_responses: list[web.StreamResponse] = []
+        self.subscribers: list[EventSubscriber] = []
         self.undelivered_error: Exception | None = None
         self.public_key = public_key
         self.notifier = notifier
-        self.queue: Queue[MessageDict] = Queue()
-        self.register_task("Process queue", self.process_queue)
 
         notifier.add(Notification.circuit_removed, self.on_circuit_removed)
-        notifier.delegates.add(self.on_notification)
+        notifier.add_delegate(self.on_notification, asynchronous=True)
 
         self.app.add_routes([web.get("", self.get_events),
                              web.get("/info", self.get_info)])
@@ -112,7 +166,7 @@ class EventsEndpoint(RESTEndpoint):
             v = "git"
         return {
             "topic": Notification.events_start.value.name,
-            "kwargs": {"public_key": self.public_key or "", "version": v, "sessions": str(len(self.events_responses))}
+            "kwargs": {"public_key": self.public_key or "", "version": v, "sessions": str(len(self.subscribers))}
         }
 
     def error_message(self, reported_error: Exception) -> MessageDict:
@@ -144,7 +198,7 @@ class EventsEndpoint(RESTEndpoint):
         """
         Whether the GUI has responded before.
         """
-        return bool(self.events_responses)
+        return bool(self.subscribers)
 
     def should_skip_message(self, message: MessageDict) -> bool:
         """
@@ -163,25 +217,12 @@ class EventsEndpoint(RESTEndpoint):
 
     def send_event(self, message: MessageDict) -> None:
         """
-        Put event message to a queue to be sent to GUI.
-        """
-        if not self.should_skip_message(message):
-            self.queue.put_nowait(message)
-
-    async def process_queue(self) -> None:
+        Encode an event message once and buffer it for every connection to the GUI.
         """
-        Get all failed messages in the queue and send them to the GUI.
-        """
-        while True:
-            message = await self.queue.get()
-            if not self.should_skip_message(message):
-                await self._write_data(message)
+        if self.should_skip_message(message):
+            return
 
-    async def _write_data(self, message: MessageDict) -> None:
-        """
-        Write data over the event socket if it's open.
-        """
-        self._logger.debug("Write message: %s", str(message))
+        self._logger.debug("Send message: %s", str(message))
         try:
             message_bytes = self.encode_message(message)
         except Exception as e:
@@ -189,17 +230,44 @@ class EventsEndpoint(RESTEndpoint):
             self._logger.exception("%s: %s", str(e), repr(message))
             return
 
-        processed_responses = []
-        for response in self.events_responses:
-            try:
-                await response.write(message_bytes)
-                # by creating the list with processed responses we want to remove responses with
-                # ConnectionResetError from `self.events_responses`:
-                processed_responses.append(response)
-            except ClientConnectionResetError as e:
-                # The connection was closed by GUI
-                self._logger.warning(e, exc_info=True)
-        self.events_responses = processed_responses
+        topic = message.get("topic", "message")
+        key = (topic, message["kwargs"].get("infohash")) if topic in coalesced_topics else None
+        for subscriber in self.subscribers:
+            subscriber.put(topic, key, message_bytes)
+
+    async def write_messages(self, response: web.StreamResponse, subscriber: EventSubscriber) -> None:
+        """
+        Write the messages of the given subscriber to its connection, until we shut down or the connection is closed.
+
+        Messages that arrive shortly after each other are written together. Waiting messages are still written when
+        we shut down.
+        """
+        shutdown = ensure_future(self.shutdown_event.wait())
+        ready = None
+        try:
+            while True:
+                ready = ensure_future(subscriber.ready.wait())
+                await wait([ready, shutdown], return_when=FIRST_COMPLETED)
+                if shutdown.done():
+                    messages = subscriber.take()
+                    if messages:
+                        with suppress(ClientConnectionResetError):
+                            await response.write(messages)
+                    return
+                await sleep(EVENTS_BATCH_INTERVAL)
+                if subscriber.dropped:
+                    self._logger.warning("Dropped %d messages for a slow connection", subscriber.dropped)
+                    subscriber.dropped = 0
+                try:
+                    await response.write(subscriber.take())
+                except ClientConnectionResetError as e:
+                    # The connection was closed by GUI
+                    self._logger.warning(e, exc_info=True)
+                    return
+        finally:
+            shutdown.cancel()
+            if ready is not None:
+                ready.cancel()
 
     def on_tribler_exception(self, reported_error: Exception) -> None:
         """
@@ -236,6 +304,13 @@ class EventsEndpoint(RESTEndpoint):
     @docs(
         tags=["General"],
         summary="Open an EventStream for receiving Tribler events.",
+        parameters=[{
+            "in": "query",
+            "name": "topics",
+            "description": "Comma-separated topics to receive, all topics are received if this is not specified",
+            "type": "string",
+            "required": False
+        }],
         responses={
             200: {
                 "schema": schema(EventsResponse={"type": marshmallow.fields.String, "event": marshmallow.fields.Dict})
@@ -266,10 +341,12 @@ class EventsEndpoint(RESTEndpoint):
             self.undelivered_error = None
             await response.write(self.encode_message(self.error_message(error)))
 
-        self.events_responses.append(response)
+        topics = set(request.query["topics"].split(",")) if request.query.get("topics") else None
+        subscriber = EventSubscriber(topics)
+        self.subscribers.append(subscriber)
 
         try:
-            await self.shutdown_event.wait()
+            await self.write_messages(response, subscriber)
         except CancelledError:
             self._logger.warning("Event stream was canceled")
         else:
@@ -283,6 +360,6 @@ class EventsEndpoint(RESTEndpoint):
 
         # See: https://github.com/Tribler/tribler/pull/7906
         with suppress(ValueError):
-            self.events_responses.remove(response)
+            self.subscribers.remove(subscriber)
 
         return response
@@ -9,14 +9,23 @@ import ipv8_rust_tunnels
 from aiohttp import web
 from aiohttp_apispec import docs, json_schema
 from ipv8.REST.schema import schema
-from marshmallow.fields import Integer, String
+from marshmallow.fields import Boolean, Dict, Float, Integer, List, Nested, String
 
-from tribler.core.restapi.rest_endpoint import HTTP_NOT_FOUND, MAX_REQUEST_SIZE, RESTEndpoint, RESTResponse
+from tribler.core.restapi.rest_endpoint import (
+    HTTP_BAD_REQUEST,
+    HTTP_NOT_FOUND,
+    MAX_REQUEST_SIZE,
+    RESTEndpoint,
+    RESTResponse,
+)
 
 if TYPE_CHECKING:
     from ipv8.messaging.interfaces.statistics_endpoint import StatisticsEndpoint as IPv8StatsEndpoint
 
     from tribler.core.content_discovery.community import ContentDiscoveryCommunity
+    from tribler.core.database.cache import SearchCacheStatsDict
+    from tribler.core.database.profiler import QueryStatsDict
+    from tribler.core.notifier import NotificationStatsDict
     from tribler.core.session import Session
 
 
@@ -64,11 +73,24 @@ class TriblerStatsDict(TypedDict):
     peers: NotRequired[int]
     db_size: NotRequired[int]
     num_torrents: NotRequired[int]
+    search_cache: NotRequired[SearchCacheStatsDict]
     endpoint_version: NotRequired[str | None]
     socks5_sessions: NotRequired[list[Socks5StatsDict]]
     libtorrent: NotRequired[LibtorrentStatsDict]
 
 
+class QueryStatisticsDict(TypedDict):
+    """
+    Database query profiling statistics.
+    """
+
+    enabled: bool
+    queries: list[QueryStatsDict]
+
+
+DEFAULT_QUERY_STATS_LIMIT = 10
+
+
 class StatisticsEndpoint(RESTEndpoint):
     """
     This endpoint is responsible for handing requests regarding statistics in Tribler.
@@ -86,6 +108,8 @@ class StatisticsEndpoint(RESTEndpoint):
 
         self.app.add_routes([web.get("/tribler", self.get_tribler_stats),
                              web.get("/ipv8", self.get_ipv8_stats),
+                             web.get("/queries", self.get_query_stats),
+                             web.get("/notifications", self.get_notification_stats),
                              web.put("/dirspace", self.get_dirspace_stats)])
 
     @docs(
@@ -96,6 +120,11 @@ class StatisticsEndpoint(RESTEndpoint):
                 "schema": schema(TriblerStatisticsResponse={
                     "tribler_statistics": schema(TriblerStatistics={
                         "database_size": Integer,
+                        "search_cache": schema(SearchCacheStats={
+                            "hits": Integer,
+                            "misses": Integer,
+                            "size": Integer
+                        }),
                         "torrent_queue_stats": [
                             schema(TorrentQueueStats={
                                 "failed": Integer,
@@ -121,7 +150,8 @@ class StatisticsEndpoint(RESTEndpoint):
 
         if self.session and self.session.mds:
             stats_dict.update({"db_size": self.session.mds.get_db_file_size(),
-                               "num_torrents": self.session.mds.get_num_torrents()})
+                               "num_torrents": self.session.mds.get_num_torrents(),
+                               "search_cache": self.session.mds.search_cache.get_statistics()})
 
         if self.session and self.session.download_manager:
             lt_stats: LibtorrentStatsDict = LibtorrentStatsDict(
@@ -183,6 +213,85 @@ class StatisticsEndpoint(RESTEndpoint):
             }
         return RESTResponse({"ipv8_statistics": stats_dict})
 
+    @docs(
+        tags=["General"],
+        summary="Return the database query shapes with the highest mean wall time.",
+        parameters=[{
+            "in": "query",
+            "name": "limit",
+            "description": "The maximum number of query shapes to return.",
+            "type": "integer",
+            "required": False
+        }],
+        responses={
+            200: {
+                "schema": schema(QueryStatisticsResponse={
+                    "query_statistics": schema(QueryStatistics={
+                        "enabled": Boolean,
+                        "queries": [
+                            schema(QueryShapeStatistics={
+                                "shape": String,
+                                "calls": Integer,
+                                "total_time": Float,
+                                "mean_time": Float,
+                                "max_time": Float,
+                                "mean_rows": Float,
+                                "sql": String,
+                                "plan": List(String)
+                            })
+                        ]
+                    })
+                })
+            }
+        }
+    )
+    def get_query_stats(self, request: web.Request) -> RESTResponse:
+        """
+        Return the statistics of the database queries, if query profiling is enabled.
+
+        Profiling is enabled through the ``database/profile_queries`` setting.
+        """
+        try:
+            limit: int | None = int(request.query.get("limit", DEFAULT_QUERY_STATS_LIMIT))
+        except ValueError:
+            limit = None
+        if limit is None or limit < 0:
+            return RESTResponse({"error": {
+                                    "handled": True,
+                                    "message": "limit must be a non-negative integer"
+                                }}, status=HTTP_BAD_REQUEST)
+
+        stats_dict = QueryStatisticsDict(enabled=False, queries=[])
+        if self.session and self.session.mds:
+            profiler = self.session.mds.query_profiler
+            stats_dict = QueryStatisticsDict(enabled=profiler.enabled, queries=profiler.get_statistics(limit))
+        return RESTResponse({"query_statistics": stats_dict})
+
+    @docs(
+        tags=["General"],
+        summary="Return the rate of every notified topic and the time spent in its handlers.",
+        responses={
+            200: {
+                "schema": schema(NotificationStatisticsResponse={
+                    "notification_statistics": Dict(keys=String, values=Nested(schema(NotificationStatistics={
+                        "count": Integer,
+                        "rate": Float,
+                        "handler_time": Float,
+                        "max_handler_time": Float
+                    })))
+                })
+            }
+        }
+    )
+    def get_notification_stats(self, _: web.Request) -> RESTResponse:
+        """
+        Return the statistics of the notifications, per topic that was notified at least once.
+        """
+        stats_dict: dict[str, NotificationStatsDict] = {}
+        if self.session:
+            stats_dict = self.session.notifier.get_stats()
+        return RESTResponse({"notification_statistics": stats_dict})
+
     @docs(
         tags=["General"],
         summary="Return disk space statistics for a given directory.",
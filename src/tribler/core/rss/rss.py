@@ -26,6 +26,8 @@ if TYPE_CHECKING:
     from aiohttp import ClientResponse
     from ipv8.taskmanager import TaskManager
 
+    from tribler.core.torrent_checker.http_client import HttpClientPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,9 +36,12 @@ class RSSWatcher:
     Watch a single RSS URL and call updates when new torrents are added.
     """
 
-    def __init__(self, task_manager: TaskManager, notifier: Notifier, url: str) -> None:
+    def __init__(self, task_manager: TaskManager, notifier: Notifier, url: str,
+                 http_clients: HttpClientPool | None = None) -> None:
         """
         Initialize (but don't start) with a given taskmanager, callback and url.
+
+        If shared HTTP clients are given, they are used instead of a new client per request.
         """
         super().__init__()
 
@@ -49,6 +54,7 @@ class RSSWatcher:
 
         self.task_manager = task_manager
         self.notifier = notifier
+        self.http_clients = http_clients
 
         self.running: bool = False
 
@@ -73,7 +79,8 @@ class RSSWatcher:
         for url in urls:
             try:
                 uri, _ = await unshorten(url)
-                response = await query_uri(uri, valid_cert=False)
+                response = await query_uri(uri, valid_cert=False,
+                                           session=self.http_clients.get_session() if self.http_clients else None)
             except (ServerConnectionError, ClientResponseError, SSLError, ClientConnectorError,
                     AsyncTimeoutError, ValueError) as e:
                 logger.warning("Error while querying http uri: %s", str(e))
@@ -93,8 +100,9 @@ class RSSWatcher:
         Send a conditional get to our URL and return the response and its raw content.
         """
         headers = {"If-Modified-Since": formatdate(timeval=last_modified_time, localtime=False, usegmt=True)}
-        async with ClientSession(None, headers=headers) as session, \
-                session.get(self.url, cookies=self.cookies) as response:
+        shared_session = self.http_clients.get_session() if self.http_clients else None
+        async with (contextlib.nullcontext(shared_session) if shared_session else ClientSession()) as session, \
+                session.get(self.url, headers=headers, cookies=self.cookies) as response:
             return response, await response.read()
 
     async def check(self) -> None:
@@ -163,7 +171,8 @@ class RSSWatcherManager:
      - Unreachable RSS feeds. Resolved in ``RSSWatcher``.
     """
 
-    def __init__(self, task_manager: TaskManager, notifier: Notifier, urls: list[str]) -> None:
+    def __init__(self, task_manager: TaskManager, notifier: Notifier, urls: list[str],
+                 http_clients: HttpClientPool | None = None) -> None:
         """
         Initialize (but don't start) with a given taskmanager, callback and urls.
         """
@@ -171,7 +180,8 @@ class RSSWatcherManager:
 
         self.task_manager = task_manager
         self.notifier = notifier
-        self.watchers = {url: RSSWatcher(task_manager, notifier, url) for url in set(urls) if url}
+        self.http_clients = http_clients
+        self.watchers = {url: RSSWatcher(task_manager, notifier, url, http_clients) for url in set(urls) if url}
 
     def start(self) -> None:
         """
@@ -198,6 +208,6 @@ class RSSWatcherManager:
             watcher = self.watchers.pop(url)
             watcher.stop()
         for url in started:
-            watcher = RSSWatcher(self.task_manager, self.notifier, url)
+            watcher = RSSWatcher(self.task_manager, self.notifier, url, self.http_clients)
             self.watchers[url] = watcher
             watcher.start()
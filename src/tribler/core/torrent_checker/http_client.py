@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from aiohttp import ClientSession, DummyCookieJar, TCPConnector
+
+from tribler.core.socks5.aiohttp_connector import Socks5Connector
+
+HTTP_LIMIT_PER_HOST = 4  # The maximum number of simultaneous connections to a single host, per proxy configuration
+HTTP_DNS_CACHE_TTL = 300  # The number of seconds to cache DNS lookups
+HTTP_KEEPALIVE_TIMEOUT = 30  # The number of seconds to keep idle connections open
+
+
+class HttpClientPool:
+    """
+    Keep-alive HTTP clients that are shared by all requests, one per proxy configuration.
+
+    The clients keep no state between requests, other than open connections and DNS lookups: cookies, headers,
+    timeouts, and error handling should be given per request.
+    """
+
+    def __init__(self, limit_per_host: int = HTTP_LIMIT_PER_HOST, dns_cache_ttl: int = HTTP_DNS_CACHE_TTL) -> None:
+        """
+        Create a new (empty) pool.
+        """
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.sessions: dict[tuple | None, ClientSession] = {}
+        self.closed = False
+
+    def get_session(self, proxy: tuple | None = None) -> ClientSession | None:
+        """
+        Get the client for the given proxy, or for direct connections if no proxy is given.
+
+        :returns: the shared client, or None if the pool is closed and callers should use their own client.
+        """
+        if self.closed:
+            return None
+        session = self.sessions.get(proxy)
+        if session is None or session.closed:
+            connector: TCPConnector
+            if proxy:
+                connector = Socks5Connector(proxy, limit_per_host=self.limit_per_host,
+                                            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT)
+            else:
+                # Names are resolved by the proxy, so we only cache DNS lookups for direct connections.
+                connector = TCPConnector(ttl_dns_cache=self.dns_cache_ttl, limit_per_host=self.limit_per_host,
+                                         keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT)
+            session = self.sessions[proxy] = ClientSession(connector=connector, cookie_jar=DummyCookieJar())
+        return session
+
+    async def close(self) -> None:
+        """
+        Close all clients and their connections, no new clients are created afterwards.
+        """
+        self.closed = True
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        for session in sessions:
+            await session.close()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import heapq
+import math
+from itertools import count
+
+from tribler.core.torrent_checker.healthdataclasses import HEALTH_FRESHNESS_SECONDS
+
+POPULARITY_BONUS = 1800  # The number of seconds a torrent is due sooner for every doubling of its number of seeders
+TRACKER_CHECK_INTERVAL = 600  # The number of seconds between checks of a tracker, doubled for every failure
+PLANNER_MAX_TORRENTS = 20000  # The maximum number of torrents to plan
+
+
+class HealthCheckPlanner:
+    """
+    Plan the health checks of torrents and trackers in the order in which they are due.
+
+    Torrents are due once their health is no longer fresh, sooner for popular torrents. Trackers are due periodically,
+    later for every consecutive failure. Torrents are identified by their infohash (bytes) and trackers by their URL
+    (str).
+
+    The plan is a heap of due times. Rescheduled entries are not removed from the heap: their outdated heap items are
+    skipped when they come up.
+    """
+
+    def __init__(self, min_interval: float, max_torrents: int = PLANNER_MAX_TORRENTS) -> None:
+        """
+        Create a new (empty) planner that plans no torrent check sooner than the given interval after its last check.
+        """
+        self.min_interval = min_interval
+        self.max_torrents = max_torrents
+
+        self.heap: list[tuple[float, int, bytes | str]] = []
+        self.due: dict[bytes | str, float] = {}  # The current due time of every planned torrent and tracker
+        self.num_torrents = 0
+        self.counter = count()  # Ties are broken by insertion order, instead of by comparing infohashes and URLs
+
+    def __len__(self) -> int:
+        """
+        Get the number of planned torrents and trackers.
+        """
+        return len(self.due)
+
+    def __contains__(self, key: bytes | str) -> bool:
+        """
+        Whether the given torrent or tracker is planned.
+        """
+        return key in self.due
+
+    def get_torrent_due(self, seeders: int, last_check: int) -> float:
+        """
+        Get the time at which a torrent with the given health should be checked again.
+        """
+        interval = HEALTH_FRESHNESS_SECONDS - POPULARITY_BONUS * math.log2(1 + max(0, seeders))
+        return last_check + max(self.min_interval, interval)
+
+    @staticmethod
+    def get_tracker_due(last_check: int, failures: int) -> float:
+        """
+        Get the time at which a tracker with the given state should be checked again.
+        """
+        return last_check + TRACKER_CHECK_INTERVAL * 2 ** failures
+
+    def schedule(self, key: bytes | str, due: float) -> None:
+        """
+        Plan (or replan) the check of the given torrent or tracker at the given time.
+        """
+        self.due[key] = due
+        heapq.heappush(self.heap, (due, next(self.counter), key))
+        # Keep the outdated heap items from piling up when entries are rescheduled more often than they are due.
+        if len(self.heap) > 2 * len(self.due) + 1024:
+            self.heap = [(planned, next(self.counter), k) for k, planned in self.due.items()]
+            heapq.heapify(self.heap)
+
+    def schedule_torrent(self, infohash: bytes, seeders: int, last_check: int) -> bool:
+        """
+        Plan the next check of the given torrent, based on its health.
+
+        :returns: whether the torrent is planned, new torrents are not planned if the planner is full.
+        """
+        if infohash not in self.due:
+            if self.num_torrents >= self.max_torrents:
+                return False
+            self.num_torrents += 1
+        self.schedule(infohash, self.get_torrent_due(seeders, last_check))
+        return True
+
+    def schedule_tracker(self, url: str, last_check: int, failures: int) -> None:
+        """
+        Plan the next check of the given tracker, based on its state.
+        """
+        self.schedule(url, self.get_tracker_due(last_check, failures))
+
+    def remove(self, key: bytes | str) -> None:
+        """
+        Remove the given torrent or tracker from the plan.
+        """
+        if self.due.pop(key, None) is not None and isinstance(key, bytes):
+            self.num_torrents -= 1
+
+    def clear_torrents(self) -> None:
+        """
+        Remove all torrents from the plan.
+        """
+        for key in [key for key in self.due if isinstance(key, bytes)]:
+            self.remove(key)
+
+    def pop_due(self, now: float) -> bytes | str | None:
+        """
+        Remove the torrent or tracker that is most overdue at the given time from the plan.
+
+        :returns: the infohash or URL, or None if nothing is due.
+        """
+        while self.heap and self.heap[0][0] <= now:
+            due, _, key = heapq.heappop(self.heap)
+            if self.due.get(key) == due:
+                self.remove(key)
+                return key
+        return None
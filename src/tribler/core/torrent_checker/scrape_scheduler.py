@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+from asyncio import CancelledError, Future, get_running_loop, shield
+from typing import TYPE_CHECKING
+
+from ipv8.taskmanager import TaskManager
+
+from tribler.core.torrent_checker.torrentchecker_session import MAX_INFOHASHES_IN_SCRAPE
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from tribler.core.torrent_checker.healthdataclasses import TrackerResponse
+    from tribler.core.torrent_checker.torrentchecker_session import TrackerSession
+
+SCRAPE_COALESCE_WINDOW = 0.5  # The number of seconds to wait for more infohashes to scrape from the same tracker
+
+
+class ScrapeBatch:
+    """
+    The infohashes that are waiting to be scraped from a single tracker, in a single request.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a new (empty) batch.
+        """
+        self.infohashes: dict[bytes, None] = {}  # An ordered set
+        self.timeout = 0.0
+        self.response: Future[TrackerResponse] = get_running_loop().create_future()
+        # The response is shared by all callers: none of them may have to retrieve a failure.
+        self.response.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def is_full(self) -> bool:
+        """
+        Whether no more infohashes fit in this batch.
+        """
+        return len(self.infohashes) >= MAX_INFOHASHES_IN_SCRAPE
+
+
+class ScrapeScheduler(TaskManager):
+    """
+    Group the infohashes to scrape by tracker, over all callers, and scrape every tracker once per batch.
+
+    A batch is sent after the coalescing window of its first infohash, or as soon as it is full. Every caller receives
+    the response to the entire batch.
+    """
+
+    def __init__(self, create_session: Callable[[str, float], TrackerSession | None],
+                 get_response: Callable[[TrackerSession], Awaitable[TrackerResponse]],
+                 window: float = SCRAPE_COALESCE_WINDOW) -> None:
+        """
+        Create a new scheduler that creates sessions and gets their responses using the given callbacks.
+        """
+        super().__init__()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.create_session = create_session
+        self.get_response = get_response
+        self.window = window
+
+        self.pending: dict[str, ScrapeBatch] = {}
+
+    async def shutdown(self) -> None:
+        """
+        Cancel all pending and running scrapes.
+        """
+        for batch in self.pending.values():
+            batch.response.cancel()
+        self.pending.clear()
+        await self.shutdown_task_manager()
+
+    async def scrape(self, tracker_url: str, infohash: bytes, timeout: float = 20,
+                     now: bool = False) -> TrackerResponse:
+        """
+        Scrape the given infohash from the given tracker, together with the other infohashes for the same tracker.
+
+        If ``now`` is set, the batch is sent immediately, instead of after the coalescing window.
+
+        :returns: the response of the tracker to the batch that included the infohash.
+        :raises Exception: if the tracker could not be scraped, or if the scrape was cancelled by a shutdown.
+        """
+        if self._shutdown:
+            msg = f"Not scraping {tracker_url} due to shutdown"
+            raise RuntimeError(msg)
+        batch = self.pending.get(tracker_url)
+        if batch is None:
+            batch = self.pending[tracker_url] = ScrapeBatch()
+            self.register_task(f"Flush scrape of {tracker_url}", self.flush, tracker_url, delay=self.window)
+        batch.infohashes[infohash] = None
+        batch.timeout = max(batch.timeout, timeout)
+        if now or batch.is_full():
+            self.cancel_pending_task(f"Flush scrape of {tracker_url}")
+            self.flush(tracker_url)
+        try:
+            return await shield(batch.response)
+        except CancelledError:
+            if not batch.response.cancelled():
+                raise  # The caller itself was cancelled
+            msg = f"The scrape of {tracker_url} was cancelled"
+            raise RuntimeError(msg) from None
+
+    def flush(self, tracker_url: str) -> None:
+        """
+        Send the pending batch of the given tracker.
+        """
+        if (batch := self.pending.pop(tracker_url, None)) is not None:
+            self.register_anonymous_task("Scrape batch", self.scrape_batch, tracker_url, batch)
+
+    async def scrape_batch(self, tracker_url: str, batch: ScrapeBatch) -> None:
+        """
+        Scrape all infohashes of the given batch from the given tracker and share the response with all callers.
+        """
+        self._logger.info("Scrape %d infohashes from %s", len(batch.infohashes), tracker_url)
+        try:
+            session = self.create_session(tracker_url, batch.timeout)
+            if session is None:
+                msg = f"No session could be created for {tracker_url}"
+                raise ValueError(msg)
+            for infohash in batch.infohashes:
+                session.add_infohash(infohash)
+            response = await self.get_response(session)
+        except CancelledError:
+            batch.response.cancel()
+            raise
+        except Exception as e:
+            batch.response.set_exception(e)
+        else:
+            batch.response.set_result(response)
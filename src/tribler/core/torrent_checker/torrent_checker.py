@@ -16,27 +16,29 @@ from pony.utils import between
 from tribler.core.libtorrent.trackers import MalformedTrackerURLException, is_valid_url
 from tribler.core.notifier import Notification, Notifier
 from tribler.core.torrent_checker.healthdataclasses import HEALTH_FRESHNESS_SECONDS, HealthInfo, TrackerResponse
+from tribler.core.torrent_checker.http_client import HttpClientPool
+from tribler.core.torrent_checker.planner import HealthCheckPlanner
+from tribler.core.torrent_checker.scrape_scheduler import ScrapeScheduler
 from tribler.core.torrent_checker.torrentchecker_session import (
     TrackerSession,
     UdpSocketManager,
     create_tracker_session,
 )
-from tribler.core.torrent_checker.tracker_manager import MAX_TRACKER_FAILURES, TrackerManager
 
 if TYPE_CHECKING:
-    from tribler.core.database.orm_bindings.tracker_state import TrackerState
     from tribler.core.database.store import MetadataStore
     from tribler.core.libtorrent.download_manager.download_manager import DownloadManager
+    from tribler.core.torrent_checker.tracker_manager import TrackerManager
     from tribler.tribler_config import TriblerConfigManager
 
-TRACKER_SELECTION_INTERVAL = 1  # The interval for querying a random tracker
-TORRENT_SELECTION_INTERVAL = 10  # The interval for checking the health of a random torrent
+PLANNER_SEED_INTERVAL = 3600  # The interval for (re)loading the torrents and trackers to check from the database
+PLANNER_SEED_SIZE = 5000  # The number of popular torrents, and of old torrents, to load from the database
+MAX_PLANNED_CHECKS = 20  # Maximum simultaneous planned health checks
 MIN_TORRENT_CHECK_INTERVAL = 900  # How much time we should wait before checking a torrent again
 TORRENT_CHECK_RETRY_INTERVAL = 30  # Interval when the torrent was successfully checked for the last time
 MAX_TORRENTS_CHECKED_PER_SESSION = 5  # Maximum simultaneous health checks.
 SWARM_HEALTH_CHECK_TIMEOUT = 240  # Number of seconds to spend in a swarm when doing a health check.
 
-TORRENT_SELECTION_POOL_SIZE = 5  # How many torrents to check (popular or random) during periodic check
 TORRENTS_CHECKED_RETURN_SIZE = 240  # Estimated torrents checked on default 4 hours idle run
 
 
@@ -81,6 +83,11 @@ class TorrentChecker(TaskManager):
         self.sessions: dict[str, list[TrackerSession]] = defaultdict(list)
         self.socket_mgr = UdpSocketManager()
         self.udp_transport: DatagramTransport | None = None
+        self.http_clients = HttpClientPool()
+        # Health checks of different torrents on the same tracker share a single scrape request.
+        self.scrape_scheduler = ScrapeScheduler(self.create_session_for_request, self.get_tracker_response)
+        # The torrents and trackers to check, in the order in which they are due.
+        self.planner = HealthCheckPlanner(MIN_TORRENT_CHECK_INTERVAL)
 
         # We keep track of the results of popular torrents checked by you.
         # The content_discovery community gossips this information around.
@@ -90,7 +97,12 @@ class TorrentChecker(TaskManager):
         """
         Start all the looping tasks for the checker and creata socket.
         """
-        self.register_task("check local torrents", self.check_local_torrents, interval=TORRENT_SELECTION_INTERVAL)
+        self.register_task("seed planner", self.seed_planner, interval=PLANNER_SEED_INTERVAL)
+        checks_per_minute = self.config.get("torrent_checker/checks_per_minute")
+        if checks_per_minute > 0:
+            self.register_task("check planned", self.check_planned, interval=60 / checks_per_minute)
+        else:
+            self._logger.info("Planned health checks are disabled")
         await self.create_socket_or_schedule()
 
     async def listen_on_udp(self) -> DatagramTransport:
@@ -125,26 +137,21 @@ class TorrentChecker(TaskManager):
             self.udp_transport.close()
             self.udp_transport = None
 
+        await self.scrape_scheduler.shutdown()
         await self.shutdown_task_manager()
+        await self.http_clients.close()
 
-    async def check_random_tracker(self) -> None:
+    async def check_tracker(self, url: str) -> None:
         """
-        Calling this method will fetch a random tracker from the database, select some torrents that have this
-        tracker, and perform a request to these trackers.
-        Return whether the check was successful.
+        Select some torrents that have the given tracker, and perform a request to this tracker.
         """
-        if self._should_stop:
-            self._logger.warning("Not performing tracker check since we are shutting down")
-            return
-
-        tracker = self.get_next_tracker()
-        if not tracker:
-            self._logger.warning("No tracker to select from to check torrent health, skip")
-            return
-
-        # get the torrents that should be checked
-        url = tracker.url
         with db_session:
+            tracker = self.tracker_manager.TrackerState.get(url=url)
+            if not tracker:
+                self._logger.warning("Unknown tracker %s, skip", url)
+                return
+
+            # get the torrents that should be checked
             dynamic_interval = TORRENT_CHECK_RETRY_INTERVAL * (2 ** (tracker.failures or 0))
             torrents = select(ts for ts in tracker.torrents
                               if ts.has_data == 1  # The condition had to be written this way for the index to work
@@ -174,7 +181,7 @@ class TorrentChecker(TaskManager):
         for infohash in infohashes:
             session.add_infohash(infohash)
 
-        self._logger.info("Selected %d new torrents to check on random tracker: %s", len(infohashes), url)
+        self._logger.info("Selected %d new torrents to check on tracker: %s", len(infohashes), url)
         try:
             response = await self.get_tracker_response(session)
         except Exception as e:
@@ -182,6 +189,8 @@ class TorrentChecker(TaskManager):
         else:
             health_list = response.torrent_health_list
             self._logger.info("Received %d health info results from tracker: %s", len(health_list), str(health_list))
+            for health in health_list:
+                self.update_torrent_health(health)
 
     async def get_tracker_response(self, session: TrackerSession) -> TrackerResponse:
         """
@@ -240,58 +249,98 @@ class TorrentChecker(TaskManager):
         return result
 
     @db_session
-    def torrents_to_check(self) -> list:
+    def load_planner_seed(self) -> tuple[list[tuple[bytes, int, int]], list[tuple[str, int, int]]]:
         """
-        Two categories of torrents are selected (popular & old). From the pool of selected torrents, a certain
-        number of them are submitted for health check. The torrents that are within the freshness window are
-        excluded from the selection considering the health information is still fresh.
+        Load the torrents and the live trackers to check from the database, and remove the trackers with invalid URLs.
 
-        1. Popular torrents (50%)
-        The indicator for popularity here is considered as the seeder count with direct proportionality
-        assuming more seeders -> more popular. There could be other indicators to be introduced later.
+        Two categories of torrents are loaded: popular torrents, by seeder count, and old torrents, checked farthest in
+        the past.
 
-        2. Old torrents (50%)
-        By old torrents, we refer to those checked quite farther in the past, sorted by the last_check value.
+        :returns: the infohash, seeders and last check of the torrents, and the URL, last check and failures of the
+                  trackers.
         """
-        last_fresh_time = time.time() - HEALTH_FRESHNESS_SECONDS
-        popular_torrents = list(self.mds.TorrentState.select(
+        popular_torrents = self.mds.TorrentState.select(
             lambda g: g.has_data == 1  # The condition had to be written this way for the partial index to work
-            and g.last_check < last_fresh_time
-        ).order_by(lambda g: (desc(g.seeders), g.last_check)).limit(TORRENT_SELECTION_POOL_SIZE))
+        ).order_by(lambda g: (desc(g.seeders), g.last_check)).limit(PLANNER_SEED_SIZE)
 
-        old_torrents = list(self.mds.TorrentState.select(
+        old_torrents = self.mds.TorrentState.select(
             lambda g: g.has_data == 1  # The condition had to be written this way for the partial index to work
-            and g.last_check < last_fresh_time
-        ).order_by(lambda g: (g.last_check, desc(g.seeders))).limit(TORRENT_SELECTION_POOL_SIZE))
+        ).order_by(lambda g: (g.last_check, desc(g.seeders))).limit(PLANNER_SEED_SIZE)
+
+        torrents = [(torrent.infohash, torrent.seeders, torrent.last_check)
+                    for torrent in [*popular_torrents, *old_torrents]]
+
+        trackers = []
+        for tracker in list(self.tracker_manager.TrackerState.select(lambda g: g.alive)):
+            if not is_valid_url(tracker.url):
+                self.tracker_manager.remove_tracker(tracker.url)
+            elif not self.is_blacklisted_tracker(tracker.url):
+                trackers.append((tracker.url, tracker.last_check, tracker.failures))
+        return torrents, trackers
+
+    async def seed_planner(self) -> None:
+        """
+        (Re)load the torrents and trackers to check from the database, on a worker thread.
+
+        Afterward, the planner is kept up-to-date by the health updates.
+        """
+        torrents, trackers = await self.mds.run_threaded(self.load_planner_seed)
 
-        selected_torrents = popular_torrents + old_torrents
-        return random.sample(selected_torrents, min(TORRENT_SELECTION_POOL_SIZE, len(selected_torrents)))
+        self.planner.clear_torrents()
+        for infohash, seeders, last_check in torrents:
+            self.planner.schedule_torrent(infohash, seeders, last_check)
 
-    async def check_local_torrents(self) -> tuple[list, list]:
+        for url, last_check, failures in trackers:
+            if url not in self.planner:
+                self.planner.schedule_tracker(url, last_check, failures)
+
+        self._logger.info("Planned health checks for %d torrents and trackers", len(self.planner))
+
+    def plan_torrent_health(self, health: HealthInfo) -> None:
         """
-        Perform a full health check on a few popular and old torrents in the database.
+        Plan the next check of a torrent of which we received the health from someone else.
+
+        Received health that is older than what we know does not make the planned check sooner.
         """
-        selected_torrents = self.torrents_to_check()
-        self._logger.info("Check %d local torrents", len(selected_torrents))
-        results = await asyncio.gather(*[self.check_torrent_health(t.infohash) for t in selected_torrents])
-        self._logger.info("Results for local torrents check: %s", str(results))
-        return selected_torrents, results
+        due = self.planner.get_torrent_due(health.seeders, health.last_check)
+        if due > self.planner.due.get(health.infohash, 0):
+            self.planner.schedule_torrent(health.infohash, health.seeders, health.last_check)
 
-    def get_next_tracker(self) -> TrackerState | None:
+    def check_planned(self) -> None:
         """
-        Return the next unchecked tracker.
+        Start the check of the torrent or tracker that is most overdue, if any.
         """
-        while tracker := self.tracker_manager.get_next_tracker():
-            url = tracker.url
+        if self._should_stop or len(self.get_anonymous_tasks("Planned health check")) >= MAX_PLANNED_CHECKS:
+            return
+
+        key = self.planner.pop_due(time.time())
+        if isinstance(key, bytes):
+            self.register_anonymous_task("Planned health check", self.check_planned_torrent, key)
+        elif isinstance(key, str):
+            self.register_anonymous_task("Planned health check", self.check_planned_tracker, key)
 
-            if not is_valid_url(url):
-                self.tracker_manager.remove_tracker(url)
-            elif tracker.failures >= MAX_TRACKER_FAILURES:
-                self.tracker_manager.update_tracker_info(url, is_successful=False)
-            else:
-                return tracker
+    async def check_planned_torrent(self, infohash: bytes) -> None:
+        """
+        Check the health of the given torrent and plan its next check.
+        """
+        try:
+            health = await self.check_torrent_health(infohash)
+        except Exception as e:
+            self._logger.warning("Planned health check of %s failed: %s", hexlify(infohash).decode(), str(e))
+            health = HealthInfo(infohash)
+        # Successful health updates are planned in update_torrent_health().
+        if infohash not in self.planner:
+            self.planner.schedule_torrent(infohash, health.seeders, int(time.time()))
 
-        return None
+    async def check_planned_tracker(self, url: str) -> None:
+        """
+        Check the given tracker and plan its next check, unless it is dead.
+        """
+        await self.check_tracker(url)
+        with db_session:
+            tracker = self.tracker_manager.TrackerState.get(url=url)
+            if tracker and tracker.alive:
+                self.planner.schedule_tracker(url, tracker.last_check, tracker.failures)
 
     def is_blacklisted_tracker(self, tracker_url: str) -> bool:
         """
@@ -336,14 +385,10 @@ class TorrentChecker(TaskManager):
                 tracker_set = self.get_valid_trackers_of_torrent(torrent_state.infohash)
                 self._logger.info("Trackers for %s: %s", infohash_hex, str(tracker_set))
 
-        coroutines = []
-        for tracker_url in tracker_set:
-            if session := self.create_session_for_request(tracker_url, timeout=timeout):
-                session.add_infohash(infohash)
-                coroutines.append(self.get_tracker_response(session))
-        responses = await asyncio.gather(*coroutines, return_exceptions=True)
+        responses = await asyncio.gather(*[self.scrape_scheduler.scrape(tracker_url, infohash, timeout, scrape_now)
+                                           for tracker_url in tracker_set], return_exceptions=True)
         self._logger.info("Received %s tracker responses for %s: %s", len(responses), infohash_hex, str(responses))
-        successful_responses = [response for response in responses if not isinstance(response, Exception)]
+        successful_responses = [response for response in responses if not isinstance(response, BaseException)]
         health = aggregate_responses_for_infohash(infohash, cast("list[TrackerResponse]", successful_responses))
 
         if health.seeders == 0 and health.leechers == 0:
@@ -370,7 +415,7 @@ class TorrentChecker(TaskManager):
             return None
         listen_ports = cast("list[int]", self.socks_listen_ports)  # Guaranteed by check above
         proxy = ("127.0.0.1", listen_ports[required_hops - 1]) if required_hops > 0 else None
-        session = create_tracker_session(tracker_url, timeout, proxy, self.socket_mgr)
+        session = create_tracker_session(tracker_url, timeout, proxy, self.socket_mgr, self.http_clients)
         self._logger.info("Tracker session has been created: %s", str(session))
         self.sessions[tracker_url].append(session)
         return session
@@ -422,8 +467,11 @@ class TorrentChecker(TaskManager):
             tracker_id = next((tr.rowid for tr in torrent_state.trackers if tr.url == health.tracker), 0)
             torrent_state.set(seeders=health.seeders, leechers=health.leechers, last_check=health.last_check,
                               tracker_id=tracker_id, self_checked=True)
+            # Popular torrents and text searches are ordered by health
+            self.mds.search_cache.invalidate()
 
         self.torrents_checked[health.infohash] = health
+        self.planner.schedule_torrent(health.infohash, health.seeders, health.last_check)
         self.notify(health)
         return True
 
@@ -22,6 +22,8 @@ from tribler.core.torrent_checker.healthdataclasses import HealthInfo, TrackerRe
 if TYPE_CHECKING:
     from ipv8.messaging.interfaces.udp.endpoint import DomainAddress
 
+    from tribler.core.torrent_checker.http_client import HttpClientPool
+
 
 # Although these are the actions for UDP trackers, they can still be used as
 # identifiers.
@@ -30,6 +32,7 @@ TRACKER_ACTION_ANNOUNCE = 1
 TRACKER_ACTION_SCRAPE = 2
 
 UDP_TRACKER_INIT_CONNECTION_ID = 0x41727101980
+UDP_CONNECTION_ID_LIFETIME = 60  # BEP 15: a client can use a connection ID until one minute after it received it
 
 MAX_INFOHASHES_IN_SCRAPE = 60
 
@@ -121,14 +124,15 @@ class HttpTrackerSession(TrackerSession):
     """
 
     def __init__(self, tracker_url: str, tracker_address: tuple[str, int], announce_page: str, timeout: float,
-                 proxy: tuple | None) -> None:
+                 proxy: tuple | None, http_session: ClientSession | None = None) -> None:
         """
         Create a new HTTP tracker session.
+
+        If a (shared) HTTP client is given, it is used instead of a new client for this session only.
         """
         super().__init__("http", tracker_url, tracker_address, announce_page, timeout)
-        self.session = ClientSession(connector=Socks5Connector(proxy) if proxy else None,
-                                     raise_for_status=True,
-                                     timeout=ClientTimeout(total=self.timeout))
+        self.owns_session = http_session is None
+        self.session = http_session or ClientSession(connector=Socks5Connector(proxy) if proxy else None)
 
     async def connect_to_tracker(self) -> TrackerResponse:
         """
@@ -149,7 +153,8 @@ class HttpTrackerSession(TrackerSession):
 
         try:
             self._logger.debug("%s HTTP SCRAPE message sent: %s", self, url)
-            async with self.session, self.session.get(url.encode("ascii").decode()) as response:
+            async with self.session.get(url.encode("ascii").decode(), raise_for_status=True,
+                                        timeout=ClientTimeout(total=self.timeout)) as response:
                 body = await response.read()
         except UnicodeEncodeError:
             raise
@@ -205,10 +210,52 @@ class HttpTrackerSession(TrackerSession):
         """
         Cleans the session by cancelling all deferreds and closing sockets.
         """
-        await self.session.close()
+        if self.owns_session:
+            await self.session.close()
         await super().cleanup()
 
 
+class UdpConnectionIdCache:
+    """
+    The connection IDs that UDP trackers gave us, so that scrapes within their lifetime can skip the CONNECT request.
+
+    Connection IDs are valid for a single client address. Therefore, they are stored per tracker and proxy.
+    """
+
+    def __init__(self, lifetime: float = UDP_CONNECTION_ID_LIFETIME) -> None:
+        """
+        Create a new (empty) cache.
+        """
+        self.lifetime = lifetime
+        self.connection_ids: dict[tuple, tuple[int, float]] = {}
+
+    def get(self, key: tuple) -> int | None:
+        """
+        Get the connection ID for the given tracker and proxy, if it is still valid.
+        """
+        connection_id, expires = self.connection_ids.get(key, (None, 0.0))
+        if connection_id is not None and expires <= time.time():
+            self.connection_ids.pop(key)
+            return None
+        return connection_id
+
+    def set(self, key: tuple, connection_id: int) -> None:
+        """
+        Store the connection ID that was just received for the given tracker and proxy.
+        """
+        now = time.time()
+        # Remove expired connection IDs, so that trackers we no longer scrape do not stay in memory.
+        for expired in [k for k, (_, expires) in self.connection_ids.items() if expires <= now]:
+            self.connection_ids.pop(expired)
+        self.connection_ids[key] = (connection_id, now + self.lifetime)
+
+    def invalidate(self, key: tuple) -> None:
+        """
+        Forget the connection ID for the given tracker and proxy.
+        """
+        self.connection_ids.pop(key, None)
+
+
 class UdpSocketManager(DatagramProtocol):
     """
     The UdpSocketManager ensures that the network packets are forwarded to the right UdpTrackerSession.
@@ -222,6 +269,7 @@ class UdpSocketManager(DatagramProtocol):
         self.tracker_sessions: dict[int, Future[bytes]] = {}
         self.transport: Socks5Client | None = None
         self.proxy_transports: dict[tuple, Socks5Client] = {}
+        self.connection_ids = UdpConnectionIdCache()
 
     def connection_made(self, transport: Socks5Client) -> None:  # type: ignore[override]
         """
@@ -298,6 +346,7 @@ class UdpTrackerSession(TrackerSession):
         self.ip_address = None
         self.socket_mgr = socket_mgr
         self.proxy = proxy
+        self.connection_key = (tracker_address, proxy)
 
         # prepare connection message
         self._connection_id = UDP_TRACKER_INIT_CONNECTION_ID
@@ -337,6 +386,15 @@ class UdpTrackerSession(TrackerSession):
         await super().cleanup()
         self.remove_transaction_id()
 
+    def failed(self, msg: str | None = None) -> NoReturn:
+        """
+        Forget the connection ID of the tracker, which may be the cause of the failure, and fail.
+
+        :raises ValueError: always.
+        """
+        self.socket_mgr.connection_ids.invalidate(self.connection_key)
+        super().failed(msg)
+
     async def connect_to_tracker(self) -> TrackerResponse:
         """
         Connects to the tracker and starts querying for seed and leech data.
@@ -376,6 +434,14 @@ class UdpTrackerSession(TrackerSession):
         if not self.socket_mgr.transport:
             self.failed(msg="UDP socket transport not ready")
 
+        # Skip the connection if we still have a valid connection ID for this tracker
+        connection_id = self.socket_mgr.connection_ids.get(self.connection_key)
+        if connection_id is not None:
+            self._logger.debug("%s Reusing connection ID", self)
+            self._connection_id = connection_id
+            self.action = TRACKER_ACTION_SCRAPE
+            return
+
         # Initiate the connection
         message = struct.pack("!qii", self._connection_id, self.action, self.transaction_id)
         raw_response = await self.socket_mgr.send_request(message, self)
@@ -402,6 +468,7 @@ class UdpTrackerSession(TrackerSession):
 
         # update action and IDs
         self._connection_id = struct.unpack_from("!q", response, 8)[0]
+        self.socket_mgr.connection_ids.set(self.connection_key, self._connection_id)
         self.action = TRACKER_ACTION_SCRAPE
         self.generate_transaction_id()
         self.last_contact = int(time.time())
@@ -463,8 +530,8 @@ class UdpTrackerSession(TrackerSession):
         return TrackerResponse(url=self.tracker_url, torrent_health_list=response_list)
 
 
-def create_tracker_session(tracker_url: str, timeout: float, proxy: tuple | None,
-                           socket_manager: UdpSocketManager) -> TrackerSession:
+def create_tracker_session(tracker_url: str, timeout: float, proxy: tuple | None, socket_manager: UdpSocketManager,
+                           http_clients: HttpClientPool | None = None) -> TrackerSession:
     """
     Creates a tracker session with the given tracker URL.
 
@@ -472,10 +539,12 @@ def create_tracker_session(tracker_url: str, timeout: float, proxy: tuple | None
     :param timeout: The timeout for the session.
     :param proxy: the proxy to use.
     :param socket_manager: the socket manager to use.
+    :param http_clients: the shared HTTP clients to use for HTTP trackers.
     :return: The tracker session.
     """
     tracker_type, tracker_address, announce_page = parse_tracker_url(tracker_url)
 
     if tracker_type == "udp":
         return UdpTrackerSession(tracker_url, tracker_address, announce_page, timeout, proxy, socket_manager)
-    return HttpTrackerSession(tracker_url, tracker_address, announce_page, timeout, proxy)
+    http_session = http_clients.get_session(proxy) if http_clients else None
+    return HttpTrackerSession(tracker_url, tracker_address, announce_page, timeout, proxy, http_session)
@@ -6,6 +6,7 @@ from binascii import hexlify
 from typing import TYPE_CHECKING, cast
 from unittest import skipIf
 from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
 
 from ipv8.messaging.payload import IntroductionRequestPayload, NewIntroductionRequestPayload
 from ipv8.test.base import TestBase
@@ -24,8 +25,10 @@ from tribler.core.content_discovery.payload import (
     VersionRequest,
     VersionResponse,
 )
+from tribler.core.content_discovery.search import SearchSession
 from tribler.core.database.orm_bindings.torrent_metadata import LZ4_EMPTY_ARCHIVE
 from tribler.core.database.serialization import REGULAR_TORRENT
+from tribler.core.database.store import ObjState
 from tribler.core.notifier import Notification, Notifier
 from tribler.core.torrent_checker.torrent_checker import TorrentChecker
 from tribler.core.torrent_checker.torrentchecker_session import HealthInfo
@@ -151,6 +154,16 @@ class TestContentDiscoveryCommunity(TestBase[ContentDiscoveryCommunity]):
 
         self.assertEqual([], self.overlay(0).get_alive_checked_torrents())
 
+    def set_search_results(self, i: int, *titles: str) -> list[dict]:
+        """
+        Let node i process each received search response into new entries with the given titles.
+        """
+        results = [{"infohash": hexlify(title.encode()).decode(), "name": title} for title in titles]
+        self.overlay(i).composition.metadata_store.process_compressed_mdblob_threaded = AsyncMock(
+            return_value=[Mock(data=result, obj_state=ObjState.NEW_OBJECT) for result in results]
+        )
+        return results
+
     async def test_popularity_search(self) -> None:
         """
         Test searching several nodes for metadata entries based on title text.
@@ -158,12 +171,13 @@ class TestContentDiscoveryCommunity(TestBase[ContentDiscoveryCommunity]):
         notifications = {}
         self.overlay(0).composition.notifier = Notifier()
         self.overlay(0).composition.notifier.add(Notification.remote_query_results, notifications.update)
+        results = self.set_search_results(0, "ubuntu")
 
         uuid, peers = self.overlay(0).send_search_request(txt_filter="ubuntu*")
         await self.deliver_messages()
 
         self.assertEqual(str(uuid), notifications["uuid"])
-        self.assertEqual([], notifications["results"])
+        self.assertEqual(results, notifications["results"])
         self.assertEqual(hexlify(peers[0].mid).decode(), notifications["peer"])
 
     async def test_popularity_search_deprecated(self) -> None:
@@ -173,13 +187,14 @@ class TestContentDiscoveryCommunity(TestBase[ContentDiscoveryCommunity]):
         notifications = {}
         self.overlay(0).composition.notifier = Notifier()
         self.overlay(0).composition.notifier.add(Notification.remote_query_results, notifications.update)
+        results = self.set_search_results(0, "ubuntu")
 
         uuid, peers = self.overlay(0).send_search_request(txt_filter="ubuntu*", hide_xxx="1",
                                                           metadata_type=REGULAR_TORRENT, exclude_deleted="1")
         await self.deliver_messages()
 
         self.assertEqual(str(uuid), notifications["uuid"])
-        self.assertEqual([], notifications["results"])
+        self.assertEqual(results, notifications["results"])
         self.assertEqual(hexlify(peers[0].mid).decode(), notifications["peer"])
 
     async def test_popularity_search_unparsed_metadata_type(self) -> None:
@@ -189,15 +204,52 @@ class TestContentDiscoveryCommunity(TestBase[ContentDiscoveryCommunity]):
         notifications = {}
         self.overlay(0).composition.notifier = Notifier()
         self.overlay(0).composition.notifier.add(Notification.remote_query_results, notifications.update)
+        results = self.set_search_results(0, "ubuntu")
 
         uuid, peers = self.overlay(0).send_search_request(txt_filter="ubuntu*", hide_xxx="1",
                                                           metadata_type=str(REGULAR_TORRENT), exclude_deleted="1")
         await self.deliver_messages()
 
         self.assertEqual(str(uuid), notifications["uuid"])
-        self.assertEqual([], notifications["results"])
+        self.assertEqual(results, notifications["results"])
         self.assertEqual(hexlify(peers[0].mid).decode(), notifications["peer"])
 
+    async def test_popularity_search_no_new_results(self) -> None:
+        """
+        Test if searches do not notify responses without new entries.
+        """
+        notifications = []
+        self.overlay(0).composition.notifier = Notifier()
+        self.overlay(0).composition.notifier.add(Notification.remote_query_results,
+                                                 lambda **kwargs: notifications.append(kwargs))
+
+        self.overlay(0).send_search_request(txt_filter="ubuntu*")
+        await self.deliver_messages()
+
+        self.assertEqual([], notifications)
+
+    async def test_search_notification_delayed(self) -> None:
+        """
+        Test if search results are notified at most once per notification interval.
+        """
+        notifications = []
+        self.overlay(0).composition.notifier = Notifier()
+        self.overlay(0).composition.notifier.add(Notification.remote_query_results,
+                                                 lambda **kwargs: notifications.append(kwargs))
+        search = SearchSession("ubuntu", uuid4(), 0.1)
+
+        search.add("peer1", [{"infohash": "01", "name": "ubuntu"}])
+        self.overlay(0).schedule_search_notification(search)
+        search.add("peer2", [{"infohash": "02", "name": "debian"}, {"infohash": "03", "name": "ubuntu server"}])
+        self.overlay(0).schedule_search_notification(search)
+        pending = len(notifications)
+        await self.overlay(0).wait_for_tasks()
+
+        self.assertEqual(1, pending)
+        self.assertEqual(2, len(notifications))
+        self.assertEqual(["ubuntu server", "debian"], [r["name"] for r in notifications[1]["results"]])
+        self.assertEqual("peer2", notifications[1]["peer"])
+
     async def test_request_for_version(self) -> None:
         """
         Test if a version request is responded to.
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from ipv8.test.base import TestBase
+
+from tribler.core.content_discovery.search import SearchSession
+
+
+class TestSearchSession(TestBase):
+    """
+    Tests for the SearchSession class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new search session.
+        """
+        super().setUp()
+        self.search = SearchSession("big buck bunny", uuid4(), 10.0)
+
+    def test_add_new(self) -> None:
+        """
+        Test if new results are pending after they are added.
+        """
+        added = self.search.add("peer", [{"infohash": "01", "name": "big buck bunny"}])
+
+        self.assertTrue(added)
+        self.assertEqual(["01"], list(self.search.pending))
+
+    def test_add_duplicate(self) -> None:
+        """
+        Test if results with a known infohash are ignored, even after they were notified.
+        """
+        self.search.add("peer1", [{"infohash": "01", "name": "big buck bunny"}])
+        self.search.pop_pending()
+
+        added = self.search.add("peer2", [{"infohash": "01", "name": "big buck bunny 2"}])
+
+        self.assertFalse(added)
+        self.assertEqual({}, self.search.pending)
+        self.assertEqual({}, self.search.pending_peers)
+
+    def test_pop_pending_ranked(self) -> None:
+        """
+        Test if pending results are returned best ranked first, together with the peers that sent them.
+        """
+        self.search.add("peer1", [{"infohash": "01", "name": "bunny"}])
+        self.search.add("peer2", [{"infohash": "02", "name": "big buck bunny"}])
+
+        results, peers = self.search.pop_pending()
+
+        self.assertEqual(["02", "01"], [r["infohash"] for r in results])
+        self.assertEqual(["peer1", "peer2"], peers)
+        self.assertEqual({}, self.search.pending)
+
+    def test_pop_pending_no_query(self) -> None:
+        """
+        Test if results can be aggregated for searches without a text query.
+        """
+        search = SearchSession(None, uuid4(), 10.0)
+        search.add("peer", [{"infohash": "01", "name": "test"}])
+
+        results, _ = search.pop_pending()
+
+        self.assertEqual(["01"], [r["infohash"] for r in results])
+
+    def test_notification_delay(self) -> None:
+        """
+        Test if the notification delay is the remainder of the notification interval after the last notification.
+        """
+        with patch("time.monotonic", return_value=100.0):
+            initial_delay = self.search.get_notification_delay()
+            self.search.pop_pending()
+        with patch("time.monotonic", return_value=104.0):
+            delay = self.search.get_notification_delay()
+
+        self.assertEqual(0.0, initial_delay)
+        self.assertEqual(6.0, delay)
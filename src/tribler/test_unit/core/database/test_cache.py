@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from ipv8.test.base import TestBase
+
+from tribler.core.database.cache import SearchResultCache, is_cacheable_query
+
+
+class TestSearchResultCache(TestBase):
+    """
+    Tests for the SearchResultCache class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new cache.
+        """
+        super().setUp()
+        self.cache = SearchResultCache(max_size=2, ttl=10)
+
+    def test_make_key_order(self) -> None:
+        """
+        Test if keys do not depend on the order of the parameters.
+        """
+        self.assertEqual(SearchResultCache.make_key(txt_filter="a", first=1),
+                         SearchResultCache.make_key(first=1, txt_filter="a"))
+
+    def test_make_key_defaults(self) -> None:
+        """
+        Test if unset parameters do not influence the key.
+        """
+        self.assertEqual(SearchResultCache.make_key(txt_filter="a", category=None),
+                         SearchResultCache.make_key(txt_filter="a"))
+
+    def test_make_key_collections(self) -> None:
+        """
+        Test if sets are normalized and lists are not.
+        """
+        self.assertEqual(SearchResultCache.make_key(infohash_set={b"a", b"b"}),
+                         SearchResultCache.make_key(infohash_set={b"b", b"a"}))
+        self.assertNotEqual(SearchResultCache.make_key(tags=["a", "b"]), SearchResultCache.make_key(tags=["b", "a"]))
+
+    def test_make_key_unhashable(self) -> None:
+        """
+        Test if no key is created for unhashable parameters.
+        """
+        self.assertIsNone(SearchResultCache.make_key(txt_filter={"a": "b"}))
+
+    def test_get_miss(self) -> None:
+        """
+        Test if unknown keys are counted as misses.
+        """
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual({"hits": 0, "misses": 1, "size": 0}, self.cache.get_statistics())
+
+    def test_get_hit(self) -> None:
+        """
+        Test if known keys are counted as hits.
+        """
+        self.cache.put("key", [1, 2, 3], self.cache.generation)
+
+        self.assertEqual([1, 2, 3], self.cache.get("key"))
+        self.assertEqual({"hits": 1, "misses": 0, "size": 1}, self.cache.get_statistics())
+
+    def test_get_expired(self) -> None:
+        """
+        Test if outdated entries are removed and counted as misses.
+        """
+        self.cache.put("key", [1, 2, 3], self.cache.generation)
+
+        with patch("tribler.core.database.cache.time", lambda: 1e12):
+            self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(0, len(self.cache))
+
+    def test_put_evict_lru(self) -> None:
+        """
+        Test if the least recently used entry is removed when the cache is full.
+        """
+        self.cache.put("key1", [1], self.cache.generation)
+        self.cache.put("key2", [2], self.cache.generation)
+        self.cache.get("key1")
+        self.cache.put("key3", [3], self.cache.generation)
+
+        self.assertEqual([1], self.cache.get("key1"))
+        self.assertIsNone(self.cache.get("key2"))
+        self.assertEqual([3], self.cache.get("key3"))
+
+    def test_put_after_invalidate(self) -> None:
+        """
+        Test if results that were computed before an invalidation are not stored.
+        """
+        generation = self.cache.generation
+        self.cache.invalidate()
+        self.cache.put("key", [1], generation)
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_invalidate(self) -> None:
+        """
+        Test if invalidating removes all entries.
+        """
+        self.cache.put("key", [1], self.cache.generation)
+        self.cache.invalidate()
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_is_cacheable_query(self) -> None:
+        """
+        Test if only text searches and popular queries are cacheable.
+        """
+        self.assertTrue(is_cacheable_query({"txt_filter": "a"}))
+        self.assertTrue(is_cacheable_query({"popular": True}))
+        self.assertFalse(is_cacheable_query({"infohash": b"a" * 20}))
@@ -0,0 +1,85 @@
+import sqlite3
+
+from ipv8.test.base import TestBase
+
+from tribler.core.database.profiler import QueryProfiler
+
+
+class TestQueryProfiler(TestBase):
+    """
+    Tests for the QueryProfiler class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new profiler and a database to profile.
+        """
+        super().setUp()
+        self.profiler = QueryProfiler(enabled=True)
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE test (value INTEGER)")
+        self.connection.executemany("INSERT INTO test VALUES (?)", [(1, ), (2, ), (3, )])
+
+    async def tearDown(self) -> None:
+        """
+        Close the database.
+        """
+        self.connection.close()
+        await super().tearDown()
+
+    def query(self, minimum: int) -> list[tuple[int]]:
+        """
+        Query the test values from the given minimum.
+        """
+        return self.connection.execute("SELECT value FROM test WHERE value >= ?", (minimum, )).fetchall()
+
+    def test_make_shape(self) -> None:
+        """
+        Test if shapes only include the values of the parameters that select different queries.
+        """
+        shape = QueryProfiler.make_shape({"txt_filter": "test", "sort_by": "HEALTH", "category": None, "tags": []})
+
+        self.assertEqual("sort_by=HEALTH txt_filter", shape)
+
+    def test_profile_result(self) -> None:
+        """
+        Test if profiling a query returns its result.
+        """
+        result = self.profiler.profile(self.connection, {}, lambda: self.query(2))
+
+        self.assertEqual([(2, ), (3, )], result)
+
+    def test_profile_aggregate(self) -> None:
+        """
+        Test if queries with the same shape are aggregated.
+        """
+        self.profiler.profile(self.connection, {"txt_filter": "a"}, lambda: self.query(1))
+        self.profiler.profile(self.connection, {"txt_filter": "b"}, lambda: self.query(3))
+
+        stats, = self.profiler.get_statistics()
+
+        self.assertEqual("txt_filter", stats["shape"])
+        self.assertEqual(2, stats["calls"])
+        self.assertEqual(2.0, stats["mean_rows"])
+        self.assertIn("SELECT value FROM test WHERE value >=", stats["sql"])
+        self.assertEqual(["SCAN test"], stats["plan"])
+
+    def test_get_statistics_order(self) -> None:
+        """
+        Test if the statistics of the shapes with the highest mean time come first and are limited.
+        """
+        self.profiler.profile(self.connection, {"sort_by": "size"}, lambda: self.query(1))
+        self.profiler.profile(self.connection, {"sort_by": "HEALTH"}, lambda: self.query(1))
+        self.profiler.shapes["sort_by=HEALTH"].total_time = 10.0
+
+        self.assertEqual(["sort_by=HEALTH"], [s["shape"] for s in self.profiler.get_statistics(1)])
+
+    def test_reset(self) -> None:
+        """
+        Test if resetting the profiler removes all statistics.
+        """
+        self.profiler.profile(self.connection, {}, lambda: self.query(1))
+
+        self.profiler.reset()
+
+        self.assertEqual([], self.profiler.get_statistics())
@@ -5,14 +5,40 @@ from collections import deque
 from ipv8.test.base import TestBase
 
 from tribler.core.database.ranks import (
+    MISSED_WORD_PENALTY,
+    POSITION_COEFF,
+    RANK_NORMALIZATION_COEFF,
+    REMAINDER_COEFF,
+    calculate_rank,
     find_word_and_rotate_title,
     freshness_rank,
+    health_torrent_rank,
+    query_terms,
     seeders_rank,
     title_rank,
     torrent_rank,
+    word_re,
 )
 
 
+def reference_calculate_rank(query: list[str], title: list[str]) -> float:
+    """
+    The straightforward ranking algorithm, without precomputed query weights.
+    """
+    if not query:
+        return 1.0
+    if not title:
+        return 0.0
+    q_title = deque(title)
+    total_error = 0.0
+    for i, word in enumerate(query):
+        word_weight = POSITION_COEFF / (POSITION_COEFF + i)
+        found, skipped = find_word_and_rotate_title(word, q_title)
+        total_error += skipped * word_weight if found else MISSED_WORD_PENALTY * word_weight
+    total_error += len(q_title) * (1 / (REMAINDER_COEFF + len(query)))
+    return RANK_NORMALIZATION_COEFF / (RANK_NORMALIZATION_COEFF + total_error)
+
+
 class TestRanks(TestBase):
     """
     Tests for the ranking logic.
@@ -73,6 +99,13 @@ class TestRanks(TestBase):
         """
         self.assertGreaterEqual(seeders_rank(10, 100), seeders_rank(10, 10))
 
+    def test_health_torrent_rank(self) -> None:
+        """
+        Test if the rank with a precomputed seeders rank equals the rank with seeders and leechers.
+        """
+        self.assertEqual(torrent_rank("big buck bunny", "big buck bunny 1080p", 10, 3, 86400),
+                         health_torrent_rank("big buck bunny", "big buck bunny 1080p", seeders_rank(10, 3), 86400))
+
     def test_torrent_rank_exact_match(self) -> None:
         """
         Test if an exact title match leads to a score of exactly 0.81.
@@ -202,3 +235,36 @@ class TestRanks(TestBase):
 
         self.assertEqual((False, 0), find_word_and_rotate_title("B", title))
         self.assertEqual(deque(["A", "C", "X"]), title)
+
+    def test_query_terms(self) -> None:
+        """
+        Test if query strings are parsed to lowercase words with decreasing weights.
+        """
+        words, weights, remainder_weight = query_terms("Big Buck, bunny!")
+
+        self.assertEqual(("big", "buck", "bunny"), words)
+        self.assertEqual((1.0, 5 / 6, 5 / 7), weights)
+        self.assertEqual(1 / 13, remainder_weight)
+
+    def test_query_terms_empty(self) -> None:
+        """
+        Test if empty query strings are parsed to no words.
+        """
+        self.assertEqual(((), (), 0.1), query_terms(""))
+
+    def test_calculate_rank_parity(self) -> None:
+        """
+        Test if the calculated ranks are identical to the straightforward ranking algorithm.
+        """
+        queries = ["", "big", "Big Buck Bunny", "bunny big", "the big big buck", "sintel 1080p x264"]
+        titles = ["", "Big Buck Bunny", "Big.Buck.Bunny.2008.1080p.BluRay.x264", "big big bunny buck",
+                  "Sintel (2010) [1080p]", "The Big Buck and the Big Bunny", "unrelated title"]
+
+        for query in queries:
+            for title in titles:
+                pat_query = word_re.findall(query.lower())
+                pat_title = word_re.findall(title.lower())
+                expected = reference_calculate_rank(pat_query, pat_title)
+
+                self.assertEqual(expected, calculate_rank(pat_query, pat_title))
+                self.assertEqual(expected, title_rank(query, title))
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from ipv8.keyvault.crypto import default_eccrypto
 from ipv8.test.base import TestBase
 
 from tribler.core.database.serialization import (
+    DELETED,
     REGULAR_TORRENT,
+    DeletedMetadataPayload,
     HealthItemsPayload,
     SignedPayload,
     TorrentMetadataPayload,
     UnknownBlobTypeException,
+    check_signatures,
     int2time,
+    iter_torrent_metadata,
     read_payload_with_offset,
     time2int,
 )
 
+if TYPE_CHECKING:
+    from ipv8.keyvault.keys import PrivateKey
+
 
 class TestSerialization(TestBase):
     """
@@ -122,6 +132,109 @@ class TestSerialization(TestBase):
         self.assertEqual(payload.public_key, unserialized.public_key)
         self.assertEqual(payload.signature, unserialized.signature)
 
+    def create_signed_payload(self, private_key: PrivateKey, id_: int = 7) -> TorrentMetadataPayload:
+        """
+        Create a TorrentMetadataPayload, signed by the given key, as it would be received from the network.
+        """
+        payload = TorrentMetadataPayload(metadata_type=REGULAR_TORRENT, reserved_flags=0,
+                                         public_key=private_key.pub().key_to_bin()[10:], id_=id_, origin_id=1337,
+                                         timestamp=10, infohash=b"\x01" * 20, size=42, torrent_date=int2time(0),
+                                         title="test", tags="tags", tracker_info="")
+        payload.add_signature(private_key)
+        return read_payload_with_offset(payload.serialized() + payload.signature)[0]
+
+    def test_read_payload_with_offset_signed_data(self) -> None:
+        """
+        Test if read_payload_with_offset stores the signed bytes of a payload.
+        """
+        private_key = default_eccrypto.generate_key("curve25519")
+        payload = self.create_signed_payload(private_key)
+
+        self.assertEqual(payload.serialized(), payload.signed_data)
+
+    def test_check_signatures(self) -> None:
+        """
+        Test if check_signatures accepts valid signatures and unsigned payloads, and rejects invalid signatures.
+        """
+        private_key = default_eccrypto.generate_key("curve25519")
+        valid = self.create_signed_payload(private_key)
+        invalid = self.create_signed_payload(private_key)
+        invalid.signature = b"\x01" * 64
+        unsigned = SignedPayload(9999, 0, b"\x00" * 64)
+
+        self.assertEqual([True, False, True], check_signatures([valid, invalid, unsigned]))
+
+    def test_check_signatures_invalid_key(self) -> None:
+        """
+        Test if check_signatures rejects payloads with a public key that cannot be loaded.
+        """
+        payload = SignedPayload(9999, 0, b"\x01" * 64)
+        payload.signature = b"\x01" * 64
+
+        self.assertEqual([False], check_signatures([payload]))
+
+    def test_check_signatures_executor(self) -> None:
+        """
+        Test if check_signatures gives the results in order when checking in chunks on an executor.
+        """
+        private_key = default_eccrypto.generate_key("curve25519")
+        payloads = [self.create_signed_payload(private_key, i) for i in range(5)]
+        payloads[3].signature = b"\x01" * 64
+
+        with patch("tribler.core.database.serialization.SIGNATURE_CHECK_CHUNK_SIZE", 2), \
+                ThreadPoolExecutor(2) as executor:
+            results = check_signatures(payloads, executor)
+
+        self.assertEqual([True, True, True, False, True], results)
+
+    def test_iter_torrent_metadata(self) -> None:
+        """
+        Test if iter_torrent_metadata gives views of the torrent payloads and skips deprecated payloads.
+        """
+        private_key = default_eccrypto.generate_key("curve25519")
+        payloads = [self.create_signed_payload(private_key, i) for i in range(2)]
+        deleted = DeletedMetadataPayload(DELETED, 0, b"\x00" * 64, b"\x02" * 64)
+        data = b"".join(p.serialized() + p.signature for p in [payloads[0], deleted, payloads[1]])
+
+        views = list(iter_torrent_metadata(data))
+
+        self.assertEqual(2, len(views))
+        for payload, view in zip(payloads, views, strict=True):
+            self.assertEqual(payload.public_key, view.public_key)
+            self.assertEqual(payload.id_, view.id_)
+            self.assertEqual(payload.infohash, view.infohash)
+            self.assertEqual(payload.signature, view.signature)
+            self.assertEqual(payload.serialized(), view.signed_data)
+            self.assertTrue(view.has_signature())
+            self.assertEqual(payload.to_dict(), view.to_payload().to_dict())
+        self.assertEqual([True, True], check_signatures(views))
+
+    def test_iter_torrent_metadata_unknown(self) -> None:
+        """
+        Test if iter_torrent_metadata throws a UnknownBlobTypeException for unknown payload formats.
+        """
+        with self.assertRaises(UnknownBlobTypeException):
+            list(iter_torrent_metadata(b"\xFF\xFF"))
+
+    def test_iter_torrent_metadata_truncated(self) -> None:
+        """
+        Test if iter_torrent_metadata throws a ValueError for data that ends with an incomplete payload.
+        """
+        payload = self.create_signed_payload(default_eccrypto.generate_key("curve25519"))
+
+        with self.assertRaises(ValueError):
+            list(iter_torrent_metadata(payload.serialized() + payload.signature[:32]))
+
+    def test_iter_torrent_metadata_invalid_utf8(self) -> None:
+        """
+        Test if iter_torrent_metadata throws a ValueError for data that contains an invalid UTF-8 string.
+        """
+        payload = self.create_signed_payload(default_eccrypto.generate_key("curve25519"))
+        data = (payload.serialized() + payload.signature).replace(b"test", b"\xff" * 4)
+
+        with self.assertRaises(ValueError):
+            list(iter_torrent_metadata(data))
+
     def test_get_magnet(self) -> None:
         """
         Test if TorrentMetadataPayload can generated magnet links from its infohash.
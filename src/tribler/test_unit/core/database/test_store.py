@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import sqlite3
+from time import time
 from unittest.mock import Mock, call, patch
 
 from ipv8.community import Community, CommunitySettings
@@ -7,10 +10,21 @@ from ipv8.keyvault.crypto import default_eccrypto
 from ipv8.test.base import TestBase
 from ipv8.test.mocking.ipv8 import MockIPv8
 from pony.orm import db_session
+from pony.orm.dbapiprovider import OperationalError
 
 from tribler.core.database.orm_bindings.torrent_metadata import entries_to_chunk
-from tribler.core.database.serialization import NULL_KEY, int2time
+from tribler.core.database.ranks import seeders_rank, torrent_rank
+from tribler.core.database.serialization import (
+    NULL_KEY,
+    REGULAR_TORRENT,
+    TorrentMetadataPayload,
+    TorrentMetadataView,
+    int2time,
+    iter_torrent_metadata,
+)
 from tribler.core.database.store import MetadataStore, ObjState
+from tribler.core.notifier import Notification
+from tribler.core.torrent_checker.healthdataclasses import HealthInfo
 
 
 class MockCommunity(Community):
@@ -199,6 +213,217 @@ class TestMetadataStore(TestBase[MockCommunity]):
         self.assertIsNotNone(self.metadata_store.TorrentMetadata.get(title=ffa_title))
         self.assertEqual([], self.metadata_store.process_payload(ffa_payload))
 
+    def create_signed_payloads(self, count: int, tracker_info: str = "") -> list[TorrentMetadataPayload]:
+        """
+        Create signed payloads from another key, that are not stored in the database.
+        """
+        other_key = default_eccrypto.generate_key("curve25519")
+        payloads = []
+        with db_session:
+            for i in range(count):
+                md = self.metadata_store.TorrentMetadata(title=f"torrent {i}", infohash=bytes([i]) * 20, id_=i,
+                                                         timestamp=0, torrent_date=int2time(i), tags="video",
+                                                         public_key=other_key.key_to_bin(), tracker_info=tracker_info)
+                payloads.append(md.payload_class.from_signed_blob(md.serialized(other_key)))
+                md.delete()
+        return payloads
+
+    def test_process_payloads_new(self) -> None:
+        """
+        Test if a batch of new payloads is inserted and reported with the same data as the ORM objects.
+        """
+        payloads = self.create_signed_payloads(3, "http://tracker.org/announce")
+
+        results = self.metadata_store.process_payloads(payloads)
+
+        self.assertEqual([ObjState.NEW_OBJECT] * 3, [r.obj_state for r in results])
+        with db_session:
+            for result in results:
+                node = self.metadata_store.TorrentMetadata[result.rowid]
+                self.assertEqual(node.to_simple_dict(), result.data)
+                self.assertEqual(["http://tracker.org/announce"], node.tracker_info_list)
+
+    def test_process_payloads_duplicates(self) -> None:
+        """
+        Test if known payloads and repeated payloads in a batch are reported as duplicates.
+        """
+        payloads = self.create_signed_payloads(2)
+        first, = self.metadata_store.process_payloads(payloads[:1])
+
+        results = self.metadata_store.process_payloads([payloads[0], payloads[1], payloads[1]])
+
+        self.assertEqual([ObjState.DUPLICATE_OBJECT, ObjState.NEW_OBJECT, ObjState.DUPLICATE_OBJECT],
+                         [r.obj_state for r in results])
+        self.assertEqual(first.rowid, results[0].rowid)
+        self.assertEqual(results[1].rowid, results[2].rowid)
+        self.assertEqual(2, self.metadata_store.get_num_torrents())
+
+    def test_process_payloads_existing_health(self) -> None:
+        """
+        Test if new payloads are linked to the already known health of their torrent.
+        """
+        payload, = self.create_signed_payloads(1)
+        with db_session:
+            self.metadata_store.process_torrent_health(HealthInfo(payload.infohash, seeders=7, leechers=3,
+                                                                  last_check=int(time())))
+
+        result, = self.metadata_store.process_payloads([payload])
+
+        self.assertEqual(7, result.data["num_seeders"])
+        self.assertEqual(3, result.data["num_leechers"])
+        with db_session:
+            self.assertEqual(7, self.metadata_store.TorrentMetadata[result.rowid].health.seeders)
+
+    def test_process_payloads_notify(self) -> None:
+        """
+        Test if the creation of new entries is notified.
+        """
+        payload, = self.create_signed_payloads(1)
+        self.metadata_store.notifier = Mock()
+
+        self.metadata_store.process_payloads([payload])
+
+        self.metadata_store.notifier.notify_batch.assert_called_once_with(
+            Notification.new_torrent_metadata_created, [{"infohash": payload.infohash, "title": payload.title}]
+        )
+
+    def test_process_payloads_views(self) -> None:
+        """
+        Test if views of payloads are only unpacked if they are new.
+        """
+        payloads = self.create_signed_payloads(2)
+        self.metadata_store.process_payloads(payloads[:1])
+        views = list(iter_torrent_metadata(b"".join(p.serialized() + p.signature for p in payloads)))
+
+        with patch.object(TorrentMetadataView, "to_payload", autospec=True,
+                          side_effect=TorrentMetadataView.to_payload) as to_payload:
+            results = self.metadata_store.process_payloads(views)
+
+        self.assertEqual([ObjState.DUPLICATE_OBJECT, ObjState.NEW_OBJECT], [r.obj_state for r in results])
+        self.assertEqual(payloads[1].title, results[1].data["name"])
+        to_payload.assert_called_once_with(views[1])
+
+    def test_process_payloads_invalid_signature(self) -> None:
+        """
+        Test if payloads with an invalid signature are not inserted.
+        """
+        payloads = self.create_signed_payloads(2)
+        payloads[0].signature = b"\x01" * 64
+
+        results = self.metadata_store.process_payloads(payloads)
+
+        self.assertEqual([ObjState.NEW_OBJECT], [r.obj_state for r in results])
+        self.assertEqual(payloads[1].title, results[0].data["name"])
+        self.assertEqual(1, self.metadata_store.get_num_torrents())
+
+    def test_process_squashed_mdblob_invalid_signature(self) -> None:
+        """
+        Test if payloads with an invalid signature are dropped from a received mdblob.
+        """
+        payloads = self.create_signed_payloads(3)
+        payloads[1].signature = b"\x01" * 64
+        blob = b"".join(payload.serialized() + payload.signature for payload in payloads)
+
+        results = self.metadata_store.process_squashed_mdblob(blob)
+
+        self.assertEqual([payloads[0].title, payloads[2].title], [r.data["name"] for r in results])
+        self.assertEqual(2, self.metadata_store.get_num_torrents())
+
+    def test_process_squashed_mdblob_invalid_utf8(self) -> None:
+        """
+        Test if a received mdblob with an invalid UTF-8 string is rejected without processing any of its payloads.
+        """
+        payloads = self.create_signed_payloads(3)
+        blob = b"".join(payload.serialized() + payload.signature for payload in payloads)
+        blob = blob.replace(b"torrent 2", b"\xff" * 9)
+
+        with patch.object(self.metadata_store, "batch_size", 1), self.assertRaises(ValueError):
+            self.metadata_store.process_squashed_mdblob(blob)
+
+        self.assertEqual(0, self.metadata_store.get_num_torrents())
+
+    def create_wal_store(self) -> MetadataStore:
+        """
+        Create a metadata store on disk, in WAL mode.
+        """
+        return MetadataStore(os.path.join(self.temporary_directory(), "metadata.db"), self.private_key(0),
+                             wal_mode=True, read_pool_size=2)
+
+    async def test_wal_mode(self) -> None:
+        """
+        Test if WAL mode writes through the writer thread and reads through the read pool.
+        """
+        metadata_store = self.create_wal_store()
+
+        def add_torrent() -> None:
+            with db_session:
+                metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+
+        await metadata_store.run_threaded(add_torrent)
+        entries = await metadata_store.run_threaded_read(metadata_store.get_num_torrents)
+        with db_session:
+            journal_mode, = metadata_store.db.get_connection().execute("PRAGMA journal_mode").fetchone()
+        metadata_store.shutdown()
+
+        self.assertEqual(1, entries)
+        self.assertEqual("wal", journal_mode)
+        self.assertFalse(os.path.exists(metadata_store.db_path + "-wal"))
+
+    async def test_wal_mode_read_only(self) -> None:
+        """
+        Test if the connections of the read pool cannot write.
+        """
+        metadata_store = self.create_wal_store()
+
+        def add_torrent() -> None:
+            with db_session:
+                metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+
+        with self.assertRaises(OperationalError):
+            await metadata_store.run_threaded_read(add_torrent)
+        metadata_store.shutdown()
+
+    async def test_wal_mode_checkpoint(self) -> None:
+        """
+        Test if the write-ahead log is checkpointed after writes, once the checkpoint interval has passed.
+        """
+        metadata_store = self.create_wal_store()
+        metadata_store.wal_checkpoint_interval = 0
+        metadata_store.checkpoint = Mock()
+
+        await metadata_store.run_threaded(metadata_store.get_num_torrents)
+        metadata_store.wal_mode = False
+        metadata_store.shutdown()
+
+        metadata_store.checkpoint.assert_called_once_with()
+
+    def test_wal_mode_memory(self) -> None:
+        """
+        Test if WAL mode is not used for in-memory databases.
+        """
+        metadata_store = MetadataStore(":memory:", self.private_key(0), check_tables=False, wal_mode=True)
+
+        self.assertFalse(metadata_store.wal_mode)
+        self.assertIsNone(metadata_store._read_executor)  # noqa: SLF001
+        metadata_store.shutdown()
+
+    def test_signature_workers(self) -> None:
+        """
+        Test if payload signatures are checked by worker threads if signature workers are requested.
+        """
+        metadata_store = MetadataStore(":memory:", self.private_key(0), check_tables=False, signature_workers=2)
+        payloads = self.create_signed_payloads(3)
+
+        executor = metadata_store.signature_executor
+        with patch("tribler.core.database.serialization.SIGNATURE_CHECK_CHUNK_SIZE", 2), \
+                patch.object(executor, "map", wraps=executor.map) as executor_map:
+            results = metadata_store.process_payloads(payloads, skip_personal_metadata_payload=False)
+        metadata_store.shutdown()
+
+        self.assertEqual(3, len(results))
+        executor_map.assert_called_once()
+        self.assertTrue(metadata_store.signature_executor._shutdown)  # noqa: SLF001
+
     @db_session
     def test_ffa_with_tracker_info(self) -> None:
         """
@@ -284,6 +509,320 @@ class TestMetadataStore(TestBase[MockCommunity]):
         ordered1, = self.metadata_store.get_entries_query(sort_by="size", tags=["tag1", "tag2"])[:]
         self.assertEqual(3, ordered1.size)
 
+    @db_session
+    def test_search_rank_function(self) -> None:
+        """
+        Test if the search_rank SQL function gives the same results as the torrent_rank function.
+        """
+        args = ("Big Buck Bunny", "Big.Buck.Bunny.2008.1080p", 10, 3, 86400)
+
+        value, = self.metadata_store.db.select("search_rank($args[0], $args[1], $args[2], $args[3], $args[4])")
+
+        self.assertEqual(torrent_rank(*args), value)
+
+    def get_health_columns(self, infohash: bytes) -> tuple[int, int, int, float]:
+        """
+        Get the health columns of the entry with the given infohash.
+        """
+        with db_session:
+            return self.metadata_store.db.get_connection().execute(
+                "SELECT health_seeders, health_leechers, health_last_check, health_rank FROM ChannelNode "
+                "WHERE infohash = ?", (infohash, )).fetchone()
+
+    def test_health_columns_insert(self) -> None:
+        """
+        Test if the health columns are filled when an entry is added for a torrent with a known health.
+        """
+        with db_session:
+            self.metadata_store.process_torrent_health(HealthInfo(b"\x01" * 20, seeders=7, leechers=3, last_check=42))
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+
+        self.assertEqual((7, 3, 42, seeders_rank(7, 3)), self.get_health_columns(b"\x01" * 20))
+
+    def test_health_columns_update(self) -> None:
+        """
+        Test if the health columns follow updates of the health of a torrent.
+        """
+        with db_session:
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+        with db_session:
+            self.metadata_store.process_torrent_health(HealthInfo(b"\x01" * 20, seeders=7, leechers=3,
+                                                                  last_check=int(time())))
+
+        seeders, leechers, _, rank = self.get_health_columns(b"\x01" * 20)
+        self.assertEqual((7, 3, seeders_rank(7, 3)), (seeders, leechers, rank))
+
+    def test_health_columns_migration(self) -> None:
+        """
+        Test if the health columns are added to and filled for databases of an older version.
+        """
+        db_path = os.path.join(self.temporary_directory(), "metadata.db")
+        metadata_store = MetadataStore(db_path, self.private_key(0))
+        with db_session:
+            metadata_store.process_torrent_health(HealthInfo(b"\x01" * 20, seeders=7, leechers=3, last_check=42))
+            metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+        metadata_store.shutdown()
+        connection = sqlite3.connect(db_path)
+        for trigger in ["channelnode_health_ai", "channelnode_health_au", "torrentstate_health_au"]:
+            connection.execute(f"DROP TRIGGER {trigger}")
+        for index in ["idx_channelnode__health_seeders_leechers", "idx_channelnode__rowid_health_seeders"]:
+            connection.execute(f"DROP INDEX {index}")
+        for column in ["health_seeders", "health_leechers", "health_last_check", "health_rank"]:
+            connection.execute(f"ALTER TABLE ChannelNode DROP {column}")
+        connection.execute("UPDATE MiscData SET value = '15' WHERE name = 'db_version'")
+        connection.commit()
+        connection.close()
+
+        metadata_store = MetadataStore(db_path, self.private_key(0))
+        with db_session:
+            values = metadata_store.db.get_connection().execute(
+                "SELECT health_seeders, health_leechers, health_last_check FROM ChannelNode").fetchall()
+            fts_trigger, = metadata_store.db.get_connection().execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'fts_au'").fetchone()
+            db_version = metadata_store.get_value("db_version")
+        metadata_store.shutdown()
+
+        self.assertEqual([(7, 3, 42)], values)
+        self.assertIn("UPDATE OF title", fts_trigger)
+        self.assertEqual("16", db_version)
+
+    def test_health_columns_upgraded(self) -> None:
+        """
+        Test if the health columns are not added again to a database of the current version.
+        """
+        db_path = os.path.join(self.temporary_directory(), "metadata.db")
+        MetadataStore(db_path, self.private_key(0)).shutdown()
+
+        metadata_store = MetadataStore(db_path, self.private_key(0))
+        with db_session:
+            columns = [column[1] for column in metadata_store.db.get_connection().execute(
+                "PRAGMA table_info(ChannelNode)").fetchall()]
+        metadata_store.shutdown()
+
+        self.assertEqual(1, columns.count("health_seeders"))
+
+    @db_session
+    def test_get_entries_query_sort_by_health(self) -> None:
+        """
+        Test if entries are properly sorted by health.
+        """
+        for i, seeders in enumerate([5, 20, 1]):
+            self.metadata_store.process_torrent_health(HealthInfo(bytes([i]) * 20, seeders=seeders, leechers=0,
+                                                                  last_check=42))
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": bytes([i]) * 20, "title": str(i)})
+
+        results = self.metadata_store.get_entries_query(sort_by="HEALTH", sort_desc=True)[:]
+
+        self.assertEqual([20, 5, 1], [r.health.seeders for r in results])
+
+    @db_session
+    def test_get_entries_query_popular(self) -> None:
+        """
+        Test if popular entries are the recently checked entries with the most seeders.
+        """
+        for i, seeders in enumerate([5, 0, 20]):
+            self.metadata_store.process_torrent_health(HealthInfo(bytes([i]) * 20, seeders=seeders, leechers=0,
+                                                                  last_check=int(time())))
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": bytes([i]) * 20, "title": str(i)})
+
+        results = self.metadata_store.get_entries_query(popular=True, metadata_type=REGULAR_TORRENT)[:]
+
+        self.assertEqual([20, 5], [r.health.seeders for r in results])
+
+    @db_session
+    def test_get_entries_query_txt_filter_ranked(self) -> None:
+        """
+        Test if text search results are ordered by their search rank.
+        """
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\xab" * 20, "title": "a big b buck bunny"})
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\xcd" * 20, "title": "big buck bunny"})
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\xef" * 20, "title": "big bunny buck"})
+
+        results = self.metadata_store.get_entries_query(txt_filter="big buck bunny")[:]
+
+        self.assertEqual(["big buck bunny", "big bunny buck", "a big b buck bunny"], [r.title for r in results])
+
+    def search_titles(self, metadata_store: MetadataStore, query: str) -> list[str]:
+        """
+        Get the titles of the entries that match the given text query.
+        """
+        with db_session:
+            return sorted(r.title for r in metadata_store.get_entries_query(txt_filter=query))
+
+    def test_fts_update_title(self) -> None:
+        """
+        Test if the terms of an old title are removed from the FTS index when the title is updated.
+        """
+        with db_session:
+            entry = self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "old"})
+            entry.title = "new"
+
+        self.assertEqual([], self.search_titles(self.metadata_store, "old"))
+        self.assertEqual(["new"], self.search_titles(self.metadata_store, "new"))
+
+    def test_fts_delete(self) -> None:
+        """
+        Test if the terms of a deleted entry are removed from the FTS index.
+        """
+        with db_session:
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"}).delete()
+            indexed = self.metadata_store.db.get_connection().execute(
+                "SELECT count(*) FROM FtsIndex WHERE FtsIndex MATCH 'test'").fetchone()
+
+        self.assertEqual((0, ), indexed)
+
+    def test_upgrade_fts_triggers(self) -> None:
+        """
+        Test if missing FTS triggers are restored and the FTS index is rebuilt for existing databases.
+        """
+        db_path = os.path.join(self.temporary_directory(), "metadata.db")
+        metadata_store = MetadataStore(db_path, self.private_key(0))
+        with db_session:
+            metadata_store.drop_fts_triggers()
+            metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+        metadata_store.shutdown()
+
+        metadata_store = MetadataStore(db_path, self.private_key(0))
+        with db_session:
+            triggers = metadata_store.db.get_connection().execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'fts_%'").fetchall()
+        results = self.search_titles(metadata_store, "test")
+        metadata_store.shutdown()
+
+        self.assertEqual({("fts_ai", ), ("fts_ad", ), ("fts_au", )}, set(triggers))
+        self.assertEqual(["test"], results)
+
+    def test_deferred_fts(self) -> None:
+        """
+        Test if the FTS index is only updated when a deferred FTS context exits.
+        """
+        with self.metadata_store.deferred_fts():
+            with db_session:
+                self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+            deferred_results = self.search_titles(self.metadata_store, "test")
+
+        self.assertEqual([], deferred_results)
+        self.assertEqual(["test"], self.search_titles(self.metadata_store, "test"))
+
+    def test_deferred_fts_triggers(self) -> None:
+        """
+        Test if the FTS triggers are restored after a deferred FTS context exits.
+        """
+        with self.metadata_store.deferred_fts():
+            pass
+        with db_session:
+            self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+
+        self.assertEqual(["test"], self.search_titles(self.metadata_store, "test"))
+
+    def test_process_squashed_mdblob_deferred_fts(self) -> None:
+        """
+        Test if entries that are processed with deferred FTS updates can be found.
+        """
+        payloads = self.create_signed_payloads(3)
+        blob = b"".join(payload.serialized() + payload.signature for payload in payloads)
+
+        self.metadata_store.deferred_fts = Mock(wraps=self.metadata_store.deferred_fts)
+        self.metadata_store.process_squashed_mdblob(blob, deferred_fts=True)
+
+        self.metadata_store.deferred_fts.assert_called_once_with()
+        self.assertEqual(sorted(p.title for p in payloads), self.search_titles(self.metadata_store, "torrent"))
+
+    def test_merge_fts_segments(self) -> None:
+        """
+        Test if the segments of the FTS index can be merged until there is nothing left to merge.
+        """
+        for i in range(5):
+            with db_session:
+                self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": bytes([i]) * 20, "title": "test"})
+
+        merged = self.metadata_store.merge_fts_segments()
+        merged_again = self.metadata_store.merge_fts_segments()
+
+        self.assertTrue(merged)
+        self.assertFalse(merged_again)
+        self.assertEqual(5, len(self.search_titles(self.metadata_store, "test")))
+
+    @db_session
+    def test_get_entries_cached(self) -> None:
+        """
+        Test if repeated text searches are served from the search cache.
+        """
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\xab" * 20, "title": "big buck bunny"})
+        self.metadata_store.get_entries(txt_filter="bunny")
+
+        with patch.object(self.metadata_store, "get_entries_query") as get_entries_query:
+            results = self.metadata_store.get_entries(txt_filter="bunny")
+
+        get_entries_query.assert_not_called()
+        self.assertEqual(["big buck bunny"], [r.title for r in results])
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1}, self.metadata_store.search_cache.get_statistics())
+
+    @db_session
+    def test_get_entries_cache_invalidated_health(self) -> None:
+        """
+        Test if an update of the health of a known torrent invalidates the search cache.
+        """
+        self.metadata_store.process_torrent_health(HealthInfo(b"\x01" * 20, seeders=1, leechers=0, last_check=1))
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+        self.metadata_store.get_entries(popular=True, metadata_type=REGULAR_TORRENT)
+        self.assertEqual(1, len(self.metadata_store.search_cache))
+
+        self.metadata_store.process_torrent_health(HealthInfo(b"\x01" * 20, seeders=7, leechers=0, last_check=2))
+
+        self.assertEqual(0, len(self.metadata_store.search_cache))
+
+    @db_session
+    def test_get_entries_cache_invalidated(self) -> None:
+        """
+        Test if processing a new payload invalidates the search cache.
+        """
+        self.metadata_store.get_entries(txt_filter="bunny")
+        other_key = default_eccrypto.generate_key("curve25519")
+        md = self.metadata_store.TorrentMetadata(title="big buck bunny", infohash=b"\x01" * 20, id_=0, timestamp=0,
+                                                 torrent_date=int2time(0), public_key=other_key.key_to_bin())
+        payload = md.payload_class.from_signed_blob(md.serialized(other_key))
+        md.delete()
+
+        self.metadata_store.process_payload(payload)
+        results = self.metadata_store.get_entries(txt_filter="bunny")
+
+        self.assertEqual(["big buck bunny"], [r.title for r in results])
+
+    @db_session
+    def test_get_entries_profiled(self) -> None:
+        """
+        Test if entry queries are profiled when query profiling is enabled.
+        """
+        self.metadata_store.query_profiler.enabled = True
+        self.metadata_store.TorrentMetadata.add_ffa_from_dict({"infohash": b"\x01" * 20, "title": "test"})
+
+        results = self.metadata_store.get_entries(sort_by="HEALTH", first=1, last=10)
+        stats, = self.metadata_store.query_profiler.get_statistics()
+
+        self.assertEqual(1, len(results))
+        self.assertEqual("sort_by=HEALTH", stats["shape"])
+        self.assertIn("ChannelNode", stats["sql"])
+        self.assertNotEqual([], stats["plan"])
+
+    @db_session
+    def test_get_entries_not_profiled(self) -> None:
+        """
+        Test if entry queries are not profiled by default.
+        """
+        self.metadata_store.get_entries(sort_by="HEALTH")
+
+        self.assertEqual([], self.metadata_store.query_profiler.get_statistics())
+
+    @db_session
+    def test_get_entries_not_cached(self) -> None:
+        """
+        Test if cheap queries are not cached.
+        """
+        self.metadata_store.get_entries(infohash=b"\x01" * 20)
+
+        self.assertEqual(0, len(self.metadata_store.search_cache))
+
     def test_fast_integrity_check_no_remove(self) -> None:
         """
         Check that we detect a random file as broken.
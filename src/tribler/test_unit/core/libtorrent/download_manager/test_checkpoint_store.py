@@ -0,0 +1,108 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from ipv8.test.base import TestBase
+
+from tribler.core.libtorrent.download_manager.checkpoint_store import CheckpointStore, dump_config, load_config
+from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
+
+
+class TestCheckpointStore(TestBase):
+    """
+    Tests for the CheckpointStore class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new store in a temporary directory.
+        """
+        super().setUp()
+        self.path = Path(self.temporary_directory()) / "dlcheckpoints" / "checkpoints.db"
+        self.store = CheckpointStore(self.path)
+        self.config = DownloadConfig(DownloadConfig.get_parser())
+
+    async def tearDown(self) -> None:
+        """
+        Close the store.
+        """
+        self.store.close()
+        await super().tearDown()
+
+    def test_load_no_database(self) -> None:
+        """
+        Test if loading without a database does not create the database.
+        """
+        self.assertEqual([], self.store.load())
+        self.assertFalse(self.path.exists())
+
+    def test_put_flush_load(self) -> None:
+        """
+        Test if flushed checkpoints can be loaded by a new store.
+        """
+        self.config.set_hops(2)
+        self.store.put(b"\x01" * 20, self.config, b"de")
+        self.store.flush()
+
+        (infohash, dumped, resume_data), = CheckpointStore(self.path).load()
+        config = DownloadConfig(DownloadConfig.get_parser())
+        load_config(config, dumped)
+
+        self.assertEqual(b"\x01" * 20, infohash)
+        self.assertEqual(b"de", resume_data)
+        self.assertEqual(2, config.get_hops())
+
+    def test_contains(self) -> None:
+        """
+        Test if checkpoints are known while they are buffered, written, and not after they are removed.
+        """
+        self.store.put(b"\x01" * 20, self.config, b"de")
+        buffered = b"\x01" * 20 in self.store
+        self.store.flush()
+        written = b"\x01" * 20 in self.store
+        self.store.remove(b"\x01" * 20)
+
+        self.assertTrue(buffered)
+        self.assertTrue(written)
+        self.assertNotIn(b"\x01" * 20, self.store)
+
+    def test_remove(self) -> None:
+        """
+        Test if removed checkpoints are removed from the database.
+        """
+        self.store.put(b"\x01" * 20, self.config, b"de")
+        self.store.put(b"\x02" * 20, self.config, b"de")
+        self.store.flush()
+
+        self.store.remove(b"\x01" * 20)
+        self.store.flush()
+
+        self.assertEqual([b"\x02" * 20], [row[0] for row in self.store.load()])
+
+    def test_write_failure_requeue(self) -> None:
+        """
+        Test if checkpoints that could not be written are kept, unless they were replaced in the meantime.
+        """
+        self.store.put(b"\x01" * 20, self.config, b"de")
+        self.store.put(b"\x02" * 20, self.config, b"de")
+        pending = self.store.take_pending()
+        self.store.put(b"\x02" * 20, self.config, b"le")
+
+        with patch.object(CheckpointStore, "open", side_effect=OSError):
+            written = self.store.write(pending)
+        self.store.requeue(pending)
+
+        self.assertFalse(written)
+        self.assertEqual(b"de", self.store.pending[b"\x01" * 20][1])
+        self.assertEqual(b"le", self.store.pending[b"\x02" * 20][1])
+
+    def test_dump_config_no_resume_data(self) -> None:
+        """
+        Test if the resume data is not stored in the serialized config.
+        """
+        self.config.config["state"]["engineresumedata"] = "ZGU="
+        self.config.set_hops(3)
+
+        dumped = dump_config(self.config)
+
+        self.assertNotIn("ZGU=", dumped)
+        self.assertIn("hops", dumped)
@@ -52,6 +52,21 @@ class TestDHTHealthManager(TestBase):
         self.assertEqual(lookup_future, self.manager.get_health(b"a" * 20, timeout=0.01))
         await lookup_future
 
+    async def test_packet_inspection(self) -> None:
+        """
+        Test if packet inspection is only enabled while there are outstanding lookups.
+        """
+        self.manager.set_packet_inspection = Mock()
+
+        first_lookup = self.manager.get_health(b"a" * 20, timeout=0.01)
+        second_lookup = self.manager.get_health(b"b" * 20, timeout=0.02)
+        await first_lookup
+        calls_during_lookups = self.manager.set_packet_inspection.call_args_list[:]
+        await second_lookup
+
+        self.assertEqual([((True,),)], calls_during_lookups)
+        self.assertEqual(((False,),), self.manager.set_packet_inspection.call_args)
+
     async def test_combine_bloom_filters_equal(self) -> None:
         """
         Test if two bloom equal filters can be combined.
@@ -113,3 +128,38 @@ class TestDHTHealthManager(TestBase):
 
         self.assertEqual(bytearray(b"\xee" * 256), self.manager.bf_seeders[infohash])
         self.assertEqual(bytearray(b"\xff" * 256), self.manager.bf_peers[infohash])
+
+    def test_receive_bloomfilters_concurrent(self) -> None:
+        """
+        Test if the bloom filters of concurrent lookups are merged per lookup, and only finalize their own transactions.
+        """
+        for infohash in [b"a" * 20, b"b" * 20]:
+            self.manager.lookup_futures[infohash] = Future()
+            self.manager.bf_seeders[infohash] = bytearray(256)
+            self.manager.bf_peers[infohash] = bytearray(256)
+        self.manager.requesting_bloomfilters("1", b"a" * 20)
+        self.manager.requesting_bloomfilters("2", b"a" * 20)
+        self.manager.requesting_bloomfilters("3", b"b" * 20)
+
+        self.manager.received_bloomfilters("1", bf_seeds=bytearray(b"\x01" * 256))
+        self.manager.received_bloomfilters("2", bf_seeds=bytearray(b"\x02" * 256))
+        self.manager.received_bloomfilters("3", bf_seeds=bytearray(b"\x04" * 256))
+        lookup_future = self.manager.lookup_futures[b"a" * 20]
+        self.manager.finalize_lookup(b"a" * 20)
+
+        self.assertEqual({"3": b"b" * 20}, self.manager.outstanding)
+        self.assertEqual(bytearray(b"\x04" * 256), self.manager.bf_seeders[b"b" * 20])
+        self.assertEqual(self.manager.get_size_from_bloomfilter(bytearray(b"\x03" * 256)),
+                         lookup_future.result().seeders)
+
+    def test_requesting_bloomfilters_reused_transaction(self) -> None:
+        """
+        Test if a transaction id that is reused for an infohash that we are not interested in is forgotten.
+        """
+        self.manager.lookup_futures[b"a" * 20] = Future()
+        self.manager.requesting_bloomfilters("1", b"a" * 20)
+
+        self.manager.requesting_bloomfilters("1", b"b" * 20)
+
+        self.assertEqual({}, self.manager.outstanding)
+        self.assertEqual(set(), self.manager.transactions[b"a" * 20])
@@ -2,13 +2,12 @@ import sys
 from asyncio import Future, ensure_future, sleep
 from binascii import hexlify
 from pathlib import Path
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, call
 
 import libtorrent
 from ipv8.test.base import TestBase
 from ipv8.util import succeed
 
-import tribler
 from tribler.core.libtorrent.download_manager.download import Download, SaveResumeDataError
 from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
 from tribler.core.libtorrent.torrentdef import TorrentDef
@@ -22,19 +21,6 @@ from tribler.test_unit.core.libtorrent.mocks import (
 from tribler.test_unit.mocks import MockTriblerConfigManager
 
 
-class PermissionErrorDownloadConfig(DownloadConfig):
-    """
-    A mocked DownloadConfig that raises a PermissionError on write.
-    """
-
-    def write(self, filename: Path) -> None:
-        """
-        Perform a crash.
-        """
-        self.config["download_defaults"]["TEST_CRASH"] = "True"
-        raise PermissionError
-
-
 class TestDownload(TestBase):
     """
     Tests for the Download class.
@@ -73,6 +59,19 @@ class TestDownload(TestBase):
         self.assertEqual(call(False), download.handle.set_upload_mode.call_args)
         self.assertEqual(call(), download.handle.resume.call_args)
 
+    def test_mark_changed_alert(self) -> None:
+        """
+        Test if processing an alert gives a download a newer version than any other download.
+        """
+        download = Download(TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT), self.dlmngr,
+                            checkpoint_disabled=True, config=self.create_mock_download_config())
+        other = Download(TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT), self.dlmngr,
+                         checkpoint_disabled=True, config=self.create_mock_download_config())
+
+        download.process_alert(Mock(), "tracker_reply_alert")
+
+        self.assertGreater(download.version, other.version)
+
     async def test_save_resume(self) -> None:
         """
         Test if a download is resumed after fetching the save/resume data.
@@ -151,12 +150,10 @@ class TestDownload(TestBase):
         download = Download(FakeTDef(), self.dlmngr, checkpoint_disabled=True,
                             config=self.create_mock_download_config())
         download.checkpoint_disabled = False
-        download.download_manager = Mock(get_checkpoint_dir=Mock(return_value=Path("foo")))
+        download.download_manager = Mock(checkpoint_store=set())
         download.alert_handlers["save_resume_data_alert"] = [alerts.append]
 
-        with patch.dict(tribler.core.libtorrent.download_manager.download.__dict__,
-                        {"Path": Mock(return_value=Mock(is_file=Mock(return_value=False)))}):
-            value = await download.checkpoint()
+        value = await download.checkpoint()
 
         self.assertIsNone(value)
         self.assertEqual(None, alerts[0].category())
@@ -170,12 +167,10 @@ class TestDownload(TestBase):
         download = Download(FakeTDef(), self.dlmngr, checkpoint_disabled=True,
                             config=self.create_mock_download_config())
         download.checkpoint_disabled = False
-        download.download_manager = Mock(get_checkpoint_dir=Mock(return_value=Path("foo")))
+        download.download_manager = Mock(checkpoint_store={b"\x01" * 20})
         download.alert_handlers["save_resume_data_alert"] = [alerts.append]
 
-        with patch.dict(tribler.core.libtorrent.download_manager.download.__dict__,
-                        {"Path": Mock(return_value=Mock(is_file=Mock(return_value=True)))}):
-            value = await download.checkpoint()
+        value = await download.checkpoint()
 
         self.assertIsNone(value)
         self.assertEqual([], alerts)
@@ -547,21 +542,23 @@ class TestDownload(TestBase):
 
         self.assertIsNone(await task)
 
-    def test_on_save_resume_data_alert_permission_denied(self) -> None:
+    def test_on_save_resume_data_alert(self) -> None:
         """
-        Test if permission error in writing the download config does not crash the save resume alert handler.
+        Test if the resume data and the download config are handed to the checkpoint store.
         """
         download = Download(FakeTDef(), self.dlmngr, checkpoint_disabled=True,
-                            config=PermissionErrorDownloadConfig(self.create_mock_download_config().config))
+                            config=self.create_mock_download_config())
         download.checkpoint_disabled = False
-        download.download_manager = Mock(get_checkpoint_dir=Mock(return_value=Path(__file__).absolute().parent))
+        download.download_manager = Mock()
         atp = libtorrent.add_torrent_params()
         atp.name = "test"
 
         download.on_save_resume_data_alert(Mock(params=atp))
+        infohash, config, resume_data = download.download_manager.checkpoint_store.put.call_args.args
 
-        self.assertTrue(download.config.config["download_defaults"]["TEST_CRASH"])
-        self.assertEqual("test", download.config.config["download_defaults"]["name"])
+        self.assertEqual(b"\x01" * 20, infohash)
+        self.assertEqual("test", config.config["download_defaults"]["name"])
+        self.assertEqual("test", libtorrent.read_resume_data(resume_data).name)
 
     async def test_get_tracker_status_unicode_decode_error(self) -> None:
         """
@@ -13,10 +13,12 @@ from ipv8.test.base import TestBase
 from ipv8.util import succeed
 
 import tribler
+from tribler.core.libtorrent.download_manager.checkpoint_store import CheckpointStore
 from tribler.core.libtorrent.download_manager.download import Download
 from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
 from tribler.core.libtorrent.download_manager.download_manager import DownloadManager, MetainfoLookup
 from tribler.core.libtorrent.download_manager.download_state import DownloadState
+from tribler.core.libtorrent.download_manager.metainfo_cache import MetainfoCache
 from tribler.core.libtorrent.torrentdef import TorrentDef
 from tribler.core.notifier import Notifier
 from tribler.test_unit.core.libtorrent.mocks import TORRENT_WITH_DIRS_CONTENT, FakeTDef
@@ -44,6 +46,8 @@ class TestDownloadManager(TestBase):
         self.manager.set_download_states_callback(self.manager.sesscb_states_callback)
         # Just in case some patch fails, point this to a non-existent directory
         self.manager.config.set("libtorrent/download_defaults/saveas", "__TEST__")
+        self.manager.metainfo_disk_cache = MetainfoCache(Path(self.temporary_directory()))
+        self.manager.checkpoint_store = CheckpointStore(Path(self.temporary_directory()) / "checkpoints.db")
 
     async def tearDown(self) -> None:
         """
@@ -139,6 +143,56 @@ class TestDownloadManager(TestBase):
 
         self.assertEqual("test", (await self.manager.get_metainfo(b"a" * 20))["tdef"].name)
 
+    async def test_get_metainfo_store_disk_cache(self) -> None:
+        """
+        Test if retrieved metainfo is stored in the disk cache.
+        """
+        download = Download(TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT), self.manager,
+                            checkpoint_disabled=True, config=self.create_mock_download_config())
+        download.future_metainfo = succeed(None)
+        download.get_state = Mock(return_value=Mock(get_num_seeds_peers=Mock(return_value=(42, 7))))
+
+        with patch.object(self.manager, "start_download", AsyncMock(return_value=download)), \
+                patch.object(self.manager, "remove_download", AsyncMock()), \
+                self._patch_dlconfig(self.create_mock_download_config()):
+            await self.manager.get_metainfo(download.tdef.infohash)
+
+        self.assertIsNotNone(self.manager.metainfo_disk_cache.get(download.tdef.infohash))
+
+    async def test_get_metainfo_disk_cache(self) -> None:
+        """
+        Test if metainfo from the disk cache is returned without joining the swarm, and cached in memory.
+        """
+        tdef = TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT)
+        self.manager.metainfo_disk_cache.put(tdef.infohash, tdef.torrent_info)
+
+        with patch.object(self.manager, "start_download", AsyncMock()) as start_download:
+            metainfo = await self.manager.get_metainfo(tdef.infohash)
+
+        start_download.assert_not_called()
+        self.assertEqual(tdef.infohash, metainfo["tdef"].infohash)
+        self.assertEqual(tdef.torrent_info.name(), metainfo["tdef"].torrent_info.name())
+        self.assertIn(tdef.infohash, self.manager.metainfo_cache)
+
+    async def test_get_metainfo_disk_cache_health_check(self) -> None:
+        """
+        Test if a health check with metainfo from the disk cache joins the swarm, without waiting for the metainfo.
+        """
+        tdef = TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT)
+        self.manager.metainfo_disk_cache.put(tdef.infohash, tdef.torrent_info)
+        download = Mock(future_metainfo=Future(), get_state=Mock(return_value=Mock(
+            get_num_seeds_peers=Mock(return_value=(42, 7))
+        )))
+
+        with patch.object(self.manager, "start_download", AsyncMock(return_value=download)) as start_download, \
+                patch.object(self.manager, "remove_download", AsyncMock()):
+            download.tdef = TorrentDef(libtorrent.add_torrent_params())
+            download.tdef.atp.ti = tdef.torrent_info
+            metainfo = await self.manager.get_metainfo(tdef.infohash, timeout=0, health_check=True)
+
+        self.assertIsNotNone(start_download.call_args.kwargs["tdef"].torrent_info)
+        self.assertEqual(42, metainfo["seeders"])
+
     async def test_get_metainfo_with_already_added_torrent(self) -> None:
         """
         Test if metainfo can be fetched for a torrent which is already in session.
@@ -426,6 +480,95 @@ class TestDownloadManager(TestBase):
 
         self.assertFalse(value)
 
+    async def test_load_checkpoint_unchanged(self) -> None:
+        """
+        Test if a checkpoint that does not need an upgrade is not written back to disk.
+        """
+        download_config = self.create_mock_download_config()
+        download_config.set_engineresumedata(self.atp_from_dict({b"info": {
+            b"name": b"torrent name",
+            b"files": [{b"path": [b"a.txt"], b"length": 123}],
+            b"piece length": 128,
+            b"pieces": b"\x00" * 20
+        }}))
+        download_config.set_dest_dir(Path(__file__).absolute().parent)
+        with self._patch_dlconfig(download_config), patch.object(self.manager, "start_download", AsyncMock()), \
+                patch.object(self.BASE_DLCONFIG, "write") as write:
+            value = await self.manager.load_checkpoint(self.MOCK_CONF_PATH)
+
+        self.assertTrue(value)
+        write.assert_not_called()
+
+    async def test_load_checkpoints_migrate(self) -> None:
+        """
+        Test if checkpoint files are started, moved to the checkpoint store and removed, and counted when they fail.
+        """
+        checkpoint_dir = Path(self.temporary_directory())
+        for name in ["a.conf", "b.conf", "c.conf"]:
+            (checkpoint_dir / name).touch()
+        config = self.create_mock_download_config()
+        resumedata = {name: libtorrent.add_torrent_params() for name in ["a.conf", "c.conf"]}
+        resumedata["a.conf"].info_hashes = libtorrent.info_hash_t(libtorrent.sha1_hash(b"\x01" * 20))
+        resumedata["c.conf"].info_hashes = libtorrent.info_hash_t(libtorrent.sha1_hash(b"\x03" * 20))
+        read_checkpoint = Mock(side_effect=lambda filename: (config, resumedata[filename.name])
+                               if filename.name in resumedata else None)
+
+        with patch.object(self.manager, "get_checkpoint_dir", Mock(return_value=checkpoint_dir)), \
+                patch.object(self.manager, "read_checkpoint", read_checkpoint), \
+                patch.object(self.manager, "start_checkpoint", AsyncMock()) as start_checkpoint:
+            await self.manager.load_checkpoints()
+
+        self.assertEqual(3, self.manager.checkpoints_count)
+        self.assertEqual(3, self.manager.checkpoints_loaded)
+        self.assertTrue(self.manager.all_checkpoints_are_loaded)
+        self.assertCountEqual([call(checkpoint_dir / "a.conf", config, resumedata["a.conf"]),
+                               call(checkpoint_dir / "c.conf", config, resumedata["c.conf"])],
+                              start_checkpoint.call_args_list)
+        self.assertEqual(["b.conf"], [path.name for path in checkpoint_dir.glob("*.conf")])
+        self.assertEqual({b"\x01" * 20, b"\x03" * 20}, {row[0] for row in self.manager.checkpoint_store.load()})
+
+    async def test_load_checkpoints_stored(self) -> None:
+        """
+        Test if the checkpoints in the checkpoint store are started.
+        """
+        config = self.create_mock_download_config()
+        config.set_dest_dir(Path(__file__).absolute().parent)
+        config.set_hops(2)
+        atp = libtorrent.add_torrent_params()
+        atp.info_hashes = libtorrent.info_hash_t(libtorrent.sha1_hash(b"\x01" * 20))
+        self.manager.checkpoint_store.put(b"\x01" * 20, config, libtorrent.write_resume_data_buf(atp))
+        self.manager.checkpoint_store.flush()
+
+        with patch.object(self.manager, "get_checkpoint_dir", Mock(return_value=Path(self.temporary_directory()))), \
+                patch.object(self.manager, "start_download", AsyncMock()) as start_download:
+            await self.manager.load_checkpoints()
+
+        self.assertEqual(1, self.manager.checkpoints_loaded)
+        self.assertEqual(b"\x01" * 20, start_download.call_args.kwargs["tdef"].infohash)
+        self.assertEqual(2, start_download.call_args.kwargs["config"].get_hops())
+        self.assertIsNotNone(start_download.call_args.kwargs["config"].get_engineresumedata())
+
+    async def test_flush_checkpoints(self) -> None:
+        """
+        Test if buffered checkpoints are written to the checkpoint store.
+        """
+        self.manager.checkpoint_store.put(b"\x01" * 20, self.create_mock_download_config(), b"de")
+
+        await self.manager.flush_checkpoints()
+
+        self.assertEqual({}, self.manager.checkpoint_store.pending)
+        self.assertEqual(1, len(self.manager.checkpoint_store.load()))
+
+    def test_remove_config(self) -> None:
+        """
+        Test if removing the config of a download removes its checkpoint.
+        """
+        self.manager.checkpoint_store.put(b"\x01" * 20, self.create_mock_download_config(), b"de")
+
+        self.manager.remove_config(b"\x01" * 20)
+
+        self.assertNotIn(b"\x01" * 20, self.manager.checkpoint_store)
+
     async def test_download_manager_start(self) -> None:
         """
         Test if all (zero) checkpoints are loaded when starting without downloads.
@@ -522,6 +665,20 @@ class TestDownloadManager(TestBase):
 
         self.assertEqual("AwesomeTorrent", start_download.call_args.kwargs["tdef"].name)
 
+    async def test_start_download_from_magnet_disk_cache(self) -> None:
+        """
+        Test if a download from a magnet link starts with the metainfo from the disk cache, if available.
+        """
+        tdef = TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT)
+        self.manager.metainfo_disk_cache.put(tdef.infohash, tdef.torrent_info)
+        magnet = f"magnet:?xt=urn:btih:{hexlify(tdef.infohash).decode()}"
+
+        with (patch.object(self.manager, "start_download", AsyncMock(return_value=Mock(get_handle=AsyncMock())))
+              as start_download):
+            await self.manager.start_download_from_uri(magnet)
+
+        self.assertEqual(tdef.torrent_info.name(), start_download.call_args.kwargs["tdef"].torrent_info.name())
+
     async def test_start_download_from_magnet_with_all_extras(self) -> None:
         """
         Test if a download is started with all six supported extras in the URI.
@@ -861,3 +1018,145 @@ class TestDownloadManager(TestBase):
 
         # Secondary test: rate limits should always be in whole bytes per second ((7+42)/2 is rounded down)
         self.assertEqual(call({"upload_rate_limit": 24, "download_rate_limit": 24}), session.apply_settings.call_args)
+
+    async def test_alert_pump(self) -> None:
+        """
+        Test if pending alerts are processed when the pump starts, and when libtorrent notifies us of new alerts.
+        """
+        alert = type("listen_succeeded_alert", (object,), {"address": "127.0.0.1", "port": 1234})
+        self.manager.register_alert_handler(alert, self.manager.on_listen_succeeded_alert)
+        session = self.manager.ltsessions[0].result()
+        session.pop_alerts = Mock(return_value=[alert()])
+
+        self.manager._start_alert_pump(0, self.manager.ltsessions[0])  # noqa: SLF001
+        session.pop_alerts.return_value = [alert()]
+        alert.address, alert.port = "::1", 42
+        notify, = session.set_alert_notify.call_args.args
+        notify()
+        await sleep(0)
+
+        self.assertEqual({"127.0.0.1": 1234, "::1": 42}, self.manager.listen_ports[0])
+
+    def test_process_alerts_error(self) -> None:
+        """
+        Test if a failing alert does not prevent the processing of the other alerts.
+        """
+        broken_alert = type("listen_succeeded_alert", (object,), {})
+        alert = type("listen_succeeded_alert", (object,), {"address": "::1", "port": 42})
+        self.manager.register_alert_handler(broken_alert, self.manager.on_listen_succeeded_alert)
+        self.manager.register_alert_handler(alert, self.manager.on_listen_succeeded_alert)
+        session = self.manager.ltsessions[0].result()
+        session.pop_alerts = Mock(return_value=[broken_alert(), alert()])
+
+        self.manager._process_alerts(0)  # noqa: SLF001
+
+        self.assertEqual({"::1": 42}, self.manager.listen_ports[0])
+
+    def test_torrent_updates_interval(self) -> None:
+        """
+        Test if torrent updates are requested less often while nothing changes, and as often as possible otherwise.
+        """
+        alert = type("state_update_alert", (object,), {"status": []})
+        self.manager.register_alert_handler(alert, self.manager.on_state_update_alert)
+
+        self.manager.process_alert(alert())
+        self.manager.process_alert(alert())
+        slow_interval = self.manager.torrent_updates_interval
+        alert.status = [Mock(info_hashes=libtorrent.info_hash_t(libtorrent.sha1_hash(b"\x01" * 20)))]
+        self.manager.process_alert(alert())
+
+        self.assertEqual(4.0, slow_interval)
+        self.assertEqual(1.0, self.manager.torrent_updates_interval)
+
+    async def test_request_torrent_updates_error(self) -> None:
+        """
+        Test if torrent updates are still requested after a request failed.
+        """
+        session = self.manager.ltsessions[0].result()
+        session.post_torrent_updates = Mock(side_effect=RuntimeError("session failed"))
+        self.manager.downloads = {b"\x01" * 20: Mock()}
+        self.manager.torrent_updates_interval = 0
+
+        self.manager.register_task("request_torrent_updates", self.manager._request_torrent_updates)  # noqa: SLF001
+        await sleep(0.01)
+
+        self.assertLess(1, session.post_torrent_updates.call_count)
+
+    def test_alert_statistics(self) -> None:
+        """
+        Test if the processed alerts are counted by type, also if they fail.
+        """
+        alert = type("listen_succeeded_alert", (object,), {})
+        self.manager.register_alert_handler(alert, self.manager.on_listen_succeeded_alert)
+
+        self.manager.process_alert(type("portmap_alert", (object,), {})())
+        with self.assertRaises(AttributeError):
+            self.manager.process_alert(alert())
+        statistics = self.manager.get_alert_statistics()
+
+        self.assertEqual({"portmap_alert", "listen_succeeded_alert"}, set(statistics))
+        self.assertEqual(1, statistics["listen_succeeded_alert"]["count"])
+        self.assertLessEqual(statistics["listen_succeeded_alert"]["max_time"],
+                             statistics["listen_succeeded_alert"]["total_time"])
+
+    def test_alert_handler_forwarding(self) -> None:
+        """
+        Test if an alert with a handler is still forwarded to its download.
+        """
+        download = Mock(config=Mock(get_hops=Mock(return_value=0)))
+        self.manager.downloads[b"\x01" * 20] = download
+        handle = Mock(info_hashes=Mock(return_value=libtorrent.info_hash_t(libtorrent.sha1_hash(b"\x01" * 20))))
+        alert = type("file_renamed_alert", (object,), {"handle": handle})
+        handler = Mock()
+        self.manager.register_alert_handler(alert, handler)
+
+        self.manager.process_alert(alert(), 0)
+
+        handler.assert_called_once()
+        download.process_alert.assert_called_once()
+        self.assertEqual("file_renamed_alert", download.process_alert.call_args.args[1])
+
+    def test_dht_packet_inspection(self) -> None:
+        """
+        Test if the raw DHT packets are only posted by the session without hops while packet inspection is enabled.
+        """
+        session = self.manager.ltsessions[0].result()
+        dht_log = libtorrent.alert.category_t.dht_log_notification
+
+        self.manager.set_dht_packet_inspection(True)
+        enabled_mask, = session.set_alert_mask.call_args.args
+        self.manager.set_dht_packet_inspection(False)
+        disabled_mask, = session.set_alert_mask.call_args.args
+
+        self.assertEqual(dht_log, enabled_mask & dht_log)
+        self.assertEqual(0, disabled_mask & dht_log)
+        self.assertEqual(0, self.manager.get_alert_mask(1) & dht_log)
+
+    def test_piece_progress(self) -> None:
+        """
+        Test if finished pieces are only posted by the session of a download while the download is streaming.
+        """
+        session = self.manager.ltsessions[0].result()
+        piece_progress = libtorrent.alert.category_t.piece_progress_notification
+        self.manager.downloads[b"\x01" * 20] = Mock(config=Mock(get_hops=Mock(return_value=0)))
+
+        self.manager.set_piece_progress(b"\x01" * 20, True)
+        enabled_mask, = session.set_alert_mask.call_args.args
+        other_mask = self.manager.get_alert_mask(1)
+        self.manager.set_piece_progress(b"\x01" * 20, False)
+        disabled_mask, = session.set_alert_mask.call_args.args
+
+        self.assertEqual(piece_progress, enabled_mask & piece_progress)
+        self.assertEqual(0, other_mask & piece_progress)
+        self.assertEqual(0, disabled_mask & piece_progress)
+
+    def test_dht_packet_no_lookups(self) -> None:
+        """
+        Test if raw DHT packets are not decoded while the DHTHealthManager has no outstanding lookups.
+        """
+        self.manager.dht_health_manager = Mock(lookup_futures={})
+
+        with patch.object(libtorrent, "bdecode") as bdecode:
+            self.manager.on_dht_pkt_alert(Mock(), 0)
+
+        bdecode.assert_not_called()
@@ -0,0 +1,107 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from ipv8.test.base import TestBase
+
+from tribler.core.libtorrent.download_manager.metainfo_cache import MetainfoCache
+from tribler.core.libtorrent.torrentdef import TorrentDef
+from tribler.test_unit.core.libtorrent.mocks import TORRENT_WITH_DIRS_CONTENT, TORRENT_WITH_VIDEO
+
+
+class TestMetainfoCache(TestBase):
+    """
+    Tests for the MetainfoCache class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new cache in a temporary directory.
+        """
+        super().setUp()
+        self.directory = Path(self.temporary_directory())
+        self.cache = MetainfoCache(self.directory)
+        self.tdef = TorrentDef.load_from_memory(TORRENT_WITH_DIRS_CONTENT)
+
+    def test_get_unknown(self) -> None:
+        """
+        Test if nothing is returned for an infohash that is not cached.
+        """
+        self.assertIsNone(self.cache.get(b"a" * 20))
+
+    def test_put_get(self) -> None:
+        """
+        Test if stored metainfo can be loaded, also by a new cache in the same directory.
+        """
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+
+        torrent_info = MetainfoCache(self.directory).get(self.tdef.infohash)
+
+        self.assertEqual(self.tdef.torrent_info.name(), torrent_info.name())
+        self.assertEqual(self.tdef.torrent_info.total_size(), torrent_info.total_size())
+
+    def test_get_corrupt(self) -> None:
+        """
+        Test if metainfo that no longer matches its infohash is removed.
+        """
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+        path = self.cache.get_path(self.tdef.infohash)
+        path.write_bytes(path.read_bytes().replace(b"file1.txt", b"file0.txt"))
+
+        self.assertIsNone(self.cache.get(self.tdef.infohash))
+        self.assertFalse(path.exists())
+        self.assertEqual(0, self.cache.size)
+
+    def test_get_unreadable(self) -> None:
+        """
+        Test if metainfo that cannot be decoded is removed.
+        """
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+        path = self.cache.get_path(self.tdef.infohash)
+        path.write_bytes(path.read_bytes()[:-5])
+
+        self.assertIsNone(self.cache.get(self.tdef.infohash))
+        self.assertFalse(path.exists())
+
+    def test_get_no_torrent_info(self) -> None:
+        """
+        Test if metainfo that does not load into torrent info is removed.
+        """
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+        path = self.cache.get_path(self.tdef.infohash)
+
+        with patch("libtorrent.load_torrent_buffer", Mock(return_value=Mock(ti=None))):
+            self.assertIsNone(self.cache.get(self.tdef.infohash))
+        self.assertFalse(path.exists())
+
+    def test_evict_least_recently_used(self) -> None:
+        """
+        Test if the least recently used metainfo is removed when the cache is full.
+        """
+        other = TorrentDef.load_from_memory(TORRENT_WITH_VIDEO)
+        third_infohash = b"c" * 20
+        self.cache.max_size = len(self.tdef.torrent_info.info_section()) + len(other.torrent_info.info_section())
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+        self.cache.put(other.infohash, other.torrent_info)
+        self.cache.get(self.tdef.infohash)
+
+        self.cache.put(third_infohash, other.torrent_info)
+
+        self.assertFalse(self.cache.get_path(other.infohash).exists())
+        self.assertTrue(self.cache.get_path(self.tdef.infohash).exists())
+        self.assertTrue(self.cache.get_path(third_infohash).exists())
+
+    def test_load_entries_by_last_use(self) -> None:
+        """
+        Test if a new cache orders the cached files by their last use.
+        """
+        other = TorrentDef.load_from_memory(TORRENT_WITH_VIDEO)
+        self.cache.put(self.tdef.infohash, self.tdef.torrent_info)
+        self.cache.put(other.infohash, other.torrent_info)
+        os.utime(self.cache.get_path(other.infohash), (0, 0))
+
+        cache = MetainfoCache(self.directory)
+
+        self.assertEqual([other.infohash.hex() + ".info", self.tdef.infohash.hex() + ".info"],
+                         list(cache.get_entries()))
+        self.assertEqual(self.cache.size, cache.size)
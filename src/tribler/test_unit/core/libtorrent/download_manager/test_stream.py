@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from io import BytesIO
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, call
@@ -8,7 +9,13 @@ from ipv8.test.base import TestBase
 
 from tribler.core.libtorrent.download_manager.download import Download
 from tribler.core.libtorrent.download_manager.download_config import DownloadConfig
-from tribler.core.libtorrent.download_manager.stream import NoAvailableStreamError, Stream, StreamReader
+from tribler.core.libtorrent.download_manager.stream import (
+    MAX_CURSORS,
+    MIN_READ_AHEAD,
+    NoAvailableStreamError,
+    Stream,
+    StreamReader,
+)
 from tribler.core.libtorrent.torrentdef import TorrentDef
 from tribler.test_unit.core.libtorrent.mocks import TORRENT_WITH_DIRS_CONTENT
 from tribler.test_unit.mocks import MockTriblerConfigManager
@@ -40,16 +47,17 @@ class TestStreamChunk(TestBase):
         super().setUp()
 
         self.chunk = MockStreamReader(Mock(), 0)
-        self.chunk.stream.cursor_pieces = {0: []}
+        self.chunk.stream.cursor_pieces = {self.chunk: []}
+        self.chunk.stream.remove_cursor = lambda key: self.chunk.stream.cursor_pieces.pop(key, None)
 
     def create_mock_content(self, content: bytes, piece_length: int = 1) -> None:
         """
         Set the value of the stream to certain content.
         """
         content_end = len(content) // piece_length
-        self.chunk.stream.iter_pieces = lambda have, start_from: list(range(start_from, content_end))
+        self.chunk.stream.iter_pieces = lambda have, start_from, file_index: list(range(start_from, content_end))
         self.chunk.stream.wait_for_pieces = AsyncMock()
-        self.chunk.stream.byte_to_piece = lambda x: x // piece_length
+        self.chunk.stream.byte_to_piece = lambda x, file_index: x // piece_length
         self.chunk.stream.buffer_size = 1
         self.chunk.stream.piece_length = piece_length
         self.chunk.file = BytesIO()
@@ -131,6 +139,36 @@ class TestStreamChunk(TestBase):
 
         self.assertEqual(b"tent", streamed)
 
+    async def test_read_ahead_grow(self) -> None:
+        """
+        Test if the read-ahead window grows while pieces arrive in time, up to the buffer size.
+        """
+        self.create_mock_content(b"content", 1)
+        self.chunk.stream.buffer_size = 7
+        self.chunk.stream.pieces_complete = Mock(return_value=True)
+
+        async with self.chunk:
+            for _ in range(3):
+                await self.chunk.read()
+
+        self.assertEqual(7, self.chunk.read_ahead)
+        self.chunk.stream.wait_for_pieces.assert_not_called()
+
+    async def test_read_ahead_stall(self) -> None:
+        """
+        Test if the read-ahead window shrinks when a read has to wait for pieces.
+        """
+        self.create_mock_content(b"content", 1)
+        self.chunk.stream.buffer_size = 7
+        self.chunk.stream.pieces_complete = Mock(return_value=False)
+        self.chunk.read_ahead = 7
+
+        async with self.chunk:
+            await self.chunk.read()
+
+        self.assertEqual(MIN_READ_AHEAD, self.chunk.read_ahead)
+        self.chunk.stream.wait_for_pieces.assert_called_once()
+
 
 class TestStream(TestBase):
     """
@@ -298,6 +336,70 @@ class TestStream(TestBase):
 
         self.assertEqual(call([0, 1, 7, 6, 6, 1] + [0] * 6), download.handle.prioritize_pieces.call_args)
 
+    async def test_update_priorities_multiple_cursors(self) -> None:
+        """
+        Test if pieces get the priority of their nearest cursor when there are multiple readers.
+        """
+        download = self.create_mock_download(piece_size=1, pieces=[False] * 12)
+        stream = Stream(download)
+        stream.wait_for_pieces = AsyncMock()
+        await stream.enable(file_index=0, header_size=0, footer_size=0)
+        stream.cursor_pieces["a"] = [0, 1, 2]
+        stream.cursor_pieces["b"] = [2, 3]
+        stream.update_priorities()
+
+        self.assertEqual(call([7, 6, 7, 6, 1, 1] + [0] * 6), download.handle.prioritize_pieces.call_args)
+
+    async def test_update_priorities_changed(self) -> None:
+        """
+        Test if only the deadlines of pieces of which the nearest cursor changed are updated.
+        """
+        download = self.create_mock_download(piece_size=1, pieces=[False] * 12)
+        stream = Stream(download)
+        stream.wait_for_pieces = AsyncMock()
+        await stream.enable(file_index=0, header_size=0, footer_size=0)
+        stream.add_cursor("a")
+        stream.add_cursor("b")
+        stream.set_cursor("a", [0, 1])
+        stream.set_cursor("b", [3, 4])
+        download.handle.reset_mock()
+
+        stream.set_cursor("b", [4, 5])
+
+        self.assertEqual([call(4, 0, 0), call(5, 10, 0)],
+                         sorted(download.handle.set_piece_deadline.call_args_list))
+        self.assertEqual([call(3)], download.handle.reset_piece_deadline.call_args_list)
+
+    async def test_add_cursor_max(self) -> None:
+        """
+        Test if the oldest readers are stopped when too many readers are added.
+        """
+        stream = Stream(self.create_mock_download())
+        for i in range(MAX_CURSORS + 1):
+            stream.add_cursor(i)
+
+        self.assertEqual(list(range(1, MAX_CURSORS + 1)), list(stream.cursor_pieces))
+
+    async def test_remove_cursor_last(self) -> None:
+        """
+        Test if the priorities are reset when the last reader is removed.
+        """
+        download = self.create_mock_download(piece_size=1, pieces=[False] * 12)
+        stream = Stream(download)
+        stream.wait_for_pieces = AsyncMock()
+        await stream.enable(file_index=0, header_size=0, footer_size=0)
+        stream.add_cursor("a")
+        stream.add_cursor("b")
+        stream.set_cursor("a", [0, 1])
+        stream.set_cursor("b", [3, 4])
+
+        stream.remove_cursor("a")
+        remaining = download.handle.prioritize_pieces.call_args
+        stream.remove_cursor("b")
+
+        self.assertEqual(call([1, 1, 1, 7, 6, 1] + [0] * 6), remaining)
+        self.assertEqual(call([4] * 12), download.handle.prioritize_pieces.call_args)
+
     async def test_reset_priorities_default(self) -> None:
         """
         Test if streams can be reset to the default priority (4) for all pieces.
@@ -336,3 +438,26 @@ class TestStream(TestBase):
         stream.reset_priorities(pieces=[0], priority=6)
 
         self.assertEqual(call([6]), download.handle.prioritize_pieces.call_args)
+
+    async def test_wait_for_pieces_finished(self) -> None:
+        """
+        Test if waiting for pieces stops when the pieces finish, without waiting for a download state update.
+        """
+        download = self.create_mock_download(piece_size=1, pieces=[False] * 12)
+        stream = Stream(download)
+        stream.wait_for_pieces = AsyncMock()
+        await stream.enable(file_index=0, header_size=0, footer_size=0)
+        del stream.wait_for_pieces
+        download.stream = stream
+        waiter = asyncio.ensure_future(stream.wait_for_pieces([0, 1]))
+
+        await asyncio.sleep(0)
+        download.process_alert(Mock(piece_index=0), "piece_finished_alert")
+        await asyncio.sleep(0)
+        waiting = not waiter.done()
+        download.process_alert(Mock(piece_index=1), "piece_finished_alert")
+        async with asyncio.timeout(0.5):
+            await waiter
+
+        self.assertTrue(waiting)
+        self.dlmngr.set_piece_progress.assert_called_with(download.tdef.infohash, True)
@@ -291,6 +291,57 @@ class TestDownloadsEndpoint(TestBase):
         self.assertNotIn("pieces", response_body_json["downloads"][0])
         self.assertNotIn("availability", response_body_json["downloads"][0])
 
+    async def test_get_downloads_snapshot_unchanged(self) -> None:
+        """
+        Test if the information of a download is not gathered again if the download did not change.
+        """
+        download = self.create_mock_download()
+        download.get_num_connected_seeds_peers = Mock(return_value=(1, 2))
+        self.set_loaded_downloads([download])
+
+        await self.endpoint.get_downloads(MockRequest("/api/downloads", query={}))
+        await self.endpoint.get_downloads(MockRequest("/api/downloads", query={}))
+        unchanged_calls = download.get_num_connected_seeds_peers.call_count
+        download.mark_changed()
+        response = await self.endpoint.get_downloads(MockRequest("/api/downloads", query={}))
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(1, unchanged_calls)
+        self.assertEqual(2, download.get_num_connected_seeds_peers.call_count)
+        self.assertEqual(2, response_body_json["downloads"][0]["num_connected_peers"])
+
+    async def test_get_downloads_since(self) -> None:
+        """
+        Test if only the downloads that changed after the given version are returned, with all infohashes.
+        """
+        download1 = self.create_mock_download()
+        download2 = Download(FakeTDef(info_hash=b"\x02" * 20), self.download_manager, download1.config.copy(),
+                             hidden=False, checkpoint_disabled=True)
+        self.set_loaded_downloads([download1, download2])
+        response = await self.endpoint.get_downloads(MockRequest("/api/downloads", query={}))
+        version = (await response_to_json(response))["version"]
+
+        download2.mark_changed()
+        response = await self.endpoint.get_downloads(MockRequest("/api/downloads", query={"since": str(version)}))
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(download2.version, version + 1)
+        self.assertEqual(["02" * 20], [info["infohash"] for info in response_body_json["downloads"]])
+        self.assertEqual(["01" * 20, "02" * 20], response_body_json["infohashes"])
+        self.assertEqual(download2.version, response_body_json["version"])
+
+    async def test_get_downloads_since_invalid(self) -> None:
+        """
+        Test if a graceful error is returned when the given version is not a number.
+        """
+        self.set_loaded_downloads([self.create_mock_download()])
+
+        response = await self.endpoint.get_downloads(MockRequest("/api/downloads", query={"since": "a"}))
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(HTTP_BAD_REQUEST, response.status)
+        self.assertEqual("since must be an integer", response_body_json["error"]["message"])
+
     async def test_add_download_no_uri(self) -> None:
         """
         Test if a graceful error is returned when no uri is given.
@@ -850,7 +901,7 @@ class TestDownloadsEndpoint(TestBase):
         download.stream.buffer_size = 0
         download.stream.enable = AsyncMock()
         download.stream.piece_length = 1
-        download.stream.byte_to_piece = lambda x: x + 1
+        download.stream.byte_to_piece = lambda x, file_index=None: x + 1
         download.lt_status = Mock(pieces=[True])
         download.tdef = TorrentDef.load_from_memory(TORRENT_WITH_VIDEO)
         self.download_manager.get_download = Mock(return_value=download)
@@ -122,3 +122,17 @@ class TestLibTorrentEndpoint(TestBase):
         self.assertEqual(200, response.status)
         self.assertEqual(0, response_body_json["hop"])
         self.assertEqual("test", response_body_json["session"]["test"])
+
+    async def test_get_alert_statistics(self) -> None:
+        """
+        Test if getting the alert statistics forwards the statistics of the download manager.
+        """
+        request = MockRequest("/api/libtorrent/alerts", query={})
+        self.download_manager.get_alert_statistics = Mock(return_value={
+            "state_update_alert": {"count": 1, "total_time": 0.5, "max_time": 0.5}
+        })
+        response = await self.endpoint.get_libtorrent_alert_statistics(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(200, response.status)
+        self.assertEqual(1, response_body_json["alerts"]["state_update_alert"]["count"])
@@ -427,7 +427,7 @@ class TestTorrentInfoEndpoint(TestBase):
         """
         Test if it is returned that an invalid certificate for an HTTPS request was used.
         """
-        async def server_response(_: str, valid_cert: bool = True) -> bytes:
+        async def server_response(_: str, valid_cert: bool = True, **kwargs) -> bytes:
             """
             Pretend that the request causes a certificate error in strict "valid_cert" mode.
             """
@@ -1,4 +1,6 @@
-from asyncio import Future, ensure_future, sleep
+from asyncio import CancelledError, Future, all_tasks, ensure_future, sleep
+from contextlib import suppress
+from unittest.mock import AsyncMock, Mock
 
 from aiohttp.abc import AbstractStreamWriter
 from ipv8.test.base import TestBase
@@ -6,7 +8,7 @@ from ipv8.test.REST.rest_base import MockRequest
 from multidict import CIMultiDict
 
 from tribler.core.notifier import Notification, Notifier
-from tribler.core.restapi.events_endpoint import EventsEndpoint
+from tribler.core.restapi.events_endpoint import EventsEndpoint, EventSubscriber
 
 
 class GetEventsRequest(MockRequest):
@@ -14,13 +16,13 @@ class GetEventsRequest(MockRequest):
     A MockRequest that mimics GetEventsRequests.
     """
 
-    def __init__(self, endpoint: EventsEndpoint, count: int = 1) -> None:
+    def __init__(self, endpoint: EventsEndpoint, count: int = 1, query: dict | None = None) -> None:
         """
         Create a new GetEventsRequest.
         """
         self.payload_writer = MockStreamWriter(endpoint, count=count)
         self._handler_waiter = Future()
-        super().__init__("/api/events", payload_writer=self.payload_writer)
+        super().__init__("/api/events", query=query, payload_writer=self.payload_writer)
 
     def shutdown(self) -> None:
         """
@@ -241,3 +243,113 @@ class TestEventsEndpoint(TestBase):
         request.finish_handler()  # 3. aiohttp behavior: finish the request handling
 
         self.assertEqual(200, response.status)
+
+    async def test_send_events_batched(self) -> None:
+        """
+        Test if events that are sent shortly after each other are written together.
+        """
+        request = GetEventsRequest(self.endpoint, count=2)
+
+        response_future = ensure_future(self.endpoint.get_events(request))
+        await sleep(0)
+        self.endpoint.send_event({"topic": "message", "kwargs": {"key": "value1"}})
+        self.endpoint.send_event({"topic": "message", "kwargs": {"key": "value2"}})
+        response = await response_future
+
+        self.assertEqual(200, response.status)
+        self.assertEqual((b'event: message\n'
+                          b'data: {"key": "value1"}'
+                          b'\n\n'
+                          b'event: message\n'
+                          b'data: {"key": "value2"}'
+                          b'\n\n'), request.payload_writer.captured[1])
+
+    async def test_send_event_topics(self) -> None:
+        """
+        Test if only the events of the requested topics are sent.
+        """
+        request = GetEventsRequest(self.endpoint, count=2, query={"topics": "tribler_new_version"})
+
+        response_future = ensure_future(self.endpoint.get_events(request))
+        await sleep(0)
+        self.endpoint.on_notification(Notification.tunnel_removed, circuit_id=1, bytes_up=0, bytes_down=0,
+                                      uptime=0, additional_info="")
+        self.endpoint.on_notification(Notification.tribler_new_version, version="super cool version")
+        response = await response_future
+
+        self.assertEqual(200, response.status)
+        self.assertEqual((b'event: tribler_new_version\n'
+                          b'data: {"version": "super cool version"}'
+                          b'\n\n'), request.payload_writer.captured[1])
+
+
+    async def test_write_messages_flush_on_shutdown(self) -> None:
+        """
+        Test if the waiting messages are written when shutting down.
+        """
+        subscriber = EventSubscriber()
+        subscriber.put("message", None, b"waiting")
+        response = Mock(write=AsyncMock())
+        self.endpoint.shutdown_event.set()
+
+        await self.endpoint.write_messages(response, subscriber)
+
+        response.write.assert_awaited_once_with(b"waiting")
+
+    async def test_write_messages_cancelled(self) -> None:
+        """
+        Test if no tasks are left behind when writing messages is cancelled.
+        """
+        tasks = all_tasks()
+        task = ensure_future(self.endpoint.write_messages(Mock(), EventSubscriber()))
+        await sleep(0)
+
+        task.cancel()
+        with suppress(CancelledError):
+            await task
+        await sleep(0)
+
+        self.assertEqual(tasks, all_tasks())
+
+
+class TestEventSubscriber(TestBase):
+    """
+    Tests for the EventSubscriber class.
+    """
+
+    def test_put_filtered(self) -> None:
+        """
+        Test if messages of other topics are not buffered.
+        """
+        subscriber = EventSubscriber({"a"})
+
+        subscriber.put("b", None, b"message")
+
+        self.assertEqual(b"", subscriber.take())
+        self.assertFalse(subscriber.ready.is_set())
+
+    def test_put_coalesced(self) -> None:
+        """
+        Test if a waiting message is replaced by a newer message with the same key, which is sent last.
+        """
+        subscriber = EventSubscriber()
+
+        subscriber.put("a", ("a", "1"), b"old")
+        subscriber.put("b", None, b"other")
+        subscriber.put("a", ("a", "1"), b"new")
+
+        self.assertTrue(subscriber.ready.is_set())
+        self.assertEqual(b"othernew", subscriber.take())
+        self.assertFalse(subscriber.ready.is_set())
+
+    def test_put_full(self) -> None:
+        """
+        Test if the oldest messages are dropped when the buffer is full.
+        """
+        subscriber = EventSubscriber(max_size=2)
+
+        for message in (b"1", b"2", b"3"):
+            subscriber.put("a", None, message)
+
+        self.assertEqual(1, subscriber.dropped)
+        self.assertEqual(b"23", subscriber.take())
@@ -3,6 +3,7 @@ from unittest.mock import Mock
 from ipv8.test.base import TestBase
 from ipv8.test.REST.rest_base import MockRequest, response_to_json
 
+from tribler.core.notifier import Notification, Notifier
 from tribler.core.restapi.statistics_endpoint import StatisticsEndpoint
 
 
@@ -31,6 +32,7 @@ class TestStatisticsEndpoint(TestBase):
         endpoint = StatisticsEndpoint()
         endpoint.session = Mock(download_manager=None)
         endpoint.session.mds = Mock(get_db_file_size=Mock(return_value=42), get_num_torrents=Mock(return_value=7))
+        endpoint.session.mds.search_cache.get_statistics = Mock(return_value={"hits": 3, "misses": 2, "size": 1})
         endpoint.session.socks_servers = []
         endpoint.session.rust_endpoint = Mock(get_socks5_statistics=Mock(return_value=[]))
         request = MockRequest("/api/statistics/tribler")
@@ -40,6 +42,7 @@ class TestStatisticsEndpoint(TestBase):
 
         self.assertEqual(42, response_body_json["tribler_statistics"]["db_size"])
         self.assertEqual(7, response_body_json["tribler_statistics"]["num_torrents"])
+        self.assertEqual({"hits": 3, "misses": 2, "size": 1}, response_body_json["tribler_statistics"]["search_cache"])
 
     async def test_get_ipv8_stats_no_ipv8(self) -> None:
         """
@@ -66,3 +69,82 @@ class TestStatisticsEndpoint(TestBase):
 
         self.assertEqual(42, response_body_json["ipv8_statistics"]["total_down"])
         self.assertEqual(7, response_body_json["ipv8_statistics"]["total_up"])
+
+    async def test_get_query_stats_no_mds(self) -> None:
+        """
+        Test if getting query stats without a MetadataStore gives disabled query statistics.
+        """
+        endpoint = StatisticsEndpoint()
+        request = MockRequest("/api/statistics/queries")
+
+        response = endpoint.get_query_stats(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual({"enabled": False, "queries": []}, response_body_json["query_statistics"])
+
+    async def test_get_query_stats_with_mds(self) -> None:
+        """
+        Test if getting query stats forwards the limited query profiler statistics.
+        """
+        endpoint = StatisticsEndpoint()
+        endpoint.session = Mock()
+        endpoint.session.mds.query_profiler = Mock(enabled=True, get_statistics=Mock(return_value=[{"shape": "a"}]))
+        request = MockRequest("/api/statistics/queries", query={"limit": "1"})
+
+        response = endpoint.get_query_stats(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertTrue(response_body_json["query_statistics"]["enabled"])
+        self.assertEqual([{"shape": "a"}], response_body_json["query_statistics"]["queries"])
+        endpoint.session.mds.query_profiler.get_statistics.assert_called_once_with(1)
+
+    async def test_get_query_stats_invalid_limit(self) -> None:
+        """
+        Test if getting query stats with a limit that is not an integer gives a bad request.
+        """
+        endpoint = StatisticsEndpoint()
+        request = MockRequest("/api/statistics/queries", query={"limit": "a"})
+
+        response = endpoint.get_query_stats(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(400, response.status)
+        self.assertEqual("limit must be a non-negative integer", response_body_json["error"]["message"])
+
+    async def test_get_query_stats_negative_limit(self) -> None:
+        """
+        Test if getting query stats with a negative limit gives a bad request.
+        """
+        endpoint = StatisticsEndpoint()
+        request = MockRequest("/api/statistics/queries", query={"limit": "-1"})
+
+        response = endpoint.get_query_stats(request)
+
+        self.assertEqual(400, response.status)
+
+    async def test_get_notification_stats_no_session(self) -> None:
+        """
+        Test if getting notification stats without a session gives empty notification statistics.
+        """
+        endpoint = StatisticsEndpoint()
+        request = MockRequest("/api/statistics/notifications")
+
+        response = endpoint.get_notification_stats(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual({}, response_body_json["notification_statistics"])
+
+    async def test_get_notification_stats(self) -> None:
+        """
+        Test if getting notification stats forwards the statistics of the notifier.
+        """
+        endpoint = StatisticsEndpoint()
+        endpoint.session = Mock(notifier=Notifier())
+        endpoint.session.notifier.notify(Notification.tribler_new_version, version="test")
+        request = MockRequest("/api/statistics/notifications")
+
+        response = endpoint.get_notification_stats(request)
+        response_body_json = await response_to_json(response)
+
+        self.assertEqual(["tribler_new_version"], list(response_body_json["notification_statistics"]))
+        self.assertEqual(1, response_body_json["notification_statistics"]["tribler_new_version"]["count"])
@@ -1,8 +1,10 @@
+from asyncio import sleep
+from threading import Thread
 from unittest.mock import Mock, call
 
 from ipv8.test.base import TestBase
 
-from tribler.core.notifier import Notification, Notifier
+from tribler.core.notifier import AsyncObserver, Notification, NotificationStats, Notifier
 
 
 class TestNotifier(TestBase):
@@ -86,3 +88,131 @@ class TestNotifier(TestBase):
 
         with self.assertRaises(TypeError):
             self.notifier.notify(Notification.tribler_new_version, version="test")
+
+    def test_notify_str(self) -> None:
+        """
+        Test if topics can be given by name.
+        """
+        callback = Mock()
+        self.notifier.add(Notification.tribler_new_version, callback)
+
+        self.notifier.notify("tribler_new_version", version="test")
+
+        self.assertEqual(call(version="test"), callback.call_args)
+
+    def test_notify_batch(self) -> None:
+        """
+        Test if observers and delegates are notified of every notification in a batch.
+        """
+        callback = Mock()
+        delegate = Mock()
+        self.notifier.add(Notification.tribler_new_version, callback)
+        self.notifier.delegates.add(delegate)
+
+        self.notifier.notify_batch(Notification.tribler_new_version, [{"version": "1"}, {"version": "2"}])
+
+        self.assertEqual([call(version="1"), call(version="2")], callback.call_args_list)
+        self.assertEqual([call(Notification.tribler_new_version, version="1"),
+                          call(Notification.tribler_new_version, version="2")], delegate.call_args_list)
+        self.assertEqual(2, self.notifier.stats[Notification.tribler_new_version].count)
+
+    def test_notify_batch_invalid(self) -> None:
+        """
+        Test if no notifications of a batch are sent if one of them has the wrong args.
+        """
+        callback = Mock()
+        self.notifier.add(Notification.tribler_new_version, callback)
+
+        with self.assertRaises(ValueError):
+            self.notifier.notify_batch(Notification.tribler_new_version, [{"version": "1"}, {"other": "2"}])
+
+        callback.assert_not_called()
+
+    async def test_add_asynchronous(self) -> None:
+        """
+        Test if asynchronous observers are called on the event loop, instead of by the notifying call.
+        """
+        callback = Mock()
+        self.notifier.add(Notification.tribler_new_version, callback, asynchronous=True)
+
+        self.notifier.notify(Notification.tribler_new_version, version="test")
+        callback.assert_not_called()
+        await sleep(0)
+
+        self.assertEqual(call(version="test"), callback.call_args)
+
+    async def test_add_asynchronous_coroutine(self) -> None:
+        """
+        Test if asynchronous observers can be coroutine functions, which are pending until they are finished.
+        """
+        received = []
+
+        async def callback(version: str) -> None:
+            await sleep(0)
+            received.append(version)
+
+        self.notifier.add(Notification.tribler_new_version, callback, asynchronous=True)
+        observer, = self.notifier.observers[Notification.tribler_new_version]
+
+        self.notifier.notify(Notification.tribler_new_version, version="test")
+        await sleep(0)
+        self.assertEqual(1, observer.pending)
+        self.assertEqual(1, len(observer.tasks))
+        await sleep(0.01)
+
+        self.assertEqual(["test"], received)
+        self.assertEqual(0, observer.pending)
+        self.assertEqual(set(), observer.tasks)
+
+    async def test_add_delegate_asynchronous_batch(self) -> None:
+        """
+        Test if asynchronous delegates receive the notifications of a batch on the event loop.
+        """
+        delegate = Mock()
+        self.notifier.add_delegate(delegate, asynchronous=True)
+
+        self.notifier.notify_batch(Notification.tribler_new_version, [{"version": "1"}, {"version": "2"}])
+        await sleep(0)
+
+        self.assertEqual([call(Notification.tribler_new_version, version="1"),
+                          call(Notification.tribler_new_version, version="2")], delegate.call_args_list)
+
+    async def test_asynchronous_full(self) -> None:
+        """
+        Test if notifications are dropped while too many notifications are undelivered.
+        """
+        callback = Mock()
+        observer = AsyncObserver(self.notifier, callback, self.loop, Notification.tribler_new_version, max_pending=2)
+
+        observer.schedule([((), {"version": str(i)}) for i in range(3)])
+        self.assertEqual(1, observer.dropped)
+        await sleep(0)
+
+        self.assertEqual([call(version="0"), call(version="1")], callback.call_args_list)
+        self.assertEqual(0, observer.pending)
+        self.assertEqual(0, observer.dropped)
+
+    def test_get_stats(self) -> None:
+        """
+        Test if the number of notifications per topic is reported.
+        """
+        self.notifier.notify(Notification.tribler_new_version, version="test")
+
+        stats = self.notifier.get_stats()
+
+        self.assertEqual(1, stats["tribler_new_version"]["count"])
+        self.assertLess(0, stats["tribler_new_version"]["rate"])
+
+    def test_record_stats_threads(self) -> None:
+        """
+        Test if notifications that are recorded concurrently by multiple threads are all counted.
+        """
+        stats = NotificationStats()
+        threads = [Thread(target=lambda: [stats.record(1, 0.0) for _ in range(1000)]) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4000, stats.count)
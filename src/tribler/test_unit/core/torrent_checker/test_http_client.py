@@ -0,0 +1,84 @@
+from ipv8.test.base import TestBase
+
+from tribler.core.socks5.aiohttp_connector import Socks5Connector
+from tribler.core.torrent_checker.http_client import HttpClientPool
+from tribler.core.torrent_checker.torrentchecker_session import HttpTrackerSession
+
+
+class TestHttpClientPool(TestBase):
+    """
+    Tests for the HttpClientPool class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new pool.
+        """
+        super().setUp()
+        self.pool = HttpClientPool()
+
+    async def tearDown(self) -> None:
+        """
+        Close the pool.
+        """
+        await self.pool.close()
+        await super().tearDown()
+
+    async def test_get_session_shared(self) -> None:
+        """
+        Test if the same client is returned for the same proxy configuration.
+        """
+        self.assertIs(self.pool.get_session(), self.pool.get_session())
+
+    async def test_get_session_per_proxy(self) -> None:
+        """
+        Test if different proxy configurations get different clients, with a Socks5 connector if proxied.
+        """
+        direct = self.pool.get_session()
+        proxied = self.pool.get_session(("127.0.0.1", 1080))
+
+        self.assertIsNot(direct, proxied)
+        self.assertNotIsInstance(direct.connector, Socks5Connector)
+        self.assertIsInstance(proxied.connector, Socks5Connector)
+        self.assertEqual(self.pool.limit_per_host, proxied.connector.limit_per_host)
+
+    async def test_get_session_closed(self) -> None:
+        """
+        Test if a new client is created if the previous client was closed.
+        """
+        session = self.pool.get_session()
+        await session.close()
+
+        self.assertIsNot(session, self.pool.get_session())
+
+    async def test_close(self) -> None:
+        """
+        Test if closing the pool closes all of its clients.
+        """
+        session = self.pool.get_session()
+
+        await self.pool.close()
+
+        self.assertTrue(session.closed)
+        self.assertEqual({}, self.pool.sessions)
+
+    async def test_get_session_after_close(self) -> None:
+        """
+        Test if no new clients are created after the pool is closed.
+        """
+        await self.pool.close()
+
+        self.assertIsNone(self.pool.get_session())
+        self.assertEqual({}, self.pool.sessions)
+
+    async def test_tracker_session_shared_client(self) -> None:
+        """
+        Test if a tracker session does not close a shared client when it is cleaned up.
+        """
+        tracker_session = HttpTrackerSession("localhost", ("localhost", 8475), "/announce", 5, None,
+                                             self.pool.get_session())
+
+        await tracker_session.cleanup()
+
+        self.assertFalse(self.pool.get_session().closed)
+        self.assertIs(tracker_session.session, self.pool.get_session())
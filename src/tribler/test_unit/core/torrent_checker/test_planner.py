@@ -0,0 +1,103 @@
+from ipv8.test.base import TestBase
+
+from tribler.core.torrent_checker.healthdataclasses import HEALTH_FRESHNESS_SECONDS
+from tribler.core.torrent_checker.planner import TRACKER_CHECK_INTERVAL, HealthCheckPlanner
+
+
+class TestHealthCheckPlanner(TestBase):
+    """
+    Tests for the HealthCheckPlanner class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new planner.
+        """
+        super().setUp()
+        self.planner = HealthCheckPlanner(min_interval=900, max_torrents=3)
+
+    def test_torrent_due_popular(self) -> None:
+        """
+        Test if popular torrents are due sooner, but not before the minimum interval.
+        """
+        self.assertEqual(HEALTH_FRESHNESS_SECONDS, self.planner.get_torrent_due(0, 0))
+        self.assertLess(self.planner.get_torrent_due(100, 0), self.planner.get_torrent_due(10, 0))
+        self.assertEqual(900, self.planner.get_torrent_due(10 ** 9, 0))
+
+    def test_tracker_due_backoff(self) -> None:
+        """
+        Test if trackers are due later for every failure.
+        """
+        self.assertEqual(TRACKER_CHECK_INTERVAL, self.planner.get_tracker_due(0, 0))
+        self.assertEqual(4 * TRACKER_CHECK_INTERVAL, self.planner.get_tracker_due(0, 2))
+
+    def test_pop_due_order(self) -> None:
+        """
+        Test if the most overdue torrents and trackers are popped first.
+        """
+        self.planner.schedule_torrent(b"a" * 20, 0, 100)
+        self.planner.schedule_tracker("http://tracker/announce", 0, 0)
+        self.planner.schedule_torrent(b"b" * 20, 0, 0)
+
+        now = 10 ** 6
+        popped = [self.planner.pop_due(now), self.planner.pop_due(now), self.planner.pop_due(now)]
+
+        self.assertEqual(["http://tracker/announce", b"b" * 20, b"a" * 20], popped)
+        self.assertIsNone(self.planner.pop_due(now))
+        self.assertEqual(0, len(self.planner))
+
+    def test_pop_due_not_due(self) -> None:
+        """
+        Test if nothing is popped before it is due.
+        """
+        self.planner.schedule_torrent(b"a" * 20, 0, 0)
+
+        self.assertIsNone(self.planner.pop_due(HEALTH_FRESHNESS_SECONDS - 1))
+        self.assertEqual(b"a" * 20, self.planner.pop_due(HEALTH_FRESHNESS_SECONDS))
+
+    def test_reschedule(self) -> None:
+        """
+        Test if a rescheduled torrent is only popped at its new due time.
+        """
+        self.planner.schedule_torrent(b"a" * 20, 0, 0)
+        self.planner.schedule_torrent(b"a" * 20, 0, 1000)
+
+        self.assertIsNone(self.planner.pop_due(HEALTH_FRESHNESS_SECONDS))
+        self.assertEqual(b"a" * 20, self.planner.pop_due(HEALTH_FRESHNESS_SECONDS + 1000))
+        self.assertIsNone(self.planner.pop_due(HEALTH_FRESHNESS_SECONDS + 1000))
+
+    def test_max_torrents(self) -> None:
+        """
+        Test if new torrents are not planned when the planner is full, while planned torrents can be rescheduled.
+        """
+        for i in range(3):
+            self.planner.schedule_torrent(bytes([i]) * 20, 0, 0)
+
+        added = self.planner.schedule_torrent(b"\xff" * 20, 0, 0)
+        rescheduled = self.planner.schedule_torrent(b"\x00" * 20, 0, 0)
+
+        self.assertFalse(added)
+        self.assertTrue(rescheduled)
+        self.assertEqual(3, len(self.planner))
+
+    def test_clear_torrents(self) -> None:
+        """
+        Test if clearing the torrents keeps the trackers planned.
+        """
+        self.planner.schedule_torrent(b"a" * 20, 0, 0)
+        self.planner.schedule_tracker("http://tracker/announce", 0, 0)
+
+        self.planner.clear_torrents()
+
+        self.assertEqual(0, self.planner.num_torrents)
+        self.assertEqual(["http://tracker/announce"], list(self.planner.due))
+
+    def test_compact_heap(self) -> None:
+        """
+        Test if outdated heap items do not pile up when a torrent is rescheduled often.
+        """
+        for i in range(5000):
+            self.planner.schedule_torrent(b"a" * 20, 0, i)
+
+        self.assertLess(len(self.planner.heap), 2000)
+        self.assertEqual(b"a" * 20, self.planner.pop_due(10 ** 6))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from asyncio import ensure_future, gather, sleep, wait_for
+from unittest.mock import AsyncMock, Mock
+
+from ipv8.test.base import TestBase
+
+from tribler.core.torrent_checker.healthdataclasses import TrackerResponse
+from tribler.core.torrent_checker.scrape_scheduler import ScrapeScheduler
+from tribler.core.torrent_checker.torrentchecker_session import MAX_INFOHASHES_IN_SCRAPE
+
+
+class TestScrapeScheduler(TestBase):
+    """
+    Tests for the ScrapeScheduler class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Create a new scheduler that creates mocked sessions.
+        """
+        super().setUp()
+        self.sessions = []
+        self.scheduler = ScrapeScheduler(self.create_session, self.get_response, window=0.01)
+
+    async def tearDown(self) -> None:
+        """
+        Shut down the scheduler.
+        """
+        await self.scheduler.shutdown()
+        await super().tearDown()
+
+    def create_session(self, tracker_url: str, timeout: float) -> Mock:
+        """
+        Create a mocked session that remembers its infohashes.
+        """
+        session = Mock(tracker_url=tracker_url, timeout=timeout, infohash_list=[])
+        session.add_infohash = session.infohash_list.append
+        self.sessions.append(session)
+        return session
+
+    async def get_response(self, session: Mock) -> TrackerResponse:
+        """
+        Get an empty response from the given mocked session.
+        """
+        return TrackerResponse(url=session.tracker_url, torrent_health_list=[])
+
+    async def test_scrape_batched(self) -> None:
+        """
+        Test if infohashes for the same tracker are scraped in a single session.
+        """
+        responses = await gather(self.scheduler.scrape("http://tracker/announce", b"\x01" * 20, timeout=10),
+                                 self.scheduler.scrape("http://tracker/announce", b"\x02" * 20, timeout=20),
+                                 self.scheduler.scrape("http://tracker/announce", b"\x01" * 20, timeout=10))
+
+        self.assertEqual(1, len(self.sessions))
+        self.assertEqual([b"\x01" * 20, b"\x02" * 20], self.sessions[0].infohash_list)
+        self.assertEqual(20, self.sessions[0].timeout)
+        self.assertEqual(1, len({id(response) for response in responses}))
+
+    async def test_scrape_per_tracker(self) -> None:
+        """
+        Test if infohashes for different trackers are scraped in different sessions.
+        """
+        await gather(self.scheduler.scrape("http://tracker1/announce", b"\x01" * 20),
+                     self.scheduler.scrape("http://tracker2/announce", b"\x01" * 20))
+
+        self.assertEqual({"http://tracker1/announce", "http://tracker2/announce"},
+                         {session.tracker_url for session in self.sessions})
+
+    async def test_scrape_full_batch(self) -> None:
+        """
+        Test if a batch is scraped as soon as it is full, without waiting for the coalescing window.
+        """
+        self.scheduler.window = 10
+
+        await gather(*[self.scheduler.scrape("http://tracker/announce", i.to_bytes(20, "big"))
+                       for i in range(MAX_INFOHASHES_IN_SCRAPE)])
+
+        self.assertEqual({}, self.scheduler.pending)
+        self.assertEqual(1, len(self.sessions))
+        self.assertEqual(MAX_INFOHASHES_IN_SCRAPE, len(self.sessions[0].infohash_list))
+
+    async def test_scrape_now(self) -> None:
+        """
+        Test if a batch is scraped immediately when requested, without waiting for the coalescing window.
+        """
+        self.scheduler.window = 10
+
+        await wait_for(self.scheduler.scrape("http://tracker/announce", b"\x01" * 20, now=True), timeout=1)
+
+        self.assertEqual({}, self.scheduler.pending)
+        self.assertEqual(1, len(self.sessions))
+
+    async def test_scrape_shutdown(self) -> None:
+        """
+        Test if a pending scrape fails with a normal exception when the scheduler shuts down.
+        """
+        scrape = ensure_future(self.scheduler.scrape("http://tracker/announce", b"\x01" * 20))
+        await sleep(0)
+
+        await self.scheduler.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            await scrape
+
+    async def test_scrape_after_shutdown(self) -> None:
+        """
+        Test if scraping after the scheduler shut down fails immediately.
+        """
+        await self.scheduler.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            await self.scheduler.scrape("http://tracker/announce", b"\x01" * 20)
+
+    async def test_scrape_failure(self) -> None:
+        """
+        Test if a failed scrape is raised to every caller.
+        """
+        self.scheduler.get_response = AsyncMock(side_effect=ValueError("Tracker failed"))
+
+        responses = await gather(self.scheduler.scrape("http://tracker/announce", b"\x01" * 20),
+                                 self.scheduler.scrape("http://tracker/announce", b"\x02" * 20),
+                                 return_exceptions=True)
+
+        self.assertTrue(all(isinstance(response, ValueError) for response in responses))
+
+    async def test_scrape_no_session(self) -> None:
+        """
+        Test if a scrape fails if no session can be created.
+        """
+        self.scheduler.create_session = Mock(return_value=None)
+
+        with self.assertRaises(ValueError):
+            await self.scheduler.scrape("http://tracker/announce", b"\x01" * 20)
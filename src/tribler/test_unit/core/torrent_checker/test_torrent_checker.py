@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import random
 import secrets
 import time
@@ -18,7 +19,7 @@ from tribler.core.torrent_checker.healthdataclasses import (
     TrackerResponse,
 )
 from tribler.core.torrent_checker.torrent_checker import (
-    TORRENT_SELECTION_POOL_SIZE,
+    MIN_TORRENT_CHECK_INTERVAL,
     TorrentChecker,
     aggregate_responses_for_infohash,
 )
@@ -122,6 +123,56 @@ class TestTorrentChecker(TestBase):
         self.assertEqual(5, result.seeders)
         self.assertEqual(10, result.leechers)
 
+    async def test_health_check_shared_scrape(self) -> None:
+        """
+        Test if concurrent health checks of torrents on the same tracker share a single scrape.
+        """
+        tracker, = self.torrent_checker.mds.TrackerState.instances = [MockTrackerState(url="http://localhost/tracker")]
+        self.torrent_checker.mds.TorrentState.instances = [
+            MockTorrentState(infohash=bytes([i]) * 20, trackers={tracker}) for i in range(2)
+        ]
+        self.torrent_checker.scrape_scheduler.window = 0.01
+        session = Mock(infohash_list=[])
+        session.add_infohash = session.infohash_list.append
+        self.torrent_checker.scrape_scheduler.create_session = Mock(return_value=session)
+        self.torrent_checker.scrape_scheduler.get_response = AsyncMock(return_value=TrackerResponse(
+            url="http://localhost/tracker",
+            torrent_health_list=[HealthInfo(bytes([i]) * 20, seeders=i + 1, leechers=0) for i in range(2)]
+        ))
+
+        results = await asyncio.gather(self.torrent_checker.check_torrent_health(b"\x00" * 20),
+                                       self.torrent_checker.check_torrent_health(b"\x01" * 20))
+
+        self.torrent_checker.scrape_scheduler.create_session.assert_called_once()
+        self.assertEqual([b"\x00" * 20, b"\x01" * 20], session.infohash_list)
+        self.assertEqual([1, 2], [result.seeders for result in results])
+
+    async def test_health_check_shutdown(self) -> None:
+        """
+        Test if a health check that is waiting for a scrape still gives a health when the checker shuts down.
+        """
+        tracker, = self.torrent_checker.mds.TrackerState.instances = [MockTrackerState(url="http://localhost/tracker")]
+        self.torrent_checker.mds.TorrentState.instances = [MockTorrentState(infohash=b"a" * 20, trackers={tracker})]
+
+        check = asyncio.ensure_future(self.torrent_checker.check_torrent_health(b"a" * 20))
+        await asyncio.sleep(0)
+        await self.torrent_checker.shutdown()
+        result = await check
+
+        self.assertEqual(0, result.seeders)
+
+    async def test_health_check_after_shutdown(self) -> None:
+        """
+        Test if a health check that starts while the checker shuts down does not wait for a scrape.
+        """
+        tracker, = self.torrent_checker.mds.TrackerState.instances = [MockTrackerState(url="http://localhost/tracker")]
+        self.torrent_checker.mds.TorrentState.instances = [MockTorrentState(infohash=b"a" * 20, trackers={tracker})]
+
+        result, _ = await asyncio.wait_for(asyncio.gather(self.torrent_checker.check_torrent_health(b"a" * 20),
+                                                          self.torrent_checker.shutdown()), timeout=5)
+
+        self.assertEqual(0, result.seeders)
+
     def test_load_torrents_check_from_db_no_self_checked(self) -> None:
         """
         Test if the torrents_checked only considers self-checked torrents.
@@ -161,23 +212,25 @@ class TestTorrentChecker(TestBase):
 
         self.assertEqual(10, len(self.torrent_checker.torrents_checked))
 
-    async def test_task_select_no_tracker(self) -> None:
+    async def test_check_unknown_tracker(self) -> None:
         """
-        Test if we are not checking a random tracker when there are no trackers in the database.
+        Test if we are not checking a tracker that is not in the database.
         """
-        result = await self.torrent_checker.check_random_tracker()
+        result = await self.torrent_checker.check_tracker("http://localhost/tracker")
 
         self.assertIsNone(result)
+        self.assertEqual({}, self.torrent_checker.sessions)
 
-    async def test_check_random_tracker_shutdown(self) -> None:
+    async def test_check_planned_shutdown(self) -> None:
         """
-        Test if we are not performing a tracker check when we are shutting down.
+        Test if we are not starting planned checks when we are shutting down.
         """
+        self.torrent_checker.planner.schedule_tracker("http://localhost/tracker", 0, 0)
         await self.torrent_checker.shutdown()
 
-        result = await self.torrent_checker.check_random_tracker()
+        self.torrent_checker.check_planned()
 
-        self.assertIsNone(result)
+        self.assertEqual([], self.torrent_checker.get_anonymous_tasks("Planned health check"))
 
     async def test_check_random_tracker_not_alive(self) -> None:
         """
@@ -205,7 +258,7 @@ class TestTorrentChecker(TestBase):
 
         with patch.dict(tribler.core.torrent_checker.torrent_checker.__dict__,
                         {"select": (lambda x: self.torrent_checker.mds.TorrentState.instances)}):
-            result = await self.torrent_checker.check_random_tracker()
+            result = await self.torrent_checker.check_tracker("http://localhost/tracker")
 
         self.assertIsNone(result)
         self.assertEqual(1, len(controlled_session.infohash_list))
@@ -224,7 +277,7 @@ class TestTorrentChecker(TestBase):
 
         with patch.dict(tribler.core.torrent_checker.torrent_checker.__dict__,
                         {"select": (lambda x: self.torrent_checker.mds.TorrentState.instances)}):
-            result = await self.torrent_checker.check_random_tracker()
+            result = await self.torrent_checker.check_tracker("http://localhost/tracker")
 
         self.assertIsNone(result)
         self.assertEqual({}, self.torrent_checker.sessions)
@@ -237,23 +290,10 @@ class TestTorrentChecker(TestBase):
 
         with patch.dict(tribler.core.torrent_checker.torrent_checker.__dict__,
                         {"select": (lambda x: self.torrent_checker.mds.TorrentState.instances)}):
-            result = await self.torrent_checker.check_random_tracker()
+            result = await self.torrent_checker.check_tracker("http://trackertest.com:80/announce")
 
         self.assertIsNone(result)
 
-    def test_get_valid_next_tracker_for_auto_check(self) -> None:
-        """
-        Test if only valid tracker url are used for auto check.
-        """
-        self.tracker_manager.TrackerState.instances = [
-            MockTrackerState("http://anno nce.torrentsmd.com:8080/announce"),
-            MockTrackerState("http://announce.torrentsmd.com:8080/announce"),
-        ]
-
-        next_tracker = self.torrent_checker.get_next_tracker()
-
-        self.assertEqual("http://announce.torrentsmd.com:8080/announce", next_tracker.url)
-
     def test_update_health(self) -> None:
         """
         Test if torrent health can be updated.
@@ -273,29 +313,108 @@ class TestTorrentChecker(TestBase):
         self.assertEqual(1, len(self.torrent_checker.torrents_checked))
         self.assertEqual(12, ts.leechers)
         self.assertEqual(13, ts.seeders)
+        self.assertIn(b"\xee" * 20, self.torrent_checker.planner)
+        self.torrent_checker.mds.search_cache.invalidate.assert_called_once()
 
-    async def test_check_local_torrents(self) -> None:
+    async def test_seed_planner(self) -> None:
         """
-        Test if the random torrent health checking mechanism picks the right torrents.
+        Test if the planner is seeded with the torrents and the live, valid trackers in the database.
         """
-        self.torrent_checker.mds.TorrentState.instances = [
-            MockTorrentState(bytes([i]) * 20, i, last_check=int(time.time()) if i < 20 else 0) for i in range(40)
-        ]
-        self.torrent_checker.mds.TorrentMetadata.instances = [
-            MockMiniTorrentMetadata(bytes([i]) * 20, f"torrent{i}", self.torrent_checker.mds.TorrentState.instances[i])
-            for i in range(40)
+        self.torrent_checker.mds.run_threaded = AsyncMock(side_effect=lambda func: func())
+        self.torrent_checker.mds.TorrentState.instances = [MockTorrentState(bytes([i]) * 20, i) for i in range(10)]
+        self.tracker_manager.TrackerState.instances = [
+            MockTrackerState("http://tracker.com:8080/announce"),
+            MockTrackerState("http://dead.com:8080/announce", alive=False),
+            MockTrackerState("http://inva lid.com:8080/announce"),
         ]
-        stale_infohashes = [bytes([i]) * 20 for i in range(20, 40)]
 
-        # 1. Popular torrents are in the front, and
-        # 2. Older torrents are towards the back
-        selection_range = (stale_infohashes[0:TORRENT_SELECTION_POOL_SIZE]
-                           + stale_infohashes[-TORRENT_SELECTION_POOL_SIZE:])
-        selected_torrents, _ = await self.torrent_checker.check_local_torrents()
+        await self.torrent_checker.seed_planner()
+
+        self.assertEqual(11, len(self.torrent_checker.planner))
+        self.assertIn("http://tracker.com:8080/announce", self.torrent_checker.planner)
+        self.torrent_checker.mds.run_threaded.assert_called_once_with(self.torrent_checker.load_planner_seed)
+
+    def test_load_planner_seed_invalid_tracker(self) -> None:
+        """
+        Test if trackers with an invalid URL are removed from the database when the planner seed is loaded.
+        """
+        MockTrackerState("http://tracker.com:8080/announce")
+        MockTrackerState("http://inva lid.com:8080/announce")
+
+        _, trackers = self.torrent_checker.load_planner_seed()
+
+        self.assertEqual([("http://tracker.com:8080/announce", 0, 0)], trackers)
+        self.assertEqual(["http://tracker.com:8080/announce"],
+                         [tracker.url for tracker in MockTrackerState.instances])
+
+    async def test_check_planned_torrent(self) -> None:
+        """
+        Test if a due torrent is checked and planned again.
+        """
+        self.torrent_checker.check_torrent_health = AsyncMock(return_value=HealthInfo(b"a" * 20, seeders=3))
+        self.torrent_checker.planner.schedule_torrent(b"a" * 20, 0, 0)
+
+        self.torrent_checker.check_planned()
+        await asyncio.gather(*self.torrent_checker.get_anonymous_tasks("Planned health check"))
+
+        self.torrent_checker.check_torrent_health.assert_called_with(b"a" * 20)
+        self.assertLessEqual(time.time() + MIN_TORRENT_CHECK_INTERVAL - 1, self.torrent_checker.planner.due[b"a" * 20])
+
+    async def test_check_planned_tracker(self) -> None:
+        """
+        Test if a due tracker is checked and planned again.
+        """
+        self.tracker_manager.TrackerState.instances = [MockTrackerState("http://tracker.com:8080/announce",
+                                                                        last_check=int(time.time()))]
+        self.torrent_checker.check_tracker = AsyncMock()
+        self.torrent_checker.planner.schedule_tracker("http://tracker.com:8080/announce", 0, 0)
+
+        self.torrent_checker.check_planned()
+        await asyncio.gather(*self.torrent_checker.get_anonymous_tasks("Planned health check"))
+
+        self.torrent_checker.check_tracker.assert_called_with("http://tracker.com:8080/announce")
+        self.assertLess(time.time(), self.torrent_checker.planner.due["http://tracker.com:8080/announce"])
+
+    async def test_initialize_checks_disabled(self) -> None:
+        """
+        Test if no planned checks are started if the number of checks per minute is zero.
+        """
+        self.torrent_checker.config.set("torrent_checker/checks_per_minute", 0)
+        self.torrent_checker.create_socket_or_schedule = AsyncMock()
+
+        await self.torrent_checker.initialize()
+
+        self.assertFalse(self.torrent_checker.is_pending_task_active("check planned"))
+        self.assertTrue(self.torrent_checker.is_pending_task_active("seed planner"))
+
+    def test_check_planned_nothing_due(self) -> None:
+        """
+        Test if no check is started if nothing is due.
+        """
+        self.torrent_checker.planner.schedule_torrent(b"a" * 20, 0, int(time.time()))
+
+        self.torrent_checker.check_planned()
+
+        self.assertEqual([], self.torrent_checker.get_anonymous_tasks("Planned health check"))
+
+    def test_plan_torrent_health_older(self) -> None:
+        """
+        Test if received health that is older than what we know does not make a planned check sooner.
+        """
+        self.torrent_checker.planner.schedule_torrent(b"a" * 20, 0, int(time.time()))
+        due = self.torrent_checker.planner.due[b"a" * 20]
+
+        self.torrent_checker.plan_torrent_health(HealthInfo(b"a" * 20, last_check=0))
+
+        self.assertEqual(due, self.torrent_checker.planner.due[b"a" * 20])
+
+    def test_plan_torrent_health_new(self) -> None:
+        """
+        Test if received health of an unplanned torrent is planned.
+        """
+        self.torrent_checker.plan_torrent_health(HealthInfo(b"a" * 20, last_check=0))
 
-        self.assertLessEqual(len(selected_torrents), TORRENT_SELECTION_POOL_SIZE)
-        for t in selected_torrents:
-            self.assertIn(t.infohash, selection_range)
+        self.assertIn(b"a" * 20, self.torrent_checker.planner)
 
     def test_update_torrent_health_invalid_health(self) -> None:
         """
@@ -8,7 +8,9 @@ from ipv8.util import succeed
 from libtorrent import bencode
 
 from tribler.core.torrent_checker.torrentchecker_session import (
+    TRACKER_ACTION_SCRAPE,
     HttpTrackerSession,
+    UdpConnectionIdCache,
     UdpSocketManager,
     UdpTrackerSession,
 )
@@ -27,6 +29,7 @@ class MockUdpSocketManager:
         """
         self.response = None
         self.tracker_sessions = {}
+        self.connection_ids = UdpConnectionIdCache()
 
     def send_request(self, data: bytes, tracker_session: UdpTrackerSession) -> Future:
         """
@@ -83,7 +86,7 @@ class TestTrackerSession(TestBase):
         """
         self.session = HttpTrackerSession("localhost", ("localhost", 8475), "/announce", 5, None)
 
-        def fake_request(_: str) -> None:
+        def fake_request(_: str, **kwargs) -> None:
             raise HTTPBadRequest
 
         with self.assertRaises(ValueError), patch.object(self.session.session, "get", fake_request):
@@ -364,3 +367,59 @@ class TestTrackerSession(TestBase):
 
         with self.assertRaises(ValueError):
             self.session.failed("\xd0")
+
+    async def test_udpsession_store_connection_id(self) -> None:
+        """
+        Test if the connection ID of a successful connect is cached for the tracker and proxy.
+        """
+        self.session = UdpTrackerSession("localhost", ("localhost", 4782), "/announce", 5, None,
+                                         self.fake_udp_socket_manager)
+        self.fake_udp_socket_manager.response = struct.pack("!iiq", 0, self.session.transaction_id, 2)
+
+        await self.session.connect()
+
+        self.assertEqual(2, self.fake_udp_socket_manager.connection_ids.get((("localhost", 4782), None)))
+
+    async def test_udpsession_reuse_connection_id(self) -> None:
+        """
+        Test if a cached connection ID is used without sending a connect request.
+        """
+        self.fake_udp_socket_manager.connection_ids.set((("localhost", 4782), None), 2)
+        self.fake_udp_socket_manager.send_request = Mock()
+        self.session = UdpTrackerSession("localhost", ("localhost", 4782), "/announce", 5, None,
+                                         self.fake_udp_socket_manager)
+
+        await self.session.connect()
+
+        self.fake_udp_socket_manager.send_request.assert_not_called()
+        self.assertEqual(2, self.session._connection_id)  # noqa: SLF001
+        self.assertEqual(TRACKER_ACTION_SCRAPE, self.session.action)
+
+    async def test_udpsession_failure_invalidates_connection_id(self) -> None:
+        """
+        Test if a failed session removes the cached connection ID of its tracker.
+        """
+        self.fake_udp_socket_manager.connection_ids.set((("localhost", 4782), None), 2)
+        self.session = UdpTrackerSession("localhost", ("localhost", 4782), "/announce", 5, None,
+                                         self.fake_udp_socket_manager)
+
+        with self.assertRaises(ValueError):
+            self.session.failed("Tracker error")
+
+        self.assertIsNone(self.fake_udp_socket_manager.connection_ids.get((("localhost", 4782), None)))
+
+    def test_connection_id_expired(self) -> None:
+        """
+        Test if connection IDs are no longer returned after their lifetime.
+        """
+        cache = UdpConnectionIdCache(lifetime=60)
+        with patch("time.time", return_value=100.0):
+            cache.set(("tracker", None), 2)
+        with patch("time.time", return_value=159.0):
+            valid = cache.get(("tracker", None))
+        with patch("time.time", return_value=160.0):
+            expired = cache.get(("tracker", None))
+
+        self.assertEqual(2, valid)
+        self.assertIsNone(expired)
+        self.assertEqual({}, cache.connection_ids)
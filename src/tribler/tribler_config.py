@@ -131,6 +131,11 @@ class DatabaseConfig(TypedDict):
     """
 
     enabled: bool
+    wal_mode: bool
+    read_pool_size: int
+    wal_checkpoint_interval: int
+    profile_queries: bool
+    signature_workers: int
 
 
 class VersioningConfig(TypedDict):
@@ -235,6 +240,7 @@ class TorrentCheckerConfig(TypedDict):
     """
 
     enabled: bool
+    checks_per_minute: int
 
 
 class TunnelCommunityConfig(TypedDict):
@@ -306,7 +312,8 @@ DEFAULT_CONFIG = {
     "statistics": False,
 
     "content_discovery_community": ContentDiscoveryCommunityConfig(enabled=True),
-    "database": DatabaseConfig(enabled=True),
+    "database": DatabaseConfig(enabled=True, wal_mode=False, read_pool_size=4, wal_checkpoint_interval=60,
+                               profile_queries=False, signature_workers=2),
     "dht_discovery": DHTDiscoveryCommunityConfig(enabled=True),
     "libtorrent": LibtorrentConfig(
         socks_listen_ports=[0, 0, 0, 0, 0],
@@ -359,7 +366,7 @@ DEFAULT_CONFIG = {
     "recommender": RecommenderConfig(enabled=True),
     "rendezvous": RendezvousConfig(enabled=True),
     "rss": RSSConfig(enabled=True, urls=[]),
-    "torrent_checker": TorrentCheckerConfig(enabled=True),
+    "torrent_checker": TorrentCheckerConfig(enabled=True, checks_per_minute=30),
     "tunnel_community": TunnelCommunityConfig(enabled=True, min_circuits=3, max_circuits=8),
     "versioning": VersioningConfig(enabled=True, allow_pre=False),
     "watch_folder": WatchFolderConfig(enabled=False, directory="", check_interval=10.0),
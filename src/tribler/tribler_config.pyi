@@ -48,6 +48,11 @@ class DatabaseConfig(TypedDict):
     """
 
     enabled: bool
+    wal_mode: bool
+    read_pool_size: int
+    wal_checkpoint_interval: int
+    profile_queries: bool
+    signature_workers: int
 
 class DownloadDefaultsConfig(TypedDict):
     """
@@ -184,6 +189,7 @@ class TorrentCheckerConfig(TypedDict):
     """
 
     enabled: bool
+    checks_per_minute: int
 
 class TriblerConfig(TypedDict):
     """
@@ -324,6 +330,16 @@ class TriblerConfigManager:
     @overload
     def set(self, option: Literal["database/enabled"], value: bool) -> None: ...
     @overload
+    def set(self, option: Literal["database/wal_mode"], value: bool) -> None: ...
+    @overload
+    def set(self, option: Literal["database/read_pool_size"], value: int) -> None: ...
+    @overload
+    def set(self, option: Literal["database/wal_checkpoint_interval"], value: int) -> None: ...
+    @overload
+    def set(self, option: Literal["database/profile_queries"], value: bool) -> None: ...
+    @overload
+    def set(self, option: Literal["database/signature_workers"], value: int) -> None: ...
+    @overload
     def set(self, option: Literal["libtorrent/socks_listen_ports"], value: list[int]) -> None: ...
     @overload
     def set(self, option: Literal["libtorrent/listen_interface"], value: str) -> None: ...
@@ -398,6 +414,8 @@ class TriblerConfigManager:
     @overload
     def set(self, option: Literal["torrent_checker/enabled"], value: bool) -> None: ...
     @overload
+    def set(self, option: Literal["torrent_checker/checks_per_minute"], value: int) -> None: ...
+    @overload
     def set(self, option: Literal["tunnel_community/enabled"], value: bool) -> None: ...
     @overload
     def set(self, option: Literal["tunnel_community/min_circuits"], value: int) -> None: ...
@@ -551,6 +569,16 @@ class TriblerConfigManager:
     @overload
     def get(self, option: Literal["database/enabled"]) -> bool: ...
     @overload
+    def get(self, option: Literal["database/wal_mode"]) -> bool: ...
+    @overload
+    def get(self, option: Literal["database/read_pool_size"]) -> int: ...
+    @overload
+    def get(self, option: Literal["database/wal_checkpoint_interval"]) -> int: ...
+    @overload
+    def get(self, option: Literal["database/profile_queries"]) -> bool: ...
+    @overload
+    def get(self, option: Literal["database/signature_workers"]) -> int: ...
+    @overload
     def get(self, option: Literal["libtorrent/socks_listen_ports"]) -> list[int]: ...
     @overload
     def get(self, option: Literal["libtorrent/listen_interface"]) -> str: ...
@@ -625,6 +653,8 @@ class TriblerConfigManager:
     @overload
     def get(self, option: Literal["torrent_checker/enabled"]) -> bool: ...
     @overload
+    def get(self, option: Literal["torrent_checker/checks_per_minute"]) -> int: ...
+    @overload
     def get(self, option: Literal["tunnel_community/enabled"]) -> bool: ...
     @overload
     def get(self, option: Literal["tunnel_community/min_circuits"]) -> int: ...
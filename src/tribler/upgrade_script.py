@@ -6,6 +6,9 @@ Checklist:
  - Have you changed ``FROM`` to the previous version?
  - Have you changed ``TO`` to the current version?
  - Have you changed ``upgrade()`` to perform the upgrade?
+
+Changes to the schema of the metadata database are not tied to releases: bump ``CURRENT_DB_VERSION`` (in the
+``MetadataStore``) and add the steps to ``upgrade_metadata_db()``.
 """
 from __future__ import annotations
 
@@ -23,6 +26,7 @@ from pony.orm import Database, OperationalError, db_session
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from tribler.core.database.store import MetadataStore
     from tribler.tribler_config import TriblerConfigManager
 
 FROM: str = "7.14"
@@ -197,6 +201,7 @@ def _inject_ChannelNode_inner(db: Database, batch: list) -> None:
                                   globals(), locals()))
         if not results:
             cursor = db.execute("INSERT INTO TorrentState "
+                                "(rowid, infohash, seeders, leechers, last_check, self_checked, has_data) "
                                 "VALUES ((SELECT COALESCE(MAX(rowid),0)+1 FROM TorrentState), "
                                 "$infohash, $seeders, $leechers, $last_check, $self_checked, $has_data)",
                                 globals(), locals())
@@ -204,12 +209,16 @@ def _inject_ChannelNode_inner(db: Database, batch: list) -> None:
         health_id, = results[0]
         tag_processor_version = tag_processor_version or 0  # noqa: PLW2901
 
-        # Insert channel ChannelNode
+        # Insert channel ChannelNode. The columns are named, as the current table also has the health columns.
+        # These are filled from the TorrentState by the channelnode_health_ai trigger.
         results = list(db.execute("SELECT rowid FROM ChannelNode WHERE public_key=$public_key AND id_=$id_",
                                   globals(), locals()))
         if not results:
             db.execute(
-                "INSERT INTO ChannelNode VALUES ((SELECT COALESCE(MAX(rowid),0)+1 FROM ChannelNode), "
+                "INSERT INTO ChannelNode (rowid, infohash, size, torrent_date, tracker_info, title, tags, "
+                "metadata_type, reserved_flags, origin_id, public_key, id_, timestamp, signature, added_on, status, "
+                "xxx, health, tag_processor_version) "
+                "VALUES ((SELECT COALESCE(MAX(rowid),0)+1 FROM ChannelNode), "
                 "$infohash, $size, $torrent_date, $tracker_info, $title, $tags, $metadata_type, "
                 "$reserved_flags, $origin_id, $public_key, $id_, $timestamp, $signature, $added_on, "
                 "$status, $xxx, $health_id, $tag_processor_version)",
@@ -366,6 +375,35 @@ def _inject_7_14_tables(src_db: str, dst_db: str) -> None:
     _inject_TorrentState_TrackerState(abs_src_db, abs_dst_db)
 
 
+sql_fill_channelnode_health_columns = """
+    UPDATE ChannelNode SET (health_seeders, health_leechers, health_last_check, health_rank) =
+        (SELECT coalesce(max(seeders), 0), coalesce(max(leechers), 0), coalesce(max(last_check), 0),
+                coalesce(max(rank), 0)
+         FROM TorrentStateHealth WHERE rowid = ChannelNode.health)
+    WHERE health IS NOT NULL;
+"""
+
+
+def _upgrade_metadata_db_16(mds: MetadataStore) -> None:
+    """
+    Add the health columns to the ChannelNode table and fill them from the TorrentState table.
+    """
+    mds.create_health_columns()
+    mds.db.get_connection().cursor().execute(sql_fill_channelnode_health_columns)
+    logger.info("Added health columns to ChannelNode")
+
+
+def upgrade_metadata_db(mds: MetadataStore) -> None:
+    """
+    Upgrade the schema of an existing metadata database to the current version, one version at a time.
+    """
+    with db_session(ddl=True):
+        version = int(mds.get_value("db_version") or 0)
+        if version < 16:
+            _upgrade_metadata_db_16(mds)
+            mds.set_value("db_version", "16")
+
+
 def upgrade(config: TriblerConfigManager, source: str, destination: str) -> None:
     """
     Perform the upgrade from the previous version to the next version.